@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+ROOT = Path(__file__).resolve().parent
+# Every stdio server in the repo, as (directory, script)
+SERVERS = [
+    ("server_client_communication", "mcp_server.py"),
+    ("multiple_servers/hard_coded", "greeting_mcp_server.py"),
+    ("multiple_servers/hard_coded", "math_server_dynamic.py"),
+    ("multiple_servers/dynamic", "greeting_mcp_server.py"),
+    ("multiple_servers/dynamic", "math_server_dynamic.py"),
+    ("multiple_servers/args_ile_dynamic/v1", "greeting_mcp_server.py"),
+    ("multiple_servers/args_ile_dynamic/v1", "math_server_dynamic.py"),
+    ("multiple_servers/args_ile_dynamic/v2", "greeting_mcp_server.py"),
+    ("multiple_servers/args_ile_dynamic/v2", "math_server_dynamic.py"),
+]
+# Startup is the median time from spawning the server to its initialize response.
+# Absolute times vary several-fold between machines, so every budget is a multiple
+# of the same median for a bare FastMCP server, timed in the same run. Most of
+# that is interpreter startup plus the SDK's own modules (mostly pydantic models
+# in mcp.types), which every server here pays for.
+REFERENCE_SERVER = "from mcp.server.fastmcp import FastMCP; FastMCP('reference').run()"
+# Plain servers only add their own tools and resources (measured: 1.00-1.03)
+PLAIN_BUDGET = 1.10
+# Servers that defer the mcp client side, httpx and jsonschema (v2/lazy_imports.py)
+# must start faster than the bare server they are built on
+BUDGETS = {
+    # measured: 0.91-0.93
+    ("multiple_servers/args_ile_dynamic/v2", "greeting_mcp_server.py"): 0.97,
+    # numpy (~100 ms) backs every v2 math tool, so it is loaded up front on purpose
+    # and spends what deferring saves (measured: 0.98-1.01)
+    ("multiple_servers/args_ile_dynamic/v2", "math_server_dynamic.py"): 1.05,
+}
+LAUNCHES = 7
+TOP_PACKAGES = 6
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def import_profile(directory: Path, script: str):
+    """
+    Imports the server module under -X importtime (module-level code runs, the
+    server does not start) and returns (import ms, modules loaded, self time per
+    top-level package in ms). importtime's own bookkeeping inflates the total.
+    """
+    module = script[:-len(".py")]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys; sys.path.insert(0, '.'); import {module}; print(len(sys.modules))"],
+        cwd=directory, capture_output=True, text=True, check=True,
+    )
+    # -X importtime prints a module after everything it imported, so the lines since the
+    # previous top-level entry (interpreter startup: site, encodings) are the server's subtree
+    total_us, packages, subtree = 0, {}, {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if not match:
+            continue
+        self_us, cumulative, indent, name = match.groups()
+        package = name.split(".")[0]
+        subtree[package] = subtree.get(package, 0) + int(self_us) / 1e3
+        if not indent:
+            if name == module:
+                total_us, packages = int(cumulative), subtree
+            subtree = {}
+    return total_us / 1e3, int(result.stdout.strip()), packages
+
+
+async def time_to_initialize(directory: Path, args: List[str], errlog) -> float:
+    server_params = StdioServerParameters(command=sys.executable, args=args, cwd=str(directory))
+    start = time.perf_counter()
+    async with stdio_client(server_params, errlog=errlog) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            elapsed = time.perf_counter() - start
+    return elapsed * 1e3
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Startup time of every stdio MCP server in the repo")
+    parser.add_argument("--launches", type=int, default=LAUNCHES, help="launches per server; the median is reported")
+    args = parser.parse_args()
+
+    servers = [(relative, script) for relative, script in SERVERS if (ROOT / relative / script).exists()]
+    samples = {server: [] for server in servers}
+    reference_samples = []
+    with open(os.devnull, "w") as errlog:
+        # Launches are interleaved across servers so machine-wide drift affects all of them alike
+        for _ in range(args.launches):
+            reference_samples.append(await time_to_initialize(ROOT, ["-c", REFERENCE_SERVER], errlog))
+            for relative, script in servers:
+                samples[(relative, script)].append(await time_to_initialize(ROOT / relative, [script], errlog))
+    reference = sorted(reference_samples)[args.launches // 2]
+
+    print(f"\nbare FastMCP server: {reference:.1f} ms to initialize")
+    print(f"\n{'server':>52} {'import (ms)':>12} {'modules':>8} {'initialize (ms)':>16} {'target (ms)':>12}")
+    print("-" * 100)
+    over = 0
+    profiles = []
+    for relative, script in servers:
+        import_ms, modules, packages = import_profile(ROOT / relative, script)
+        median = sorted(samples[(relative, script)])[args.launches // 2]
+        target = reference * BUDGETS.get((relative, script), PLAIN_BUDGET)
+        ok = median <= target
+        over += not ok
+        name = f"{relative}/{script}"
+        print(f"{name:>52} {import_ms:>12.1f} {modules:>8} {median:>16.1f} {target:>7.0f} {'ok' if ok else 'OVER':>4}")
+        profiles.append((name, packages))
+
+    print(f"\nimport self time by package (ms, top {TOP_PACKAGES}):")
+    for name, packages in profiles:
+        heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:TOP_PACKAGES]
+        print(f"  {name}: " + ", ".join(f"{package} {ms:.0f}" for package, ms in heaviest))
+    print(f"\n{len(profiles) - over}/{len(profiles)} servers within target")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -99,6 +99,12 @@ async def test_math_server():
             
             zero_mult = await session.read_resource("resource://multiplication/100,5,0")
             print(f"İstek: 100 × 5 × 0 -> {zero_mult.contents[0].text}")
+            
+            # 6. Büyük girdiler için özet modu
+            print("\n--- Özet modu test ediliyor ---")
+            many_numbers = ",".join(str(n) for n in range(1, 10001))
+            summary = await session.read_resource(f"resource://addition/summary/{many_numbers}")
+            print(f"İstek: 1 + 2 + ... + 10000 -> {summary.contents[0].text}")
 
 
 async def main():
@@ -1,4 +1,6 @@
 
+import json
+import math
 from mcp.server.fastmcp import FastMCP
 import operator
 from functools import reduce
@@ -6,6 +8,71 @@ from functools import reduce
 # FastMCP sunucu örneği oluştur
 mcp = FastMCP("math-server")
 
+# Özet modunda yanıta eklenecek en fazla sayı adedi
+SUMMARY_PREVIEW_COUNT = 5
+
+
+def _iter_numbers(numbers_str: str):
+    """
+    Virgülle ayrılmış sayıları ara liste oluşturmadan tek tek üretir.
+    Boş alanlar ve geçersiz sayılar için str.split ile aynı şekilde ValueError verir.
+    """
+    start = 0
+    while True:
+        end = numbers_str.find(',', start)
+        if end == -1:
+            yield float(numbers_str[start:])
+            return
+        yield float(numbers_str[start:end])
+        start = end + 1
+
+
+def _fold(numbers_str: str, op, preview_count: int = 0):
+    """
+    Sayıları tek geçişte işler; (adet, sonuç, ilk sayılar) üçlüsünü döner.
+    """
+    numbers = _iter_numbers(numbers_str)
+    result = next(numbers)
+    count = 1
+    preview = [result]
+    for value in numbers:
+        result = op(result, value)
+        count += 1
+        if count <= preview_count:
+            preview.append(value)
+    return count, result, preview[:preview_count]
+
+
+def _summarize(numbers_str: str, op, symbol: str, label: str) -> str:
+    """
+    Yalnızca adet, sonuç ve kısa bir önizleme döner;
+    yanıt boyutu girdinin uzunluğundan bağımsızdır.
+    """
+    count, result, preview = _fold(numbers_str, op, SUMMARY_PREVIEW_COUNT)
+    expression = f" {symbol} ".join(map(str, preview))
+    if count > SUMMARY_PREVIEW_COUNT:
+        expression += f" {symbol} ..."
+    return f"{label}: {count} sayı, sonuç = {result} (önizleme: {expression})"
+
+
+def _as_json(numbers_str: str, op, operation: str) -> str:
+    """
+    İstemcinin metin ayrıştırmasına gerek kalmaması için sonucu JSON olarak döner.
+    Geçersiz girdide sonuç yerine "error" alanı bulunur. Infinity ve NaN geçerli
+    JSON olmadığından sonlu olmayan sonuçta "result" null olur ve "error" eklenir.
+    """
+    try:
+        count, result, _ = _fold(numbers_str, op)
+    except (ValueError, TypeError):
+        return json.dumps(
+            {"operation": operation, "error": "Tüm parametreler geçerli sayılar olmalıdır."},
+            ensure_ascii=False,
+        )
+    payload = {"operation": operation, "operands": count, "result": result, "dtype": "float64"}
+    if not math.isfinite(result):
+        payload.update(result=None, error=f"Sonuç sonlu bir sayı değil: {result}")
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False)
+
 
 @mcp.resource("resource://addition/{numbers_str}")
 def addition(numbers_str: str) -> str:
@@ -42,6 +109,48 @@ def multiplication(numbers_str: str) -> str:
         return "Hata: Tüm parametreler geçerli sayılar olmalıdır."
 
 
+@mcp.resource("resource://addition/summary/{numbers_str}")
+def addition_summary(numbers_str: str) -> str:
+    """
+    Büyük girdiler için kısa toplama yanıtı; tüm ifadeyi geri göndermez.
+    Örnek: resource://addition/summary/1,2,3
+    """
+    try:
+        return _summarize(numbers_str, operator.add, "+", "Toplama Özeti")
+    except (ValueError, TypeError):
+        return "Hata: Tüm parametreler geçerli sayılar olmalıdır."
+
+
+@mcp.resource("resource://multiplication/summary/{numbers_str}")
+def multiplication_summary(numbers_str: str) -> str:
+    """
+    Büyük girdiler için kısa çarpma yanıtı; tüm ifadeyi geri göndermez.
+    Örnek: resource://multiplication/summary/2,3,4
+    """
+    try:
+        return _summarize(numbers_str, operator.mul, "×", "Çarpma Özeti")
+    except (ValueError, TypeError):
+        return "Hata: Tüm parametreler geçerli sayılar olmalıdır."
+
+
+@mcp.resource("resource://addition/json/{numbers_str}", mime_type="application/json")
+def addition_json(numbers_str: str) -> str:
+    """
+    Toplama sonucunu JSON olarak döner.
+    Örnek: resource://addition/json/1,2,3 -> {"operation": "addition", "operands": 3, "result": 6.0, ...}
+    """
+    return _as_json(numbers_str, operator.add, "addition")
+
+
+@mcp.resource("resource://multiplication/json/{numbers_str}", mime_type="application/json")
+def multiplication_json(numbers_str: str) -> str:
+    """
+    Çarpma sonucunu JSON olarak döner.
+    Örnek: resource://multiplication/json/2,3,4 -> {"operation": "multiplication", "operands": 3, "result": 24.0, ...}
+    """
+    return _as_json(numbers_str, operator.mul, "multiplication")
+
+
 if __name__ == "__main__":
     # stdio transportu ile sunucuyu başlat
     mcp.run(transport="stdio")
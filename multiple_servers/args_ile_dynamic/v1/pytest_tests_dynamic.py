@@ -1,5 +1,6 @@
 
 import asyncio
+import json
 import pytest
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
@@ -189,5 +190,65 @@ async def test_single_operand_and_zero():
             print(f"✓ Sıfır ile çarpma: {content2}")
 
 
+@pytest.mark.asyncio
+async def test_summary_mode():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # 1 + 2 + ... + 1000 = 500500; only the first numbers are echoed back
+            numbers_str = ",".join(str(n) for n in range(1, 1001))
+            response = await session.read_resource(f"resource://addition/summary/{numbers_str}")
+            content = response.contents[0].text
+            
+            assert content == "Toplama Özeti: 1000 sayı, sonuç = 500500.0 (önizleme: 1.0 + 2.0 + 3.0 + 4.0 + 5.0 + ...)"
+            
+            response = await session.read_resource("resource://multiplication/summary/8,12,2")
+            content = response.contents[0].text
+            assert content == "Çarpma Özeti: 3 sayı, sonuç = 192.0 (önizleme: 8.0 × 12.0 × 2.0)"
+            
+            response = await session.read_resource("resource://addition/summary/1,,2")
+            assert "Hata" in response.contents[0].text
+            print(f"✓ Özet modu testi başarılı: {content}")
+
+
+@pytest.mark.asyncio
+async def test_json_resources():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            response = await session.read_resource("resource://addition/json/15,27,10")
+            assert response.contents[0].mimeType == "application/json"
+            payload = json.loads(response.contents[0].text)
+            assert payload == {"operation": "addition", "operands": 3, "result": 52.0, "dtype": "float64"}
+            
+            response = await session.read_resource("resource://multiplication/json/8,12,2")
+            payload = json.loads(response.contents[0].text)
+            assert payload["result"] == 192.0
+            
+            response = await session.read_resource("resource://multiplication/json/8,abc")
+            assert "error" in json.loads(response.contents[0].text)
+            
+            # Non-finite results stay strict JSON
+            for uri in ("resource://multiplication/json/1e308,10", "resource://addition/json/nan,1"):
+                response = await session.read_resource(uri)
+                strict = json.loads(response.contents[0].text, parse_constant=pytest.fail)
+                assert strict["result"] is None and "sonlu" in strict["error"]
+            print(f"✓ JSON kaynak testi başarılı: {payload}")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import anyio
+import mcp.types as types
+from mcp import ClientSession
+
+# Bir toplu işlemde aynı anda yanıt bekleyen en fazla istek; diğerleri boş yer bekler
+DEFAULT_MAX_IN_FLIGHT = 256
+
+
+class BatchClientSession(ClientSession):
+    """
+    Her yanıtı beklemeden sonraki isteği yazan (pipelining) toplu yardımcılar
+    içeren ClientSession. Yanıtlar JSON-RPC id'siyle isteklere eşlenir (bunu
+    oturum yapar) ve sonuçlar istek sırasıyla döner. stdio_transport.stdio_client
+    üzerinde kuyruğa giren istekler ayrıca tek yazımda gönderilir.
+
+    Kullanılan protokol sürümünde JSON-RPC toplu (batch) mesajı olmadığından
+    istekler tek bir dizi olarak değil, arka arkaya yazılır.
+    """
+
+    async def _run_batch(self, calls: Sequence[Any], max_in_flight: int, return_exceptions: bool) -> List[Any]:
+        results: List[Any] = [None] * len(calls)
+        window = anyio.Semaphore(max_in_flight)
+        failure: Optional[Exception] = None
+
+        async def run(index: int, call) -> None:
+            nonlocal failure
+            async with window:
+                try:
+                    results[index] = await call()
+                except Exception as exc:
+                    if return_exceptions:
+                        results[index] = exc
+                    elif failure is None:
+                        # asyncio.gather gibi: ilk hata fırlatılır, kalanlar bırakılır
+                        failure = exc
+                        tg.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            for index, call in enumerate(calls):
+                tg.start_soon(run, index, call)
+        if failure is not None:
+            raise failure
+        return results
+
+    async def read_resources(
+        self,
+        uris: Sequence[str],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        return_exceptions: bool = False,
+    ) -> List[types.ReadResourceResult]:
+        """
+        Birçok kaynağı en fazla max_in_flight istek açıkta kalacak şekilde okur.
+        return_exceptions=True ise başarısız okuma, toplu işlemin geri kalanını
+        iptal etmek yerine sonucun yerinde kendi istisnasını döner.
+        """
+        calls = [lambda uri=uri: self.read_resource(uri) for uri in uris]
+        return await self._run_batch(calls, max_in_flight, return_exceptions)
+
+    async def call_tools(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        return_exceptions: bool = False,
+    ) -> List[types.CallToolResult]:
+        """(ad, argümanlar) çiftleriyle verilen birçok aracı çağırır; bkz. read_resources."""
+        requests = [lambda name=name, arguments=arguments: self.call_tool(name, arguments) for name, arguments in calls]
+        return await self._run_batch(requests, max_in_flight, return_exceptions)
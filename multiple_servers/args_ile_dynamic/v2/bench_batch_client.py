@@ -0,0 +1,54 @@
+import asyncio
+import os
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client as sdk_stdio_client
+
+from batch_client import BatchClientSession
+from stdio_transport import stdio_client
+
+# Tekrar oynatılacak istek sayısı
+REQUESTS = 10_000
+
+
+async def sequential(server_params, uris, errlog):
+    async with sdk_stdio_client(server_params, errlog=errlog) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            start = time.perf_counter()
+            for uri in uris:
+                await session.read_resource(uri)
+            return time.perf_counter() - start
+
+
+async def batched(client, server_params, uris, errlog):
+    async with client(server_params, errlog=errlog) as (read, write):
+        async with BatchClientSession(read, write) as session:
+            await session.initialize()
+            start = time.perf_counter()
+            results = await session.read_resources(uris)
+            elapsed = time.perf_counter() - start
+            assert len(results) == len(uris)
+            return elapsed
+
+
+async def main():
+    server_params = StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None)
+    uris = ["resource://greet", "resource://farewell"] * (REQUESTS // 2)
+
+    with open(os.devnull, "w") as errlog:
+        timings = {
+            "sequential": await sequential(server_params, uris, errlog),
+            "pipelined": await batched(sdk_stdio_client, server_params, uris, errlog),
+            "pipelined+coalesced": await batched(stdio_client, server_params, uris, errlog),
+        }
+
+    print(f"\n{'mode':>20} {'total (s)':>10} {'req/s':>10}")
+    print("-" * 42)
+    for mode, elapsed in timings.items():
+        print(f"{mode:>20} {elapsed:>10.2f} {REQUESTS / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
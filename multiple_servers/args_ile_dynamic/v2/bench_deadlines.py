@@ -0,0 +1,64 @@
+import asyncio
+import json
+import os
+import statistics
+import time
+from datetime import timedelta
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from deadline_client import DeadlineClientSession
+
+# Ani yük: istemcinin TIMEOUT içinde vazgeçtiği ağır çağrılar, ardından küçük çağrılar
+SPIKE = 6
+HEAVY = list(range(1, 150_000))  # multiply_exact, süreç havuzunda ~2 s
+LIGHT = list(range(1, 6_000))  # eşiğin üstünde, süreç havuzunda birkaç ms
+LIGHT_CALLS = 40
+TIMEOUT = timedelta(seconds=0.3)
+
+
+async def run(session_class) -> dict:
+    server_params = StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None)
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(server_params, errlog=errlog) as (read, write):
+            async with session_class(read, write) as session:
+                await session.initialize()
+                # Süreç havuzunu ısıt
+                await session.call_tool("multiply_exact", {"numbers": LIGHT})
+
+                async def heavy():
+                    try:
+                        await session.call_tool("multiply_exact", {"numbers": HEAVY}, read_timeout_seconds=TIMEOUT)
+                    except Exception:
+                        pass
+
+                await asyncio.gather(*(heavy() for _ in range(SPIKE)))
+                samples = []
+                for _ in range(LIGHT_CALLS):
+                    start = time.perf_counter()
+                    await session.call_tool(
+                        "multiply_exact", {"numbers": LIGHT}, read_timeout_seconds=timedelta(seconds=60)
+                    )
+                    samples.append((time.perf_counter() - start) * 1e3)
+                stats = json.loads((await session.read_resource("resource://executor/stats")).contents[0].text)
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p99": samples[int(len(samples) * 0.99) - 1],
+        "max": samples[-1],
+        "aborted": stats["aborted"],
+    }
+
+
+async def main():
+    print(f"\n{SPIKE} abandoned heavy calls, then {LIGHT_CALLS} light calls")
+    print(f"{'client':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10} {'aborted':>8}")
+    print("-" * 52)
+    for name, session_class in [("plain", ClientSession), ("deadline", DeadlineClientSession)]:
+        result = await run(session_class)
+        print(f"{name:>10} {result['p50']:>10.1f} {result['p99']:>10.1f} {result['max']:>10.1f} {result['aborted']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
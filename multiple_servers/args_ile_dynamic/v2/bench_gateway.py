@@ -0,0 +1,75 @@
+import asyncio
+import os
+import statistics
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+# İstek başına ek yükü ölçmek için yapılacak çağrı sayısı (ısınma hariç)
+REQUESTS = 1_000
+WARMUP = 50
+
+HELLO_WORLD = str(Path(__file__).resolve().parents[3] / "server_client_communication" / "mcp_server.py")
+
+
+def _params(script: str) -> StdioServerParameters:
+    return StdioServerParameters(command="python", args=[script], env=None)
+
+
+async def _open(stack: AsyncExitStack, script: str, errlog) -> ClientSession:
+    read, write = await stack.enter_async_context(stdio_client(_params(script), errlog=errlog))
+    session = await stack.enter_async_context(ClientSession(read, write))
+    await session.initialize()
+    return session
+
+
+async def per_request(call) -> float:
+    """Bir çağrının ortalama (medyan) gidiş-dönüş süresini mikrosaniye cinsinden döner."""
+    for _ in range(WARMUP):
+        await call()
+    samples = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+async def main():
+    with open(os.devnull, "w") as errlog:
+        async with AsyncExitStack() as stack:
+            start = time.perf_counter()
+            greeting = await _open(stack, "greeting_mcp_server.py", errlog)
+            math = await _open(stack, "math_server_dynamic.py", errlog)
+            hello = await _open(stack, HELLO_WORLD, errlog)
+            direct_connect = time.perf_counter() - start
+
+            direct = {
+                "greet": await per_request(lambda: greeting.read_resource("resource://greet")),
+                "add": await per_request(lambda: math.call_tool("add", {"numbers": [1, 2]})),
+                "hello": await per_request(lambda: hello.call_tool("greet", {"name": "Basak"})),
+            }
+
+        async with AsyncExitStack() as stack:
+            start = time.perf_counter()
+            gateway = await _open(stack, "gateway_server.py", errlog)
+            gateway_connect = time.perf_counter() - start
+
+            routed = {
+                "greet": await per_request(lambda: gateway.read_resource("greeting+resource://greet")),
+                "add": await per_request(lambda: gateway.call_tool("math.add", {"numbers": [1, 2]})),
+                "hello": await per_request(lambda: gateway.call_tool("hello.greet", {"name": "Basak"})),
+            }
+
+    print(f"\nconnect + initialize: 3 direct servers {direct_connect * 1e3:.0f} ms, gateway {gateway_connect * 1e3:.0f} ms")
+    print(f"\n{'request':>8} {'direct p50 (µs)':>16} {'gateway p50 (µs)':>17} {'overhead (µs)':>14}")
+    print("-" * 58)
+    for name in direct:
+        print(f"{name:>8} {direct[name]:>16.1f} {routed[name]:>17.1f} {routed[name] - direct[name]:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+import json
+import time
+import zlib
+
+from http_compression import _GzipStream, _ZstdStream, zstandard
+
+# Yanıt gövdesi boyutları (bayt) ve eşiği ayarlamak için varsayılan WAN hızları (Mbit/s)
+SIZES = [512, 4_096, 65_536, 1 << 20, 8 << 20]
+LINKS = [10, 100]
+
+
+def sse_event(result: dict) -> bytes:
+    """Streamable HTTP'nin POST yanıtında gönderdiği SSE olayı."""
+    message = {"jsonrpc": "2.0", "id": 1, "result": result}
+    return b"event: message\ndata: " + json.dumps(message, separators=(",", ":")).encode() + b"\n\n"
+
+
+def list_resource_payload(size: int) -> bytes:
+    """v1 liste kaynağına benzer metin: 'Addition result: 1.0 + 2.0 + ... = N'."""
+    count = 64
+    while True:
+        numbers = [float(i) for i in range(count)]
+        text = "Addition result: " + " + ".join(map(str, numbers)) + f" = {sum(numbers)}"
+        if len(text) >= size:
+            break
+        count *= 2
+    return sse_event({"contents": [{"uri": "resource://addition/...", "mimeType": "text/plain", "text": text[:size]}]})
+
+
+def batch_result_payload(size: int) -> bytes:
+    """add_batch benzeri sayı listesi sonucu (yapısal içerik + metin)."""
+    count = max(1, size // 40)
+    values = [i * 0.5 + 0.25 for i in range(count)]
+    return sse_event({
+        "content": [{"type": "text", "text": json.dumps(values)}],
+        "structuredContent": {"result": values},
+        "isError": False,
+    })
+
+
+def measure(stream_factory, body: bytes):
+    start = time.perf_counter()
+    compressed = stream_factory().compress(body, True)
+    compress = time.perf_counter() - start
+    start = time.perf_counter()
+    if stream_factory().encoding == "gzip":
+        zlib.decompress(compressed, 31)
+    else:
+        zstandard.ZstdDecompressor().decompressobj().decompress(compressed)
+    return len(compressed), compress, time.perf_counter() - start
+
+
+def main():
+    codecs = {"gzip-1": lambda: _GzipStream(1), "gzip-6": lambda: _GzipStream(6)}
+    if zstandard is not None:
+        codecs["zstd-3"] = lambda: _ZstdStream(3)
+
+    for name, build in [("list resource text", list_resource_payload), ("batch result", batch_result_payload)]:
+        print(f"\n{name}")
+        link_headers = "".join(f" {f'{mbit} Mbit/s (ms)':>16}" for mbit in LINKS)
+        print(f"{'body (B)':>10} {'codec':>7} {'wire (B)':>10} {'ratio':>6} {'comp (ms)':>10} {'decomp (ms)':>11}{link_headers}")
+        print("-" * (58 + 17 * len(LINKS)))
+        for size in SIZES:
+            body = build(size)
+            raw_links = "".join(f" {len(body) * 8 / (mbit * 1e3):>16.2f}" for mbit in LINKS)
+            print(f"{len(body):>10} {'none':>7} {len(body):>10} {1.0:>6.1f} {0.0:>10.2f} {0.0:>11.2f}{raw_links}")
+            for codec, factory in codecs.items():
+                wire, compress, decompress = measure(factory, body)
+                # Toplam süre: sıkıştırma + aktarım + açma
+                links = "".join(
+                    f" {(compress + decompress) * 1e3 + wire * 8 / (mbit * 1e3):>16.2f}" for mbit in LINKS
+                )
+                print(f"{'':>10} {codec:>7} {wire:>10} {len(body) / wire:>6.1f} "
+                      f"{compress * 1e3:>10.2f} {decompress * 1e3:>11.2f}{links}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import timeit
+
+import mcp.types as types
+
+from json_codec import OrjsonCodec, PydanticCodec
+
+# Büyük yüklerde tekrar sayısı düşük tutulur
+SIZES = {"small": 2, "large": 100_000}
+
+
+def request(method: str, params: dict) -> types.JSONRPCMessage:
+    return types.JSONRPCMessage(types.JSONRPCRequest(jsonrpc="2.0", id=1, method=method, params=params))
+
+
+def response(result: dict) -> types.JSONRPCMessage:
+    return types.JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=1, result=result))
+
+
+def payloads():
+    for label, size in SIZES.items():
+        numbers = [i * 0.5 for i in range(size)]
+        text = "Addition result: " + " + ".join(map(str, numbers)) + f" = {sum(numbers)}"
+        yield f"call_tool request ({label})", request(
+            "tools/call", {"name": "add", "arguments": {"numbers": numbers}}
+        )
+        yield f"call_tool result ({label})", response(
+            {"content": [{"type": "text", "text": str(numbers)}], "structuredContent": {"result": numbers}, "isError": False}
+        )
+        yield f"read_resource request ({label})", request(
+            "resources/read", {"uri": f"resource://addition/summary/{','.join(map(str, numbers[:8]))}"}
+        )
+        yield f"read_resource result ({label})", response(
+            {"contents": [{"uri": "resource://addition/15/27", "mimeType": "text/plain", "text": text}]}
+        )
+
+
+def per_call(fn, large: bool) -> float:
+    number = 10 if large else 5_000
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    codecs = [PydanticCodec(), OrjsonCodec()]
+    print(f"\n{'payload':>30} {'codec':>9} {'encode (µs)':>12} {'decode (µs)':>12}")
+    print("-" * 66)
+    for name, message in payloads():
+        large = "large" in name
+        line = PydanticCodec().encode(message)
+        for codec in codecs:
+            assert codec.decode(line) == message
+            encode = per_call(lambda: codec.encode(message), large)
+            decode = per_call(lambda: codec.decode(line), large)
+            print(f"{name:>30} {codec.name:>9} {encode:>12.1f} {decode:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import asyncio
+import base64
+import time
+
+import numpy as np
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+# Ölçülecek girdi boyutları
+SIZES = [1_000, 100_000, 1_000_000]
+REPEATS = 5
+
+
+def pack_numbers(values: np.ndarray, dtype: str = "float64") -> str:
+    """Sayıları 'numbers_b64' argümanı için little-endian ham tampona kodlar."""
+    little_endian = {"float64": "<f8", "int64": "<i8"}[dtype]
+    return base64.b64encode(np.ascontiguousarray(values, dtype=little_endian).tobytes()).decode("ascii")
+
+
+async def time_call(session: ClientSession, tool: str, arguments: dict) -> float:
+    """Aracı REPEATS kez çağırır ve en iyi süreyi saniye cinsinden döner."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = await session.call_tool(tool, arguments)
+        best = min(best, time.perf_counter() - start)
+        assert not result.isError, result.content
+    return best
+
+
+async def main():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+
+            print(f"\n{'elements':>10} {'list (ms)':>12} {'b64 (ms)':>12} {'speedup':>9}")
+            print("-" * 46)
+            rng = np.random.default_rng(0)
+            for size in SIZES:
+                values = rng.random(size)
+                # Liste biçimi: istemcinin JSON kodlaması da ölçüme dahildir
+                list_time = await time_call(session, "add", {"numbers": values.tolist()})
+                b64_time = await time_call(session, "add", {"numbers_b64": pack_numbers(values)})
+                print(f"{size:>10} {list_time * 1e3:>12.2f} {b64_time * 1e3:>12.2f} {list_time / b64_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
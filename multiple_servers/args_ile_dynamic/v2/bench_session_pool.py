@@ -0,0 +1,55 @@
+import asyncio
+import os
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from session_pool import SessionPool
+
+# Her yöntemle yapılacak istek sayısı
+REQUESTS = 20
+
+
+async def cold_request(server_params: StdioServerParameters, errlog) -> None:
+    """Eski yol: her istek için yeni alt süreç, importlar ve initialize."""
+    async with stdio_client(server_params, errlog=errlog) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            await session.call_tool("add", {"numbers": [1, 2]})
+
+
+async def pooled_request(pool: SessionPool, server_params: StdioServerParameters) -> None:
+    async with pool.session(server_params) as session:
+        await session.call_tool("add", {"numbers": [1, 2]})
+
+
+async def main():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+
+    with open(os.devnull, "w") as errlog:
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            await cold_request(server_params, errlog)
+        cold = (time.perf_counter() - start) / REQUESTS
+
+        async with SessionPool(min_size=1, max_size=4, errlog=errlog) as pool:
+            await pool.warm(server_params)
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                await pooled_request(pool, server_params)
+            pooled = (time.perf_counter() - start) / REQUESTS
+
+    print(f"\n{'mode':>8} {'per request (ms)':>18}")
+    print("-" * 28)
+    print(f"{'cold':>8} {cold * 1e3:>18.2f}")
+    print(f"{'pooled':>8} {pooled * 1e3:>18.2f}")
+    print(f"speedup: {cold / pooled:.0f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamable_http_client
+
+from uds_transport import uds_client
+
+# Ölçülen okuma sayısı ve aynı anda bekleyen istek sayısı
+READS = 4_000
+IN_FLIGHT = 32
+WARMUP = 200
+MODES = {"function": {"MCP_STATIC_RESOURCES": "0"}, "static": {"MCP_STATIC_RESOURCES": "1"}}
+
+
+def _wait_until(ready, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not ready():
+        if time.monotonic() > deadline:
+            raise TimeoutError("Sunucu zamanında hazır olmadı")
+        time.sleep(0.05)
+
+
+def _can_connect(family: int, address) -> bool:
+    with socket.socket(family) as sock:
+        try:
+            sock.connect(address)
+            return True
+        except OSError:
+            return False
+
+
+@contextmanager
+def _server(env: dict, *args: str):
+    process = subprocess.Popen(
+        [sys.executable, "greeting_mcp_server.py", *args],
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        yield process
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+async def reads_per_second(read, write) -> float:
+    async with ClientSession(read, write) as session:
+        await session.initialize()
+
+        async def reader(count: int):
+            for _ in range(count):
+                await session.read_resource("resource://greet")
+
+        await asyncio.gather(*(reader(WARMUP // IN_FLIGHT) for _ in range(IN_FLIGHT)))
+        start = time.perf_counter()
+        await asyncio.gather(*(reader(READS // IN_FLIGHT) for _ in range(IN_FLIGHT)))
+        return READS / (time.perf_counter() - start)
+
+
+async def over_stdio(env: dict) -> float:
+    server_params = StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=env)
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(server_params, errlog=errlog) as (read, write):
+            return await reads_per_second(read, write)
+
+
+async def over_uds(env: dict) -> float:
+    socket_path = os.path.join(tempfile.mkdtemp(), "bench-static.sock")
+    with _server(env, "--transport", "uds", "--socket", socket_path):
+        _wait_until(lambda: _can_connect(socket.AF_UNIX, socket_path))
+        async with uds_client(socket_path) as (read, write):
+            return await reads_per_second(read, write)
+
+
+async def over_http(env: dict) -> float:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    with _server(env, "--transport", "streamable-http", "--port", str(port)):
+        _wait_until(lambda: _can_connect(socket.AF_INET, ("127.0.0.1", port)))
+        async with streamable_http_client(f"http://127.0.0.1:{port}/mcp") as (read, write, _):
+            return await reads_per_second(read, write)
+
+
+async def main():
+    # İstemci de aynı makinede Python ile çalıştığı için sonuçlar uçtan uca kapasitedir
+    print(f"\n{'transport':>9} {'function (r/s)':>15} {'static (r/s)':>13} {'change':>8}")
+    print("-" * 48)
+    for name, measure in [("stdio", over_stdio), ("uds", over_uds), ("http", over_http)]:
+        rates = {mode: await measure(env) for mode, env in MODES.items()}
+        change = rates["static"] / rates["function"] - 1
+        print(f"{name:>9} {rates['function']:>15.0f} {rates['static']:>13.0f} {change:>+8.0%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamable_http_client
+
+from uds_transport import uds_client
+
+# Her transport için ölçülecek istek sayısı (ısınma turları hariç)
+REQUESTS = 2_000
+WARMUP = 100
+
+
+def _wait_until(ready, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not ready():
+        if time.monotonic() > deadline:
+            raise TimeoutError("Sunucu zamanında hazır olmadı")
+        time.sleep(0.05)
+
+
+def _can_connect(family: int, address) -> bool:
+    with socket.socket(family) as sock:
+        try:
+            sock.connect(address)
+            return True
+        except OSError:
+            return False
+
+
+@contextmanager
+def _server(*args: str):
+    """Greeting sunucusunu verilen transport argümanlarıyla arka planda başlatır."""
+    process = subprocess.Popen(
+        [sys.executable, "greeting_mcp_server.py", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        yield process
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+async def measure(read, write) -> list:
+    """Her read_resource çağrısının gidiş-dönüş süresini mikrosaniye cinsinden döner."""
+    async with ClientSession(read, write) as session:
+        await session.initialize()
+        for _ in range(WARMUP):
+            await session.read_resource("resource://greet")
+        samples = []
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            await session.read_resource("resource://greet")
+            samples.append((time.perf_counter() - start) * 1e6)
+        return samples
+
+
+def report(name: str, samples: list) -> None:
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{name:>8} {statistics.mean(samples):>10.1f} {statistics.median(samples):>10.1f} {p99:>10.1f}")
+
+
+async def main():
+    print(f"\n{'transport':>8} {'mean (µs)':>10} {'p50 (µs)':>10} {'p99 (µs)':>10}")
+    print("-" * 42)
+
+    server_params = StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None)
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(server_params, errlog=errlog) as (read, write):
+            report("stdio", await measure(read, write))
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "greeting.sock")
+    with _server("--transport", "uds", "--socket", socket_path):
+        _wait_until(lambda: _can_connect(socket.AF_UNIX, socket_path))
+        async with uds_client(socket_path) as (read, write):
+            report("uds", await measure(read, write))
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    with _server("--transport", "streamable-http", "--port", str(port)):
+        _wait_until(lambda: _can_connect(socket.AF_INET, ("127.0.0.1", port)))
+        async with streamable_http_client(f"http://127.0.0.1:{port}/mcp") as (read, write, _):
+            report("http", await measure(read, write))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+# Her sunucu ve yöntem için yapılacak başlatma sayısı
+LAUNCHES = 10
+SERVERS = ["greeting_mcp_server.py", "math_server_dynamic.py"]
+
+
+async def time_to_initialize(server_params: StdioServerParameters, errlog) -> float:
+    """Sürecin başlatılmasından initialize yanıtına kadar geçen süre."""
+    start = time.perf_counter()
+    async with stdio_client(server_params, errlog=errlog) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            elapsed = time.perf_counter() - start
+    return elapsed
+
+
+async def measure(server_params: StdioServerParameters, errlog) -> float:
+    samples = [await time_to_initialize(server_params, errlog) for _ in range(LAUNCHES)]
+    return sorted(samples)[len(samples) // 2]
+
+
+def wait_for_socket(path: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"zygote did not start: {path}")
+        time.sleep(0.05)
+
+
+async def main():
+    socket_path = os.path.join(tempfile.mkdtemp(), "zygote.sock")
+    env = {"ZYGOTE_SOCKET": socket_path}
+    with open(os.devnull, "w") as errlog:
+        zygote = subprocess.Popen(
+            [sys.executable, "zygote.py", "serve", "--socket", socket_path, *SERVERS],
+            stderr=errlog,
+        )
+        try:
+            wait_for_socket(socket_path)
+            rows = []
+            for script in SERVERS:
+                cold = await measure(StdioServerParameters(command="python", args=[script], env=env), errlog)
+                # -S: başlatıcı yalnızca standart kütüphaneyi kullanır, site içe aktarımı atlanır
+                forked = await measure(
+                    StdioServerParameters(command="python", args=["-S", "zygote.py", "run", script], env=env),
+                    errlog,
+                )
+                rows.append((script, cold, forked))
+        finally:
+            zygote.terminate()
+            zygote.wait()
+
+    print(f"\n{'server':>24} {'cold (ms)':>10} {'zygote (ms)':>12} {'speedup':>8}")
+    print("-" * 58)
+    for script, cold, forked in rows:
+        print(f"{script:>24} {cold * 1e3:>10.1f} {forked * 1e3:>12.1f} {cold / forked:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,42 @@
+import argparse
 import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamable_http_client
+
+from stdio_transport import stdio_client
+from uds_transport import uds_client
+
+
+def stdio_args(script: str, zygote: bool = False) -> list:
+    """
+    zygote=True ile sunucu, çalışan bir zygote'tan fork edilir (bkz. zygote.py);
+    -S ile başlatıcının kendi açılışı da kısalır.
+    """
+    return ["-S", "zygote.py", "run", script] if zygote else [script]
+
 
+@asynccontextmanager
+async def connect(server_params: StdioServerParameters, url: Optional[str] = None):
+    """
+    URL verilirse çalışan bir streamable HTTP sunucusuna (ör. http://127.0.0.1:8000/mcp)
+    ya da unix: önekiyle bir Unix domain soketine (ör. unix:$XDG_RUNTIME_DIR/math-server.sock)
+    bağlanır; verilmezse sunucuyu stdio alt süreci olarak başlatır.
+    """
+    if url and url.startswith("unix:"):
+        async with uds_client(url[len("unix:"):]) as (read, write):
+            yield read, write
+    elif url:
+        async with streamable_http_client(url) as (read, write, _):
+            yield read, write
+    else:
+        async with stdio_client(server_params) as (read, write):
+            yield read, write
 
-async def test_greeting_server():
+
+async def test_greeting_server(url: Optional[str] = None, zygote: bool = False):
     """Greeting sunucusunu ve kaynaklarını test eder."""
     print("\n" + "="*60)
     print("TESTING GREETING SERVER")
@@ -11,11 +44,11 @@ async def test_greeting_server():
     
     server_params = StdioServerParameters(
         command="python",
-        args=["greeting_mcp_server.py"],
+        args=stdio_args("greeting_mcp_server.py", zygote),
         env=None
     )
     
-    async with stdio_client(server_params) as (read, write):
+    async with connect(server_params, url) as (read, write):
         async with ClientSession(read, write) as session:
             await session.initialize()
             print("\n✓ Client is connected to Greeting MCP Server")
@@ -29,7 +62,7 @@ async def test_greeting_server():
             print(f"Response from farewell: {farewell_response.contents[0].text}")
 
 
-async def test_math_server():
+async def test_math_server(url: Optional[str] = None, zygote: bool = False):
     """Math sunucusunu ve araçlarını test eder."""
     print("\n" + "="*60)
     print("TESTING MATH SERVER (USING call_tool)")
@@ -37,11 +70,11 @@ async def test_math_server():
     
     server_params = StdioServerParameters(
         command="python",
-        args=["math_server_dynamic.py"],
+        args=stdio_args("math_server_dynamic.py", zygote),
         env=None
     )
     
-    async with stdio_client(server_params) as (read, write):
+    async with connect(server_params, url) as (read, write):
         async with ClientSession(read, write) as session:
             await session.initialize()
             print("\n✓ Client is connected to Math MCP Server")
@@ -59,11 +92,33 @@ async def test_math_server():
             mul_result = await session.call_tool("multiply", {"numbers": mul_input})
             print(f"Client: Result = {mul_result.structuredContent['result']}")
 
+            # Çok sayıda küçük listeyi tek istekte işlemek için toplu araçlar
+            batch_input = [[1, 2, 3], [10, 20], [], [7, 8]]
+            print(f"\nClient: Calling add_batch({batch_input})")
+            add_batch_result = await session.call_tool("add_batch", {"batches": batch_input})
+            print(f"Client: Results = {add_batch_result.structuredContent['result']}")
+
+            print(f"\nClient: Calling multiply_batch({batch_input})")
+            mul_batch_result = await session.call_tool("multiply_batch", {"batches": batch_input})
+            print(f"Client: Results = {mul_batch_result.structuredContent['result']}")
+
+            # Hesap zincirini tek istekte sunucuda değerlendir
+            expression = "(10 + 5) * 3"
+            print(f"\nClient: Calling evaluate({expression!r})")
+            eval_result = await session.call_tool("evaluate", {"expression": expression})
+            print(f"Client: Result = {eval_result.structuredContent['result']}")
+
 
 async def main():
     """Tüm testleri sırayla çalıştırır."""
-    await test_greeting_server()
-    await test_math_server()
+    parser = argparse.ArgumentParser(description="MCP sunucularını test eder")
+    parser.add_argument("--greeting-url", help="Çalışan greeting sunucusu, ör. http://127.0.0.1:8000/mcp veya unix:$XDG_RUNTIME_DIR/greeting-server.sock")
+    parser.add_argument("--math-url", help="Çalışan math sunucusu, ör. http://127.0.0.1:8001/mcp veya unix:$XDG_RUNTIME_DIR/math-server.sock")
+    parser.add_argument("--zygote", action="store_true", help="stdio sunucularını çalışan zygote üzerinden başlat (python zygote.py serve ...)")
+    args = parser.parse_args()
+
+    await test_greeting_server(args.greeting_url, args.zygote)
+    await test_math_server(args.math_url, args.zygote)
     
     print("\n" + "="*60)
     print("ALL TESTS COMPLETED SUCCESSFULLY ✓")
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+import anyio
+import mcp.types as types
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+
+from execution import DEADLINE_META_KEY
+
+# SDK, yanıt süresi dolan isteği bu kodla (HTTP 408) bildirir
+_REQUEST_TIMEOUT = 408
+
+
+class DeadlineClientSession(ClientSession):
+    """
+    Süre sınırını sunucuyla paylaşan ClientSession. call_tool'a verilen (ya da
+    oturumun varsayılan) read_timeout_seconds, isteğin _meta.timeoutMs alanıyla
+    sunucuya iletilir; sunucu bu süreyi aşan hesabı kendisi durdurur. Yanıt
+    süresinde gelmezse ya da çağıran görev iptal edilirse sunucuya
+    notifications/cancelled gönderilir, böylece kimsenin okumayacağı sonuç için
+    CPU harcanmaz.
+    """
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        read_timeout_seconds: Optional[timedelta] = None,
+        progress_callback=None,
+        *,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> types.CallToolResult:
+        timeout = read_timeout_seconds or self._session_read_timeout_seconds
+        if timeout is not None:
+            meta = {**(meta or {}), DEADLINE_META_KEY: int(timeout.total_seconds() * 1000)}
+        return await super().call_tool(name, arguments, read_timeout_seconds, progress_callback, meta=meta)
+
+    async def send_request(self, request, result_type, request_read_timeout_seconds=None, metadata=None,
+                           progress_callback=None):
+        # send_request id'yi ilk await'ten önce ayırır; bu yüzden sıradaki id bu isteğindir
+        request_id = self._request_id
+        try:
+            return await super().send_request(
+                request, result_type, request_read_timeout_seconds, metadata, progress_callback
+            )
+        except McpError as exc:
+            if exc.error.code == _REQUEST_TIMEOUT:
+                await self._cancel(request, request_id, "timeout")
+            raise
+        except anyio.get_cancelled_exc_class():
+            with anyio.CancelScope(shield=True):
+                await self._cancel(request, request_id, "cancelled by caller")
+            raise
+
+    async def _cancel(self, request, request_id: int, reason: str) -> None:
+        # initialize isteği iptal edilemez (MCP şartnamesi)
+        if isinstance(request.root, types.InitializeRequest):
+            return
+        try:
+            await self.send_notification(types.ClientNotification(types.CancelledNotification(
+                params=types.CancelledNotificationParams(requestId=request_id, reason=reason),
+            )))
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            pass
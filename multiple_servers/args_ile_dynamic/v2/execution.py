@@ -0,0 +1,272 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import anyio
+import anyio.to_thread
+
+# Geçerli yürütme politikaları; "auto" eşiğin altında inline, üstünde process demektir
+POLICIES = ("inline", "thread", "process", "auto")
+# İstemcinin istek _meta'sında bildirdiği süre sınırı (milisaniye), bkz. deadline_client.py
+DEADLINE_META_KEY = "timeoutMs"
+# Süreç havuzunda aynı anda iptal edilebilecek iş sayısı; fazlası sonuna kadar çalışır
+CANCEL_SLOTS = 1024
+
+
+class CallAborted(Exception):
+    """Çekirdek, iptal denetiminde işin bırakıldığını gördü."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Çağrı, istemcinin bildirdiği süre sınırı içinde bitmedi."""
+
+
+# Süreç havuzu işçileriyle paylaşılan iptal bayrakları (slot başına bir bayt)
+_flags = None
+
+
+def _init_worker(flags) -> None:
+    global _flags
+    _flags = flags
+
+
+@contextmanager
+def _light_main():
+    """
+    spawn işçisi ana modülü __mp_main__ olarak yeniden yükler; sunucu betiği ana modülse
+    bu, her işçide FastMCP'nin kurulması, araçların kaydı ve log iş parçacığı demektir
+    (işçi başına ~1 sn). İşçi süreçleri pool.submit içinde başlatıldığından o sırada
+    __main__ dosyası olmayan boş bir modülle değiştirilir; işçiler yalnızca çekirdek
+    modüllerini import eder.
+    """
+    main = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+class _ProcessCancel:
+    """Süreç havuzundaki çekirdeğin parça aralarında çağırdığı denetim; slot bayrağını okur."""
+
+    def __init__(self, slot: int):
+        self.slot = slot
+
+    def __call__(self) -> None:
+        if _flags[self.slot]:
+            raise CallAborted()
+
+
+class _ThreadCancel:
+    """İş parçacığındaki çekirdek için aynı denetim; süreç içinde bir Event yeterlidir."""
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def __call__(self) -> None:
+        if self.event.is_set():
+            raise CallAborted()
+
+
+def request_deadline() -> Optional[float]:
+    """
+    İşlenmekte olan isteğin _meta.timeoutMs alanından time.monotonic() cinsinden
+    bitiş zamanını döner; istek dışında veya alan yoksa None. Süre, aracın
+    yürütücüye ulaştığı andan itibaren sayılır.
+    """
+    # İşçi süreçleri de bu modülü import eder; MCP sunucu yığını onlara yüklenmesin
+    from mcp.server.lowlevel.server import request_ctx
+
+    try:
+        meta = request_ctx.get().meta
+    except LookupError:
+        return None
+    timeout_ms = (meta.model_extra or {}).get(DEADLINE_META_KEY) if meta is not None else None
+    if isinstance(timeout_ms, bool) or not isinstance(timeout_ms, (int, float)) or timeout_ms <= 0:
+        return None
+    return time.monotonic() + timeout_ms / 1000
+
+
+@dataclass
+class ToolPolicy:
+    policy: str = "auto"
+    # "auto" politikasında işin süreç havuzuna gönderileceği girdi boyutu
+    threshold: int = 1_000_000
+
+
+def _parse_overrides(spec: str) -> Dict[str, str]:
+    """'add=process,multiply=thread' biçimindeki ortam değişkenini sözlüğe çevirir."""
+    overrides = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        tool, _, policy = item.partition("=")
+        if policy not in POLICIES:
+            raise ValueError(f"Geçersiz yürütme politikası: {item!r} (geçerli: {', '.join(POLICIES)})")
+        overrides[tool.strip()] = policy
+    return overrides
+
+
+class ToolExecutor:
+    """
+    Araç başına yürütme politikası uygular: işi olay döngüsünde (inline), bir iş
+    parçacığında (thread) ya da sınırlı bir süreç havuzunda (process) çalıştırır.
+    Böylece büyük bir hesap, aynı bağlantıdaki diğer istekleri bekletmez.
+
+    Politikalar MATH_TOOL_POLICY (ör. "add=process,factorial=inline") ile,
+    havuz boyutu MATH_PROCESS_WORKERS ile değiştirilebilir.
+
+    İstemci vazgeçtiğinde (notifications/cancelled) ya da isteğin süre sınırı
+    dolduğunda thread ve process işleri de durdurulur: iptal edilebilir
+    çekirdekler check anahtar argümanını alır ve parça aralarında çağırır.
+    Henüz başlamamış süreç işleri kuyruktan düşürülür.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = (
+            max_workers
+            or int(os.environ.get("MATH_PROCESS_WORKERS", "0"))
+            or min(4, os.cpu_count() or 1)
+        )
+        self._policies: Dict[str, ToolPolicy] = {}
+        self._overrides = _parse_overrides(os.environ.get("MATH_TOOL_POLICY", ""))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._free_slots: List[int] = list(range(CANCEL_SLOTS))
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.cancelled = 0
+        self.deadline_exceeded = 0
+        # Sonucu beklenmese bile işçide hâlâ süren işler
+        self.running = 0
+
+    def configure(self, tool: str, policy: str = "auto", threshold: int = 1_000_000) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Geçersiz yürütme politikası: {policy!r}")
+        self._policies[tool] = ToolPolicy(self._overrides.get(tool, policy), threshold)
+
+    def policy_for(self, tool: str, size: int) -> str:
+        """Aracın verilen girdi boyutu için kullanacağı somut politikayı döner."""
+        tool_policy = self._policies.get(tool) or ToolPolicy(self._overrides.get(tool, "auto"))
+        if tool_policy.policy != "auto":
+            return tool_policy.policy
+        return "process" if size >= tool_policy.threshold else "inline"
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # fork, iş parçacıkları çalışan bir süreçte güvenli değildir; spawn temiz süreç başlatır
+            context = multiprocessing.get_context("spawn")
+            global _flags
+            if _flags is None:
+                _flags = context.RawArray("b", CANCEL_SLOTS)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=context, initializer=_init_worker, initargs=(_flags,)
+            )
+        return self._pool
+
+    async def run(self, policy: str, fn: Callable[..., Any], *args: Any, cancellable: bool = False) -> Any:
+        """
+        fn(*args) çağrısını verilen politikayla çalıştırır. Büyük sayı dizileri
+        argüman olarak NumPy dizisi şeklinde verilmelidir; bunlar listelerin aksine
+        tek bir ham tampon olarak kopyalanır. cancellable ise fn, iptalde
+        CallAborted fırlatan bir check argümanı alır. Süre sınırı dolmuşsa
+        DeadlineExceeded fırlatılır.
+        """
+        deadline = request_deadline()
+        if deadline is not None and deadline <= time.monotonic():
+            # Beklerken süresi dolmuş iş hiç başlatılmaz
+            self.deadline_exceeded += 1
+            raise DeadlineExceeded("Süre sınırı iş başlamadan doldu.")
+        if policy == "inline":
+            result = fn(*args)
+            self.completed += 1
+            return result
+
+        try:
+            with anyio.fail_after(deadline - time.monotonic()) if deadline is not None else nullcontext():
+                if policy == "thread":
+                    result = await self._run_thread(fn, args, cancellable)
+                else:
+                    result = await self._run_process(fn, args, cancellable)
+        except TimeoutError:
+            self.deadline_exceeded += 1
+            raise DeadlineExceeded("Süre sınırı doldu; hesap durduruldu.") from None
+        except anyio.get_cancelled_exc_class():
+            self.cancelled += 1
+            raise
+        self.completed += 1
+        return result
+
+    async def _run_thread(self, fn, args, cancellable: bool) -> Any:
+        cancel = _ThreadCancel()
+        call = functools.partial(fn, *args, check=cancel) if cancellable else functools.partial(fn, *args)
+
+        def work():
+            # Sayaç iş parçacığında artar: sırada beklerken iptal edilen iş hiç başlamaz
+            with self._lock:
+                self.running += 1
+            try:
+                return call()
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        try:
+            # abandon_on_cancel: iptalde iş parçacığının bitmesi beklenmez, bayrak onu durdurur
+            return await anyio.to_thread.run_sync(work, abandon_on_cancel=True)
+        except BaseException:
+            cancel.event.set()
+            raise
+
+    async def _run_process(self, fn, args, cancellable: bool) -> Any:
+        pool = self._get_pool()
+        with self._lock:
+            slot = self._free_slots.pop() if cancellable and self._free_slots else None
+            self.running += 1
+        kwargs = {"check": _ProcessCancel(slot)} if slot is not None else {}
+        # Slot iş bitince (havuzun iş parçacığında) serbest kalır; bayrak ancak o zamana kadar kurulabilir
+        finished = False
+
+        def done(_) -> None:
+            nonlocal finished
+            with self._lock:
+                finished = True
+                self.running -= 1
+                if slot is not None:
+                    _flags[slot] = 0
+                    self._free_slots.append(slot)
+
+        # __main__'de tanımlı fonksiyonlar işçide ana modül olmadan bulunamaz
+        light = _light_main() if getattr(fn, "__module__", None) != "__main__" else nullcontext()
+        try:
+            with light:
+                future = pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            done(None)
+            raise
+        future.add_done_callback(done)
+        try:
+            return await asyncio.wrap_future(future)
+        except BaseException:
+            # Başlamamış iş wrap_future iptaliyle kuyruktan düşer; çalışan iş bayrağı görür
+            with self._lock:
+                if slot is not None and not finished:
+                    _flags[slot] = 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        aborted = self.cancelled + self.deadline_exceeded
+        return {
+            "completed": self.completed,
+            "aborted": aborted,
+            "cancelled": self.cancelled,
+            "deadline_exceeded": self.deadline_exceeded,
+            "running": self.running,
+        }
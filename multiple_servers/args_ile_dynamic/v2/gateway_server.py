@@ -0,0 +1,115 @@
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, Iterable, Sequence, Tuple
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.types import ContentBlock
+from mcp.types import Resource as MCPResource
+from mcp.types import ResourceTemplate as MCPResourceTemplate
+from mcp.types import Tool as MCPTool
+from pydantic import AnyUrl
+
+import greeting_mcp_server
+import math_server_dynamic
+from server_cli import run_server
+
+# Araç adları "math.add", kaynak URI'leri "greeting+resource://greet" biçimindedir.
+# "greeting/resource://greet" geçerli bir URL olmadığından (MCP şeması AnyUrl ister)
+# ad alanı şemanın önüne "+" ile eklenir; bu RFC 3986'ya göre geçerli bir şemadır.
+TOOL_SEPARATOR = "."
+SCHEME_SEPARATOR = "+"
+
+
+def _split_uri(uri: str) -> Tuple[str, str]:
+    """'greeting+resource://greet' -> ('greeting', 'resource://greet')"""
+    scheme, sep, rest = uri.partition("://")
+    namespace, plus, inner_scheme = scheme.partition(SCHEME_SEPARATOR)
+    if not sep or not plus:
+        return "", uri
+    return namespace, f"{inner_scheme}://{rest}"
+
+
+class NamespacedGateway(FastMCP):
+    """
+    Birden fazla FastMCP uygulamasını tek süreçte, ad alanları altında sunar.
+    İstemci tek bağlantı ve tek initialize ile tüm sunuculara erişir.
+
+    Yönlendirme ad alanı üzerinden tek bir sözlük aramasıdır: "math.add" için
+    "math" uygulaması bulunur ve çağrı doğrudan onun "add" aracına iletilir;
+    arka uçlar tek tek denenmez. Arka uç araçları, ağ geçidindeki isteğin
+    oturumunu ve bağlamını (Context) aynen görür.
+    """
+
+    def __init__(self, name: str, **settings: Any):
+        super().__init__(name, **settings)
+        self._mounts: Dict[str, FastMCP] = {}
+
+    def mount(self, namespace: str, app: FastMCP) -> None:
+        if not namespace or TOOL_SEPARATOR in namespace or SCHEME_SEPARATOR in namespace:
+            raise ValueError(f"Geçersiz ad alanı: {namespace!r}")
+        if namespace in self._mounts:
+            raise ValueError(f"Ad alanı zaten kullanımda: {namespace!r}")
+        self._mounts[namespace] = app
+
+    async def list_tools(self) -> list[MCPTool]:
+        tools = await super().list_tools()
+        for namespace, app in self._mounts.items():
+            tools.extend(
+                tool.model_copy(update={"name": f"{namespace}{TOOL_SEPARATOR}{tool.name}"})
+                for tool in await app.list_tools()
+            )
+        return tools
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Sequence[ContentBlock] | Dict[str, Any]:
+        namespace, sep, tool_name = name.partition(TOOL_SEPARATOR)
+        app = self._mounts.get(namespace) if sep else None
+        if app is None:
+            return await super().call_tool(name, arguments)
+        return await app.call_tool(tool_name, arguments)
+
+    async def list_resources(self) -> list[MCPResource]:
+        resources = await super().list_resources()
+        for namespace, app in self._mounts.items():
+            resources.extend(
+                resource.model_copy(update={"uri": AnyUrl(f"{namespace}{SCHEME_SEPARATOR}{resource.uri}")})
+                for resource in await app.list_resources()
+            )
+        return resources
+
+    async def list_resource_templates(self) -> list[MCPResourceTemplate]:
+        templates = await super().list_resource_templates()
+        for namespace, app in self._mounts.items():
+            templates.extend(
+                template.model_copy(update={"uriTemplate": f"{namespace}{SCHEME_SEPARATOR}{template.uriTemplate}"})
+                for template in await app.list_resource_templates()
+            )
+        return templates
+
+    async def read_resource(self, uri: AnyUrl | str) -> Iterable[ReadResourceContents]:
+        namespace, inner_uri = _split_uri(str(uri))
+        app = self._mounts.get(namespace)
+        if app is None:
+            return await super().read_resource(uri)
+        return await app.read_resource(inner_uri)
+
+
+def _load_hello_world() -> FastMCP:
+    """server_client_communication/mcp_server.py paket değil, dosya yolundan yüklenir."""
+    path = Path(__file__).resolve().parents[3] / "server_client_communication" / "mcp_server.py"
+    spec = importlib.util.spec_from_file_location("hello_world_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.mcp
+
+
+# FastMCP server instance oluştur
+mcp = NamespacedGateway("gateway")
+mcp.mount("greeting", greeting_mcp_server.mcp)
+mcp.mount("math", math_server_dynamic.mcp)
+mcp.mount("hello", _load_hello_world())
+
+
+if __name__ == "__main__":
+    # Varsayılan olarak stdio; --transport streamable-http veya uds de kullanılabilir
+    run_server(mcp, "Greeting, math ve hello-world sunucularını tek süreçte sunan ağ geçidi")
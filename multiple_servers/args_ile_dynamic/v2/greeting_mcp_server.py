@@ -1,22 +1,31 @@
+from lazy_imports import defer_imports
+
+# stdio sunucusu mcp paketinin istemci tarafını ve HTTP yardımcılarını açılışta yüklemesin
+defer_imports()
 
 from mcp.server.fastmcp import FastMCP
 
+from server_cli import run_server
+from static_resources import static_resources
+
 # FastMCP server instance oluştur
 mcp = FastMCP("greeting-server")
+# Sabit metinler kayıt sırasında bir kez serileştirilir
+static = static_resources(mcp)
 
 
-@mcp.resource("resource://greet")
+@static.resource("resource://greet")
 def greet() -> str:
     
     return "Hello! Welcome to the Greeting Server."
 
 
-@mcp.resource("resource://farewell")
+@static.resource("resource://farewell")
 def farewell() -> str:
     
     return "Goodbye! Thank you for using the Greeting Server."
 
 
 if __name__ == "__main__":
-    # stdio transport ile server'ı başlat
-    mcp.run(transport="stdio")
+    # Varsayılan olarak stdio, --transport streamable-http ile HTTP üzerinden başlat
+    run_server(mcp, "Greeting MCP sunucusu")
@@ -0,0 +1,186 @@
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import anyio.to_thread
+
+try:
+    import zstandard
+except ImportError:  # zstd isteğe bağlıdır; yoksa yalnızca gzip sunulur
+    zstandard = None
+
+# Bu boyutun üstündeki tek parça yanıtlar olay döngüsünü bekletmemek için iş parçacığında sıkıştırılır
+THREAD_OFFLOAD_BYTES = 1 << 20
+
+
+class _GzipStream:
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        # wbits=31: zlib akışı yerine gzip başlığı ve sağlama toplamı
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        # Z_SYNC_FLUSH her parçayı hemen çözülebilir kılar; SSE olayları gecikmeden ulaşır
+        mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self._compressor.compress(data) + self._compressor.flush(mode)
+
+
+class _ZstdStream:
+    encoding = "zstd"
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        mode = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return self._compressor.compress(data) + self._compressor.flush(mode)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Sunucunun tercih sırasıyla sunabildiği kodlamalar."""
+    return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str, offered: Tuple[str, ...]) -> Optional[str]:
+    """
+    Accept-Encoding başlığındaki q değerlerine göre kodlama seçer. Eşit q
+    değerlerinde sunucunun tercih sırası (offered) geçerlidir; q=0 reddedilir.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            weights[name.strip().lower()] = quality
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in offered:
+        quality = weights.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    HTTP yanıtlarını istemcinin kabul ettiği kodlamayla (zstd varsa o, yoksa
+    gzip) sıkıştıran ASGI ara katmanı. minimum_size altındaki yanıtlar
+    sıkıştırılmadan gönderilir; küçük yüklerde sıkıştırma CPU'su kazançtan fazladır.
+    gzip seviyesi 1 varsayılandır: bu yüklerde seviye 6'ya göre boyut farkı %5'in
+    altında, CPU maliyeti ise üçte biridir (bench_http_compression.py).
+
+    Diğer yanıtlarda karar ilk gövde parçasına göre verilir; başlıklar o parça
+    gelene kadar bekletilir. Streamable HTTP yanıtları çoğunlukla SSE akışıdır ve
+    ilk olay uzun süre gelmeyebilir (GET bildirim akışı, uzun araç çağrısı); bu yüzden
+    text/event-stream yanıtlarında karar yalnızca başlıklara göre verilir, başlıklar
+    hemen iletilir ve akış parça parça sıkıştırılıp her parça flush edilir.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 1, zstd_level: int = 3):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "zstd": zstd_level}
+        self.offered = available_encodings()
+
+    def _stream(self, encoding: str):
+        return (_ZstdStream if encoding == "zstd" else _GzipStream)(self.levels[encoding])
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate(accept, self.offered) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSender(self, encoding, send))
+
+
+class _CompressingSender:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[dict] = None
+        # None: karar verilmedi, True: sıkıştırılıyor, False: olduğu gibi geçiyor
+        self.compressing: Optional[bool] = None
+        self.stream = None
+
+    async def __call__(self, message: dict) -> None:
+        if message["type"] == "http.response.start":
+            if _is_event_stream(message["headers"]):
+                await self._start_stream(message)
+            else:
+                self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.compressing is None:
+            await self._decide(message)
+            return
+        if not self.compressing:
+            await self.send(message)
+            return
+        more_body = message.get("more_body", False)
+        body = self.stream.compress(message.get("body", b""), final=not more_body)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _decide(self, message: dict) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers: List[Tuple[bytes, bytes]] = list(self.start["headers"])
+        already_encoded = any(name == b"content-encoding" for name, _ in headers)
+
+        self.compressing = not already_encoded and len(body) >= self.middleware.minimum_size
+        if not self.compressing:
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        self.stream = self.middleware._stream(self.encoding)
+        if not more_body and len(body) >= THREAD_OFFLOAD_BYTES:
+            compressed = await anyio.to_thread.run_sync(self.stream.compress, body, True)
+        else:
+            compressed = self.stream.compress(body, not more_body)
+
+        headers = self._encoded_headers(headers)
+        if not more_body:
+            headers.append((b"content-length", str(len(compressed)).encode("ascii")))
+        await self.send({**self.start, "headers": headers})
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    async def _start_stream(self, start: dict) -> None:
+        # SSE: ilk olayı beklemeden karar verilir; sonraki parçalar __call__ içinde sıkıştırılır
+        headers: List[Tuple[bytes, bytes]] = list(start["headers"])
+        self.compressing = not any(name == b"content-encoding" for name, _ in headers)
+        if self.compressing:
+            self.stream = self.middleware._stream(self.encoding)
+            start = {**start, "headers": self._encoded_headers(headers)}
+        await self.send(start)
+
+    def _encoded_headers(self, headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+        headers = [(name, value) for name, value in headers if name != b"content-length"]
+        headers.append((b"content-encoding", self.encoding.encode("ascii")))
+        headers.append((b"vary", b"Accept-Encoding"))
+        return headers
+
+
+def _is_event_stream(headers) -> bool:
+    return any(
+        name == b"content-type" and value.split(b";")[0].strip().lower() == b"text/event-stream"
+        for name, value in headers
+    )
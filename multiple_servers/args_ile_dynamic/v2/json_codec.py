@@ -0,0 +1,161 @@
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+
+import anyio
+import anyio.abc
+import anyio.lowlevel
+import mcp.types as types
+from mcp.shared.message import SessionMessage
+
+try:
+    import orjson
+except ImportError:  # orjson isteğe bağlıdır
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+CODECS = ("pydantic", "orjson")
+# Tek yazımda birleştirilen en fazla mesaj; büyük birikmeler de sınırlı parçalarla gönderilir
+MAX_COALESCED_MESSAGES = 1024
+
+# orjson 64 bit dışındaki tamsayıları sessizce float'a çevirir. Böyle bir sayı
+# en az 19 basamaklıdır; rakamlar "0"a, diğer baytlar "x"e çevrilip 19'luk
+# "0" dizisi aranır (düzenli ifadeden çok daha hızlıdır).
+_DIGIT_MASK = bytes(ord("0") if chr(byte).isdigit() and byte < 128 else ord("x") for byte in range(256))
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+class PydanticCodec:
+    """
+    SDK'nın kendi çerçevelemesi: pydantic-core ile doğrudan JSON'dan doğrulama
+    ve JSON'a yazma. Başka bir codec seçilmediğinde kullanılır.
+    """
+
+    name = "pydantic"
+
+    def encode(self, message: types.JSONRPCMessage) -> bytes:
+        return message.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+
+    def decode(self, line: bytes) -> types.JSONRPCMessage:
+        return types.JSONRPCMessage.model_validate_json(line)
+
+
+class OrjsonCodec(PydanticCodec):
+    """
+    Gelen mesajı orjson ile ayrıştırıp Python nesnesinden doğrular. Büyük sayı
+    listelerinde pydantic'in JSON ayrıştırıcısından belirgin şekilde hızlıdır.
+    Yazma tarafında pydantic-core zaten en hızlı seçenek olduğu için değişmez.
+
+    orjson 64 bit dışındaki tamsayıları hassasiyet kaybederek float'a çevirir;
+    bu yüzden 19 ve daha uzun rakam dizisi içeren mesajlar (ve orjson'un
+    reddettiği her şey) pydantic ile ayrıştırılır, sonuç varsayılan codec ile aynı kalır.
+    """
+
+    name = "orjson"
+
+    def decode(self, line: bytes) -> types.JSONRPCMessage:
+        if _LONG_DIGIT_RUN in line.translate(_DIGIT_MASK):
+            return super().decode(line)
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return super().decode(line)
+        return types.JSONRPCMessage.model_validate(data)
+
+
+def get_codec(name: Optional[str] = None) -> PydanticCodec:
+    """
+    İsimle ya da MCP_JSON_CODEC ortam değişkeniyle codec seçer. orjson kurulu
+    değilse uyarı verilir ve varsayılan codec kullanılır.
+    """
+    name = name or os.environ.get("MCP_JSON_CODEC") or "pydantic"
+    if name not in CODECS:
+        raise ValueError(f"Geçersiz JSON codec: {name!r} (geçerli: {', '.join(CODECS)})")
+    if name == "orjson":
+        if orjson is not None:
+            return OrjsonCodec()
+        logger.warning("orjson is not installed; falling back to the pydantic codec")
+    return PydanticCodec()
+
+
+@asynccontextmanager
+async def ndjson_streams(
+    stream: anyio.abc.ByteStream,
+    codec: Optional[PydanticCodec] = None,
+    fast_path: Optional[Callable[[bytes], Optional[bytes]]] = None,
+):
+    """
+    Bir bayt akışını, stdio transport ile aynı çerçeveleme (her satırda bir
+    JSON-RPC mesajı) kullanan MCP okuma/yazma akışlarına çevirir. fast_path
+    bir istek satırı için yanıt satırı dönerse (bkz. static_resources.py) yanıt
+    doğrudan yazılır ve istek oturuma iletilmez.
+    """
+    codec = codec or get_codec()
+    # Hızlı yol yanıtları ile oturumun yanıtları aynı akışa yazılır
+    send_lock = anyio.Lock()
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+    async def dispatch(line: bytes):
+        if fast_path is not None:
+            try:
+                reply = fast_path(line)
+            except Exception:
+                # Hızlı yoldaki bir hata bağlantıyı düşürmemeli; istek oturumda normal işlenir
+                logger.exception("Fast path failed; handing the request to the session")
+                reply = None
+            if reply is not None:
+                async with send_lock:
+                    await stream.send(reply)
+                return
+        try:
+            message = codec.decode(line)
+        except Exception as exc:
+            await read_stream_writer.send(exc)
+            return
+        await read_stream_writer.send(SessionMessage(message))
+
+    async def stream_reader():
+        pending = bytearray()
+        try:
+            async with read_stream_writer:
+                async for chunk in stream:
+                    # Yalnızca yeni gelen parça taranır; büyük mesajlarda maliyet doğrusal kalır
+                    start = 0
+                    while (end := chunk.find(b"\n", start)) != -1:
+                        pending += chunk[start:end]
+                        if pending.strip():
+                            await dispatch(bytes(pending))
+                        pending.clear()
+                        start = end + 1
+                    pending += chunk[start:]
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await anyio.lowlevel.checkpoint()
+
+    async def stream_writer():
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    # O anda kuyrukta bekleyen mesajlar da tek yazımda gönderilir; eşzamanlı
+                    # istekler (BatchClientSession) arka arkaya tek sistem çağrısıyla çıkar
+                    data = bytearray(codec.encode(session_message.message) + b"\n")
+                    for _ in range(MAX_COALESCED_MESSAGES - 1):
+                        try:
+                            queued = write_stream_reader.receive_nowait()
+                        except (anyio.WouldBlock, anyio.EndOfStream):
+                            break
+                        data += codec.encode(queued.message) + b"\n"
+                    async with send_lock:
+                        await stream.send(bytes(data))
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(stream_reader)
+        tg.start_soon(stream_writer)
+        try:
+            yield read_stream, write_stream
+        finally:
+            tg.cancel_scope.cancel()
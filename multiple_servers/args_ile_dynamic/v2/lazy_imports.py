@@ -0,0 +1,79 @@
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import threading
+import types
+from typing import Iterable, Optional
+
+# stdio sunucusunun açılışta ihtiyaç duymadığı, yalnızca "import X" biçiminde
+# (isimleri çekilmeden) içe aktarılan modüller:
+#   mcp        paket __init__'i tüm istemci tarafını (ClientSession, oturum grubu,
+#              SSE/HTTP istemcileri, OAuth) yükler; sunucu alt modülleri buna ihtiyaç duymaz
+#   httpx      SDK'da yalnızca fonksiyon gövdelerinde kullanılır (HTTP kaynakları, hata kodları)
+#   jsonschema yalnızca araç çıktısı doğrulanırken kullanılır
+# starlette, sse_starlette ve uvicorn FastMCP modülünde isimleriyle içe aktarıldığı
+# (ve sse_starlette uvicorn'u import sırasında yamadığı) için ertelenemez.
+DEFAULT_DEFERRED = ("mcp", "httpx", "jsonschema")
+
+_lock = threading.RLock()
+
+
+class _DeferredModule(types.ModuleType):
+    """
+    Gövdesi ilk eksik özniteliğe erişilene kadar çalıştırılmayan modül.
+    importlib.util.LazyLoader'dan farkı: import sisteminin okuduğu __spec__,
+    __path__ gibi öznitelikler modülü yüklemez; aksi halde aynı modülün ikinci
+    kez import edilmesi bile gövdeyi çalıştırır ve erteleme boşa gider.
+    """
+
+    def __getattr__(self, name: str):
+        with _lock:
+            execute = self.__dict__.pop("__deferred_exec__", None)
+            if execute is not None:
+                execute()
+                return getattr(self, name)
+        raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+
+class _DeferredLoader(importlib.abc.Loader):
+    def __init__(self, loader: importlib.abc.Loader):
+        self.loader = loader
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        module.__class__ = _DeferredModule
+        module.__deferred_exec__ = lambda: self.loader.exec_module(module)
+
+
+class _DeferredFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, names: Iterable[str]):
+        self.names = frozenset(names)
+
+    def find_spec(self, fullname: str, path, target=None) -> Optional[importlib.machinery.ModuleSpec]:
+        if fullname not in self.names:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _DeferredLoader(spec.loader)
+                return spec
+        return None
+
+
+def defer_imports(names: Iterable[str] = DEFAULT_DEFERRED) -> None:
+    """
+    Verilen modüllerin gövdelerini ilk kullanımlarına kadar erteler. Sunucu
+    betiğinin en başında, mcp import edilmeden önce çağrılmalıdır; zaten
+    yüklenmiş modüller etkilenmez. Ertelenen modül ilk eksik öznitelik
+    erişiminde normal şekilde yüklenir, bu yüzden davranış değişmez.
+    """
+    if any(isinstance(finder, _DeferredFinder) for finder in sys.meta_path):
+        return
+    sys.meta_path.insert(0, _DeferredFinder(names))
+
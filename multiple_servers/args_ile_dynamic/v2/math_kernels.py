@@ -0,0 +1,188 @@
+import math
+import operator
+from typing import Any, Callable, Dict, List, Union
+
+import numpy as np
+
+# Bu modüldeki fonksiyonlar saf hesaplama çekirdekleridir: sunucu durumuna
+# dokunmazlar ve süreç havuzuna gönderilebilmek için modül düzeyinde tanımlıdırlar.
+#
+# check argümanı alanlar işi parçalar halinde yapar ve her parçadan önce check()
+# çağırır; yürütücü iş bırakıldığında check() içinden CallAborted fırlatır.
+
+# İptal denetimleri arasında işlenen eleman sayısı (float64 ile ~8 MB, birkaç ms)
+CHUNK_SIZE = 1 << 20
+
+
+def _no_check() -> None:
+    pass
+
+
+def _reduce_chunks(reduce: Callable[[np.ndarray], float], combine: np.ufunc, values: np.ndarray, check) -> float:
+    if values.size <= CHUNK_SIZE:
+        return reduce(values)
+    partials = np.empty((values.size + CHUNK_SIZE - 1) // CHUNK_SIZE, dtype=np.float64)
+    for index, start in enumerate(range(0, values.size, CHUNK_SIZE)):
+        check()
+        partials[index] = reduce(values[start:start + CHUNK_SIZE])
+    return float(combine.reduce(partials))
+
+
+def sum_array(values: np.ndarray, check: Callable[[], None] = _no_check) -> float:
+    """Diziyi float64 üzerinde toplar."""
+    return _reduce_chunks(lambda chunk: float(chunk.sum(dtype=np.float64)), np.add, values, check)
+
+
+def prod_array(values: np.ndarray, check: Callable[[], None] = _no_check) -> float:
+    """Diziyi float64 üzerinde çarpar; int64 taşması bu sayede önlenir."""
+    return _reduce_chunks(lambda chunk: float(chunk.prod(dtype=np.float64)), np.multiply, values, check)
+
+
+def flatten_batches(batches: List[List[float]]):
+    """
+    Düzensiz (ragged) listeleri tek bir düz float64 tampona ve uzunluk dizisine çevirir.
+    """
+    lengths = np.fromiter(map(len, batches), dtype=np.intp, count=len(batches))
+    flat = np.fromiter(
+        (value for batch in batches for value in batch), dtype=np.float64, count=int(lengths.sum())
+    )
+    return flat, lengths
+
+
+def _segment_reduce_once(ufunc: np.ufunc, flat: np.ndarray, lengths: np.ndarray, results: np.ndarray) -> None:
+    if flat.size == 0:
+        return
+    offsets = np.zeros(len(lengths), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+
+    # reduceat boş segmentlerde yanlış sonuç verir, bu yüzden yalnızca dolu
+    # segmentlerin başlangıçları kullanılır; aradaki boş segmentler zaten eleman içermez
+    non_empty = lengths > 0
+    results[non_empty] = ufunc.reduceat(flat, offsets[non_empty])
+
+
+def segment_reduce(
+    ufunc: np.ufunc,
+    flat: np.ndarray,
+    lengths: np.ndarray,
+    identity: float,
+    check: Callable[[], None] = _no_check,
+) -> List[float]:
+    """
+    Düz tamponu ofsetler üzerinden segment segment tek geçişte indirger.
+    Boş segmentler için işlemin birim elemanı döner. Segmentler yaklaşık
+    CHUNK_SIZE elemanlık gruplar halinde işlenir; her segment yine tek
+    parça indirgendiği için sonuç gruplamadan etkilenmez.
+    """
+    results = np.full(len(lengths), identity, dtype=np.float64)
+    ends = np.cumsum(lengths)
+    first, start = 0, 0
+    while first < len(lengths):
+        check()
+        # En az bir segment; sonra toplam CHUNK_SIZE'ı aşmayan segmentler
+        last = max(first + 1, int(np.searchsorted(ends, start + CHUNK_SIZE, side="right")))
+        end = int(ends[last - 1])
+        _segment_reduce_once(ufunc, flat[start:end], lengths[first:last], results[first:last])
+        first, start = last, end
+    return results.tolist()
+
+
+def tree_reduce(
+    fn: Callable[[int, int], int],
+    values: List[int],
+    identity: int,
+    check: Callable[[], None] = _no_check,
+) -> int:
+    """
+    Değerleri dengeli bir ikili ağaçla birleştirir. Her turda komşu çiftler
+    birleştirildiği için işlenen sayılar benzer büyüklükte kalır; büyük tamsayı
+    çarpımında soldan katlamanın karesel maliyeti yerine Karatsuba'dan yararlanılır.
+    Son turlardaki tek bir çarpım bile uzun sürebildiği için her çiftten önce denetlenir.
+    """
+    values = list(values)
+    if not values:
+        return identity
+    while len(values) > 1:
+        paired = []
+        for i in range(0, len(values) - 1, 2):
+            check()
+            paired.append(fn(values[i], values[i + 1]))
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def exact_product(values: List[int], check: Callable[[], None] = _no_check) -> int:
+    return tree_reduce(operator.mul, values, 1, check)
+
+
+def exact_lcm(values: List[int], check: Callable[[], None] = _no_check) -> int:
+    return tree_reduce(math.lcm, values, 1, check)
+
+
+# evaluate_dag'da iptal denetimleri arasında hesaplanan düğüm sayısı
+DAG_CHECK_INTERVAL = 4096
+
+
+def evaluate_dag(nodes: Dict[str, Any], output: str, check: Callable[[], None] = _no_check) -> float:
+    """
+    {ad: {"op": "add"|"multiply", "args": [sayı veya düğüm adı, ...]}} grafiğinde output
+    düğümünü tek geçişte değerlendirir; paylaşılan düğümler bir kez hesaplanır.
+    Hesap float üzerinde yapılır ve her düğümden sonra sonucun sonlu olduğu denetlenir:
+    kendini kareleyen bir düğüm zinciri tamsayılarda üstel büyürdü.
+    """
+    values: Dict[str, float] = {}
+    visiting = set()
+
+    def resolve(arg: Union[str, float]) -> float:
+        # Argüman yalnızca sayı veya düğüm adı olabilir; liste/sözlük gibi değerler açıkça reddedilir
+        if isinstance(arg, bool) or not isinstance(arg, (int, float, str)):
+            raise ValueError(f"Geçersiz argüman: {arg!r}")
+        if isinstance(arg, (int, float)):
+            return _finite(arg)
+        if arg in values:
+            return values[arg]
+        if arg not in nodes:
+            raise ValueError(f"Bilinmeyen düğüm: {arg!r}")
+        if arg in visiting:
+            raise ValueError(f"Grafikte döngü var: {arg!r}")
+        node = nodes[arg]
+        op = node.get("op") if isinstance(node, dict) else None
+        if op not in ("add", "multiply"):
+            raise ValueError(f"Düğüm {arg!r} için 'op' \"add\" veya \"multiply\" olmalıdır.")
+        args = node.get("args", [])
+        if not isinstance(args, list):
+            raise ValueError(f"Düğüm {arg!r} için 'args' bir liste olmalıdır.")
+        visiting.add(arg)
+        operands = [resolve(a) for a in args]
+        visiting.discard(arg)
+        if len(values) % DAG_CHECK_INTERVAL == 0:
+            check()
+        values[arg] = _finite(sum(operands) if op == "add" else math.prod(operands))
+        return values[arg]
+
+    try:
+        return resolve(output)
+    except RecursionError as e:
+        raise ValueError("Grafik çok derin.") from e
+
+
+def _finite(value: float) -> float:
+    try:
+        value = float(value)
+    except OverflowError as e:
+        raise ValueError("Sonuç float aralığını aşıyor.") from e
+    if not math.isfinite(value):
+        raise ValueError("Sonuç float aralığını aşıyor.")
+    return value
+
+
+def exact_gcd(values: List[int], check: Callable[[], None] = _no_check) -> int:
+    """EBOB her adımda küçüldüğü için sıralı katlama yeterlidir; parçalar arasında denetlenir."""
+    result = 0
+    for start in range(0, len(values), CHUNK_SIZE):
+        check()
+        result = math.gcd(result, *values[start:start + CHUNK_SIZE])
+    return result
+
@@ -1,32 +1,447 @@
+import ast
+import base64
+import binascii
+import json
 import math
-from typing import List
-from mcp.server.fastmcp import FastMCP
+import os
+import secrets
+import time
+import weakref
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from lazy_imports import defer_imports
+
+# stdio sunucusu mcp paketinin istemci tarafını ve HTTP yardımcılarını açılışta yüklemesin
+defer_imports()
+
+import numpy as np
+from mcp.server.fastmcp import Context, FastMCP
+
+import math_kernels
+from execution import ToolExecutor
+from server_cli import run_server
+from server_logging import ToolLogger
 
 # FastMCP sunucu örneği oluştur
 mcp = FastMCP("math-server")
 
+# Kayıtlar stdout yerine (stdio JSON-RPC kanalı) arka planda stderr'e veya dosyaya yazılır
+log = ToolLogger.from_env("math-server")
+
+# CPU yoğun araçlar büyük girdilerde olay döngüsünü bekletmemek için süreç havuzuna gönderilir.
+# Eşikler girdi boyutudur: eleman sayısı, tamsayı adedi, factorial için n, evaluate için düğüm sayısı
+# veya power_mod için üs bitleri × modül bitleri.
+executor = ToolExecutor()
+executor.configure("add", threshold=1_000_000)
+executor.configure("multiply", threshold=1_000_000)
+executor.configure("add_batch", threshold=1_000_000)
+executor.configure("multiply_batch", threshold=1_000_000)
+executor.configure("multiply_exact", threshold=5_000)
+executor.configure("lcm_many", threshold=5_000)
+executor.configure("factorial", threshold=20_000)
+executor.configure("evaluate", threshold=100_000)
+executor.configure("acc_push", threshold=1_000_000)
+executor.configure("gcd_many", threshold=5_000)
+executor.configure("power_mod", threshold=1 << 22)
+
+
+# b64 biçiminde kabul edilen veri tipleri (little-endian)
+PACKED_DTYPES = {
+    "float64": np.dtype("<f8"),
+    "int64": np.dtype("<i8"),
+}
+
+
+def _decode_packed(numbers_b64: str, dtype: str) -> np.ndarray:
+    """
+    Base64 ile kodlanmış ham sayı tamponunu Python listesi oluşturmadan
+    doğrudan bir NumPy dizisine çevirir.
+    """
+    if dtype not in PACKED_DTYPES:
+        raise ValueError(f"Desteklenmeyen dtype: {dtype!r} (geçerli: {', '.join(PACKED_DTYPES)})")
+    try:
+        raw = base64.b64decode(numbers_b64, validate=True)
+    except binascii.Error as e:
+        raise ValueError(f"'numbers_b64' geçerli bir base64 metni değil: {e}")
+    item_dtype = PACKED_DTYPES[dtype]
+    if len(raw) % item_dtype.itemsize:
+        raise ValueError(f"'numbers_b64' uzunluğu {dtype} eleman boyutunun ({item_dtype.itemsize} bayt) katı değil.")
+    return np.frombuffer(raw, dtype=item_dtype)
+
+
+def _resolve_numbers(
+    numbers: Optional[List[float]],
+    numbers_b64: Optional[str],
+    dtype: str,
+    name: str = "numbers",
+):
+    """'numbers' ve 'numbers_b64' argümanlarından tam olarak birinin verildiğini doğrular."""
+    if (numbers is None) == (numbers_b64 is None):
+        raise ValueError(f"'{name}' veya '{name}_b64' argümanlarından yalnızca biri verilmelidir.")
+    if numbers_b64 is not None:
+        return _decode_packed(numbers_b64, dtype)
+    return numbers
+
 
 @mcp.tool()  # DÜZELTME: Parantezler eklendi
-def add(numbers: List[float]) -> float:
+async def add(
+    numbers: Optional[List[float]] = None,
+    numbers_b64: Optional[str] = None,
+    dtype: str = "float64",
+) -> float:
     """
     Verilen sayı listesini toplar.
-    'numbers' argümanı float türünde bir listedir.
+    'numbers' argümanı float türünde bir listedir. Büyük girdiler için
+    'numbers_b64' ile little-endian float64/int64 ham tampon gönderilebilir.
     """
-    print(f"Sunucu: Toplama isteği alındı: {numbers}")
-    return sum(numbers)
+    values = _resolve_numbers(numbers, numbers_b64, dtype)
+    policy = executor.policy_for("add", len(values))
+    if isinstance(values, np.ndarray):
+        log.call("add", "Toplama isteği alındı", size=values.size, dtype=dtype)
+        return await executor.run(policy, math_kernels.sum_array, values, cancellable=True)
+    log.call("add", "Toplama isteği alındı", numbers=values)
+    if policy == "inline":
+        # Sayaçlar tutarlı kalsın diye küçük listeler de yürütücüden geçer
+        return await executor.run(policy, sum, values)
+    return await executor.run(policy, math_kernels.sum_array, np.asarray(values, dtype=np.float64), cancellable=True)
 
 
 @mcp.tool()  # DÜZELTME: Parantezler eklendi
-def multiply(numbers: List[float]) -> float:
+async def multiply(
+    numbers: Optional[List[float]] = None,
+    numbers_b64: Optional[str] = None,
+    dtype: str = "float64",
+) -> float:
     """
     Verilen sayı listesini çarpar.
-    'numbers' argümanı float türünde bir listedir.
+    'numbers' argümanı float türünde bir listedir. Büyük girdiler için
+    'numbers_b64' ile little-endian float64/int64 ham tampon gönderilebilir.
+    """
+    values = _resolve_numbers(numbers, numbers_b64, dtype)
+    policy = executor.policy_for("multiply", len(values))
+    if isinstance(values, np.ndarray):
+        log.call("multiply", "Çarpma isteği alındı", size=values.size, dtype=dtype)
+        return await executor.run(policy, math_kernels.prod_array, values, cancellable=True)
+    log.call("multiply", "Çarpma isteği alındı", numbers=values)
+    if policy == "inline":
+        # Çarpma işlemi için math.prod kullanılır
+        return await executor.run(policy, math.prod, values)
+    return await executor.run(policy, math_kernels.prod_array, np.asarray(values, dtype=np.float64), cancellable=True)
+
+
+@mcp.tool()
+async def add_batch(batches: List[List[float]]) -> List[float]:
+    """
+    Birden fazla sayı listesini tek istekte toplar.
+    Her alt liste için bir toplam döner; boş alt listelerin toplamı 0'dır.
+    """
+    log.call("add_batch", "Toplu toplama isteği alındı", batches=len(batches))
+    flat, lengths = math_kernels.flatten_batches(batches)
+    policy = executor.policy_for("add_batch", flat.size)
+    return await executor.run(policy, math_kernels.segment_reduce, np.add, flat, lengths, 0.0, cancellable=True)
+
+
+@mcp.tool()
+async def multiply_batch(batches: List[List[float]]) -> List[float]:
+    """
+    Birden fazla sayı listesini tek istekte çarpar.
+    Her alt liste için bir çarpım döner; boş alt listelerin çarpımı 1'dir.
+    """
+    log.call("multiply_batch", "Toplu çarpma isteği alındı", batches=len(batches))
+    flat, lengths = math_kernels.flatten_batches(batches)
+    policy = executor.policy_for("multiply_batch", flat.size)
+    return await executor.run(policy, math_kernels.segment_reduce, np.multiply, flat, lengths, 1.0, cancellable=True)
+
+
+# Boşta kalan akümülatörlerin silinmesinden önce beklenecek süre (saniye)
+ACC_IDLE_TIMEOUT = float(os.environ.get("MATH_ACC_IDLE_TIMEOUT", "300"))
+# Bir oturumun aynı anda açık tutabileceği en fazla akümülatör
+MAX_ACCUMULATORS_PER_SESSION = int(os.environ.get("MATH_ACC_MAX_PER_SESSION", "64"))
+# Diğer oturumların boşta kalan akümülatörlerinin en fazla bu aralıkla taranması (saniye)
+ACC_SWEEP_INTERVAL = 1.0
+
+
+@dataclass
+class _Accumulator:
+    """Parça parça gelen sayıları sabit bellekle biriktirir."""
+    op: str
+    value: float
+    count: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+# Her oturumun akümülatörleri; oturum kapandığında girdiler otomatik düşer
+_accumulators: "weakref.WeakKeyDictionary[object, Dict[str, _Accumulator]]" = weakref.WeakKeyDictionary()
+_next_accumulator_sweep = 0.0
+
+
+def _drop_idle(handles: Dict[str, _Accumulator], deadline: float) -> None:
+    for handle in [h for h, acc in handles.items() if acc.last_used < deadline]:
+        del handles[handle]
+
+
+def _session_accumulators(ctx: Context) -> Dict[str, _Accumulator]:
+    """
+    Oturuma ait akümülatörleri döner ve süresi dolanları temizler. Açık kalan
+    ama artık çağrı yapmayan oturumların akümülatörleri de başka oturumların
+    çağrılarında (en fazla ACC_SWEEP_INTERVAL aralıkla) silinir.
+    """
+    global _next_accumulator_sweep
+    now = time.monotonic()
+    deadline = now - ACC_IDLE_TIMEOUT
+    if now >= _next_accumulator_sweep:
+        _next_accumulator_sweep = now + ACC_SWEEP_INTERVAL
+        for handles in list(_accumulators.values()):
+            _drop_idle(handles, deadline)
+    handles = _accumulators.setdefault(ctx.session, {})
+    _drop_idle(handles, deadline)
+    return handles
+
+
+def _get_accumulator(ctx: Context, handle: str) -> _Accumulator:
+    acc = _session_accumulators(ctx).get(handle)
+    if acc is None:
+        raise ValueError(f"Bilinmeyen veya süresi dolmuş akümülatör: {handle!r}")
+    acc.last_used = time.monotonic()
+    return acc
+
+
+@mcp.tool()
+def acc_open(ctx: Context, op: Literal["sum", "prod"] = "sum") -> str:
+    """
+    Oturuma bağlı yeni bir akümülatör açar ve tanıtıcısını döner.
+    'op' toplama için "sum", çarpma için "prod" olmalıdır. Bir oturumda en
+    fazla MAX_ACCUMULATORS_PER_SESSION akümülatör açık olabilir.
+    """
+    handles = _session_accumulators(ctx)
+    if len(handles) >= MAX_ACCUMULATORS_PER_SESSION:
+        raise ValueError(
+            f"Bu oturumda zaten {len(handles)} açık akümülatör var (sınır {MAX_ACCUMULATORS_PER_SESSION}); "
+            "yenisini açmadan önce acc_close ile birini kapatın."
+        )
+    handle = secrets.token_hex(8)
+    handles[handle] = _Accumulator(op=op, value=0.0 if op == "sum" else 1.0)
+    log.call("acc_open", "Akümülatör açıldı", handle=handle, op=op)
+    return handle
+
+
+@mcp.tool()
+async def acc_push(
+    ctx: Context,
+    handle: str,
+    chunk: Optional[List[float]] = None,
+    chunk_b64: Optional[str] = None,
+    dtype: str = "float64",
+) -> int:
+    """
+    Bir sayı parçasını akümülatöre katar ve şimdiye kadar katılan sayı adedini döner.
+    Parça, 'chunk' listesi veya 'chunk_b64' ham tamponu olarak gönderilebilir.
     """
-    print(f"Sunucu: Çarpma isteği alındı: {numbers}")
-    # Çarpma işlemi için math.prod kullanılır
-    return math.prod(numbers)
+    acc = _get_accumulator(ctx, handle)
+    values = np.asarray(_resolve_numbers(chunk, chunk_b64, dtype, name="chunk"), dtype=np.float64)
+    policy = executor.policy_for("acc_push", values.size)
+    kernel = math_kernels.sum_array if acc.op == "sum" else math_kernels.prod_array
+    # Parça sonucu önce hesaplanır; aynı tanıtıcıya eşzamanlı gönderimler birbirinin katkısını ezmez
+    partial = await executor.run(policy, kernel, values, cancellable=True)
+    if acc.op == "sum":
+        acc.value += partial
+    else:
+        acc.value *= partial
+    acc.count += values.size
+    return acc.count
+
+
+@mcp.tool()
+def acc_close(ctx: Context, handle: str) -> float:
+    """Akümülatörü kapatır ve biriken sonucu döner."""
+    acc = _get_accumulator(ctx, handle)
+    del _session_accumulators(ctx)[handle]
+    log.call("acc_close", "Akümülatör kapandı", handle=handle, count=acc.count)
+    return acc.value
+
+
+# İfadelerde izin verilen düğüm tipleri; üs alma gibi pahalı işlemler bilerek dışarıda
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.UAdd, ast.USub,
+)
+MAX_EXPRESSION_LENGTH = 10_000
+
+
+# Hata mesajlarında ifadenin gösterilen en fazla karakter sayısı
+_EXPRESSION_PREVIEW = 80
+
+
+def _preview(expression: str) -> str:
+    if len(expression) <= _EXPRESSION_PREVIEW:
+        return repr(expression)
+    return repr(expression[:_EXPRESSION_PREVIEW]) + f"... ({len(expression)} karakter)"
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression: str):
+    """
+    Aritmetik ifadeyi ayrıştırır, yalnızca izin verilen düğümleri içerdiğini
+    doğrular ve derlenmiş kod nesnesini döner. Sonuç ifade metnine göre önbelleklenir.
+    """
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"İfade en fazla {MAX_EXPRESSION_LENGTH} karakter olabilir.")
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        raise ValueError(f"Geçersiz ifade: {_preview(expression)}") from e
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"İfadede desteklenmeyen öğe: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float))
+        ):
+            raise ValueError(f"İfadede yalnızca sayılar kullanılabilir: {node.value!r}")
+    try:
+        return compile(tree, "<expression>", "eval")
+    except RecursionError as e:
+        raise ValueError("İfade çok derin.") from e
+
+
+def _to_float(value: float) -> float:
+    """Yalnızca tamsayılardan oluşan hesabın sonucu float aralığını aşabilir; açık bir hata verilir."""
+    try:
+        return float(value)
+    except OverflowError as e:
+        raise ValueError("Sonuç float aralığını aşıyor.") from e
+
+
+@mcp.tool()
+async def evaluate(expression: Optional[str] = None, dag: Optional[Dict[str, Any]] = None) -> float:
+    """
+    Bir hesap zincirini tek istekte değerlendirir.
+    'expression' + - * / ve parantez içeren bir aritmetik ifadedir, örn. "(10 + 5) * 3".
+    Alternatif olarak 'dag', {"nodes": {ad: {"op": "add"|"multiply", "args": [sayı veya
+    düğüm adı, ...]}}, "output": ad} biçiminde bir JSON grafiğidir; float üzerinde hesaplanır.
+    """
+    if (expression is None) == (dag is None):
+        raise ValueError("'expression' veya 'dag' argümanlarından yalnızca biri verilmelidir.")
+    if dag is not None:
+        nodes, output = dag.get("nodes"), dag.get("output")
+        if not isinstance(nodes, dict) or not isinstance(output, str) or output not in nodes:
+            raise ValueError("'dag' bir 'nodes' sözlüğü ve bu sözlükteki bir 'output' düğümü içermelidir.")
+        log.call("evaluate", "Grafik değerlendirme isteği alındı", nodes=len(nodes))
+        policy = executor.policy_for("evaluate", len(nodes))
+        return await executor.run(policy, math_kernels.evaluate_dag, nodes, output, cancellable=True)
+
+    log.call("evaluate", "İfade değerlendirme isteği alındı", expression=_preview(expression))
+    code = _compile_expression(expression.strip())
+    try:
+        # İfade MAX_EXPRESSION_LENGTH ile sınırlı ve üs alma içermediğinden maliyeti uzunluğuyla
+        # doğrusaldır; kod nesnesi süreçler arası taşınamadığı için her zaman inline çalışır
+        return _to_float(await executor.run("inline", eval, code, {"__builtins__": {}}, {}))
+    except ZeroDivisionError as e:
+        raise ValueError("Sıfıra bölme.") from e
+    except OverflowError as e:
+        # Büyük tamsayının bölümü gibi ara sonuçlar
+        raise ValueError("Sonuç float aralığını aşıyor.") from e
+
+
+# factorial için üst sınır; daha büyük değerler sunucuyu uzun süre meşgul eder
+MAX_FACTORIAL_N = 200_000
+# Yaklaşık 4000 ondalık basamağa karşılık gelen bit sayısı (int -> str sınırı 4300 basamaktır)
+_DECIMAL_BIT_LIMIT = 13_287
+
+
+def _format_int(value: int) -> str:
+    """
+    Tamsayıyı metne çevirir. Ondalık gösterim Python'un basamak sınırını aşarsa
+    (ve karesel maliyetli olacaksa) "0x" önekli onaltılık gösterim döner;
+    istemci her iki biçimi de int(text, 0) ile okuyabilir.
+    """
+    if value.bit_length() <= _DECIMAL_BIT_LIMIT:
+        return str(value)
+    return hex(value)
+
+
+@mcp.tool()
+async def multiply_exact(numbers: List[int]) -> str:
+    """
+    Tamsayı listesini kayan nokta yuvarlaması olmadan tam olarak çarpar.
+    Sonuç metin olarak döner; int(result, 0) ile okunabilir.
+    """
+    log.call("multiply_exact", "Tam çarpma isteği alındı", numbers=numbers)
+    policy = executor.policy_for("multiply_exact", len(numbers))
+    return _format_int(await executor.run(policy, math_kernels.exact_product, numbers, cancellable=True))
+
+
+@mcp.tool()
+async def factorial(n: int) -> str:
+    """
+    n! değerini tam olarak hesaplar (math.factorial ikili bölme kullanır).
+    Sonuç metin olarak döner; int(result, 0) ile okunabilir.
+    """
+    if not 0 <= n <= MAX_FACTORIAL_N:
+        raise ValueError(f"'n' 0 ile {MAX_FACTORIAL_N} arasında olmalıdır.")
+    log.call("factorial", "Faktöriyel isteği alındı", n=n)
+    # math.factorial tek bir C çağrısıdır ve parça parça denetlenemez; iptalde yalnızca
+    # henüz başlamamışsa kuyruktan düşer, süre aşımında istemciye yine hemen hata döner
+    return _format_int(await executor.run(executor.policy_for("factorial", n), math.factorial, n))
+
+
+# power_mod için üs ve modülün en fazla bit sayısı. pow bölünemeyen tek bir çağrıdır
+# (iptal denetimi yoktur); bu sınırda süreç havuzunda en fazla ~2 sn sürer ve süre
+# sınırı ya da iptal istemciyi hemen serbest bırakır.
+MAX_POWER_MOD_BITS = 8192
+
+
+@mcp.tool()
+async def power_mod(base: int, exponent: int, modulus: int) -> str:
+    """
+    (base ** exponent) % modulus değerini kare-al-çarp yöntemiyle hesaplar.
+    Negatif üs, modüler ters alma anlamına gelir.
+    """
+    if modulus == 0:
+        raise ValueError("'modulus' sıfır olamaz.")
+    if max(exponent.bit_length(), modulus.bit_length()) > MAX_POWER_MOD_BITS:
+        raise ValueError(f"'exponent' ve 'modulus' en fazla {MAX_POWER_MOD_BITS} bit olabilir.")
+    log.call("power_mod", "Modüler üs isteği alındı", exponent_bits=exponent.bit_length())
+    # Maliyet kabaca üs bitleri × modül bitleri ile büyür
+    policy = executor.policy_for("power_mod", exponent.bit_length() * modulus.bit_length())
+    return _format_int(await executor.run(policy, pow, base, exponent, modulus))
+
+
+@mcp.tool()
+async def lcm_many(numbers: List[int]) -> str:
+    """
+    Tamsayı listesinin en küçük ortak katını dengeli ağaçla hesaplar.
+    Boş listenin sonucu 1'dir.
+    """
+    log.call("lcm_many", "EKOK isteği alındı", numbers=numbers)
+    policy = executor.policy_for("lcm_many", len(numbers))
+    return _format_int(await executor.run(policy, math_kernels.exact_lcm, numbers, cancellable=True))
+
+
+@mcp.tool()
+async def gcd_many(numbers: List[int]) -> str:
+    """
+    Tamsayı listesinin en büyük ortak bölenini hesaplar.
+    EBOB her adımda küçüldüğü için sıralı katlama yeterlidir. Boş listenin sonucu 0'dır.
+    """
+    log.call("gcd_many", "EBOB isteği alındı", numbers=numbers)
+    policy = executor.policy_for("gcd_many", len(numbers))
+    return _format_int(await executor.run(policy, math_kernels.exact_gcd, numbers, cancellable=True))
+
+
+@mcp.resource("resource://logs/recent", mime_type="application/json")
+def recent_logs() -> str:
+    """Bellek halkasındaki son kayıtları JSON olarak döner."""
+    return json.dumps(log.recent(), ensure_ascii=False)
+
+
+@mcp.resource("resource://executor/stats", mime_type="application/json")
+def executor_stats() -> str:
+    """Yürütücüye gönderilen işlerden tamamlanan ve bırakılan (iptal/süre aşımı) sayıları."""
+    return json.dumps(executor.stats())
 
 
 if __name__ == "__main__":
-    # Sunucuyu stdio transport ile başlat
-    mcp.run(transport="stdio")
\ No newline at end of file
+    # Varsayılan olarak stdio, --transport streamable-http ile HTTP üzerinden başlat
+    run_server(mcp, "Math MCP sunucusu")
\ No newline at end of file
@@ -1,7 +1,32 @@
 import asyncio
+import base64
+import json
+import math
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+import httpx
 import pytest
+import mcp.types as types
 from mcp import ClientSession, StdioServerParameters
+from mcp.server.fastmcp import FastMCP
 from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamable_http_client
+
+from batch_client import BatchClientSession
+from http_compression import negotiate
+from json_codec import OrjsonCodec, get_codec
+from deadline_client import DeadlineClientSession
+from session_pool import SessionPool
+from static_resources import static_resources
+from stdio_transport import stdio_client as codec_stdio_client
+from uds_transport import uds_client
 
 
 # ==================== GREETING SERVER TESTS ====================
@@ -296,5 +321,957 @@ async def test_all_tools_available():
             print("✓ Both addition and multiplication tools are available")
 
 
+@pytest.mark.asyncio
+async def test_add_batch_tool():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # Ragged input, including an empty list
+            result = await session.call_tool("add_batch", {"batches": [[15, 27], [], [1.5, 2.5, 3], [-10]]})
+            assert result.structuredContent["result"] == [42, 0, 7, -10]
+            print(f"✓ Batch addition: {result.structuredContent['result']}")
+
+
+@pytest.mark.asyncio
+async def test_multiply_batch_tool():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            result = await session.call_tool("multiply_batch", {"batches": [[8, 12], [], [2.5, 4], [100, 0]]})
+            assert result.structuredContent["result"] == [96, 1, 10, 0]
+            
+            empty = await session.call_tool("multiply_batch", {"batches": [[], []]})
+            assert empty.structuredContent["result"] == [1, 1]
+            print(f"✓ Batch multiplication: {result.structuredContent['result']}")
+
+
+@pytest.mark.asyncio
+async def test_packed_b64_input():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            floats_b64 = base64.b64encode(struct.pack("<3d", 1.5, 2.5, 4.0)).decode()
+            add_result = await session.call_tool("add", {"numbers_b64": floats_b64})
+            assert add_result.structuredContent["result"] == 8.0
+            
+            ints_b64 = base64.b64encode(struct.pack("<3q", 7, 8, -2)).decode()
+            mult_result = await session.call_tool("multiply", {"numbers_b64": ints_b64, "dtype": "int64"})
+            assert mult_result.structuredContent["result"] == -112
+            
+            # Both forms at once, or a truncated buffer, are rejected
+            both = await session.call_tool("add", {"numbers": [1], "numbers_b64": floats_b64})
+            assert both.isError
+            truncated = base64.b64encode(b"\x00" * 7).decode()
+            bad = await session.call_tool("add", {"numbers_b64": truncated})
+            assert bad.isError
+            print("✓ Packed b64 input works for float64 and int64")
+
+
+@pytest.mark.asyncio
+async def test_streaming_accumulator():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # Sum folded over several chunks
+            handle = (await session.call_tool("acc_open", {"op": "sum"})).structuredContent["result"]
+            await session.call_tool("acc_push", {"handle": handle, "chunk": [10, 20]})
+            floats_b64 = base64.b64encode(struct.pack("<2d", 30.5, 0.5)).decode()
+            pushed = await session.call_tool("acc_push", {"handle": handle, "chunk_b64": floats_b64})
+            assert pushed.structuredContent["result"] == 4
+            total = await session.call_tool("acc_close", {"handle": handle})
+            assert total.structuredContent["result"] == 61
+            
+            # A closed handle can no longer be used
+            closed = await session.call_tool("acc_push", {"handle": handle, "chunk": [1]})
+            assert closed.isError
+            
+            handle = (await session.call_tool("acc_open", {"op": "prod"})).structuredContent["result"]
+            await session.call_tool("acc_push", {"handle": handle, "chunk": [2, 3]})
+            await session.call_tool("acc_push", {"handle": handle, "chunk": [7]})
+            product = await session.call_tool("acc_close", {"handle": handle})
+            assert product.structuredContent["result"] == 42
+            print("✓ Streaming accumulator folds chunks for sum and prod")
+
+
+@pytest.mark.asyncio
+async def test_accumulator_session_scope_and_expiry():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env={"MATH_ACC_IDLE_TIMEOUT": "0.5"}
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            handle = (await session.call_tool("acc_open", {"op": "sum"})).structuredContent["result"]
+            await asyncio.sleep(1)
+            expired = await session.call_tool("acc_push", {"handle": handle, "chunk": [1]})
+            assert expired.isError
+    
+    # A handle from one session is not visible to another server session
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            foreign = await session.call_tool("acc_close", {"handle": handle})
+            assert foreign.isError
+            print("✓ Accumulator handles are session scoped and expire when idle")
+
+
+@pytest.mark.asyncio
+async def test_accumulator_limit_per_session():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env={"MATH_ACC_MAX_PER_SESSION": "3"}
+    )
+
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+
+            handles = [(await session.call_tool("acc_open", {})).structuredContent["result"] for _ in range(3)]
+            refused = await session.call_tool("acc_open", {})
+            assert refused.isError and "acc_close" in refused.content[0].text
+
+            # Closing a handle frees a slot
+            await session.call_tool("acc_close", {"handle": handles[0]})
+            reopened = await session.call_tool("acc_open", {})
+            assert not reopened.isError
+            print("✓ Accumulator handles are capped per session")
+
+
+@pytest.mark.asyncio
+async def test_evaluate_tool():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # (10 + 5) * 3 in a single request
+            result = await session.call_tool("evaluate", {"expression": "(10 + 5) * 3"})
+            assert result.structuredContent["result"] == 45
+            
+            dag = {
+                "nodes": {
+                    "sum": {"op": "add", "args": [10, 5]},
+                    "product": {"op": "multiply", "args": ["sum", 3]},
+                },
+                "output": "product",
+            }
+            dag_result = await session.call_tool("evaluate", {"dag": dag})
+            assert dag_result.structuredContent["result"] == 45
+            
+            # Anything but arithmetic on numbers is rejected
+            unsafe = await session.call_tool("evaluate", {"expression": "__import__('os')"})
+            assert unsafe.isError
+            cyclic = {"nodes": {"a": {"op": "add", "args": ["a"]}}, "output": "a"}
+            cycle_result = await session.call_tool("evaluate", {"dag": cyclic})
+            assert cycle_result.isError
+            
+            # Integer results beyond float range and non-scalar DAG args give clear errors
+            huge = "1" + "0" * 400
+            for arguments in (
+                {"expression": f"{huge} * 2"},
+                {"expression": f"{huge} / 3"},
+                {"dag": {"nodes": {"big": {"op": "multiply", "args": [int(huge), 2]}}, "output": "big"}},
+            ):
+                overflow = await session.call_tool("evaluate", arguments)
+                assert overflow.isError and "float aralığını aşıyor" in overflow.content[0].text
+            for args in ([[1, 2]], [{"a": 1}], [None], "ab"):
+                bad = {"nodes": {"a": {"op": "add", "args": args}}, "output": "a"}
+                bad_result = await session.call_tool("evaluate", {"dag": bad})
+                assert bad_result.isError
+                assert "Geçersiz argüman" in bad_result.content[0].text or "bir liste" in bad_result.content[0].text
+            
+            # A chain that squares the previous node fails fast instead of growing exact integers
+            chain = {f"n{i + 1}": {"op": "multiply", "args": [f"n{i}", f"n{i}"]} for i in range(40)}
+            chain["n0"] = {"op": "add", "args": [3]}
+            started = time.monotonic()
+            squared = await session.call_tool("evaluate", {"dag": {"nodes": chain, "output": "n40"}})
+            assert squared.isError and "float aralığını aşıyor" in squared.content[0].text
+            assert time.monotonic() - started < 2
+            
+            # Wrong-typed fields give the tool's own message, not a TypeError
+            for bad in ({"nodes": 5, "output": "a"}, {"nodes": {"a": {"op": "add", "args": [1]}}, "output": ["a"]}):
+                bad_result = await session.call_tool("evaluate", {"dag": bad})
+                assert bad_result.isError and "'nodes' sözlüğü" in bad_result.content[0].text
+            
+            # Surrounding whitespace is fine and long expressions are not echoed in full
+            result = await session.call_tool("evaluate", {"expression": "  (10 + 5) * 3  "})
+            assert result.structuredContent["result"] == 45
+            invalid = await session.call_tool("evaluate", {"expression": "(" * 5000 + "1 +"})
+            assert invalid.isError and len(invalid.content[0].text) < 300
+            print("✓ evaluate computes (10 + 5) * 3 = 45 in one request")
+
+
+@pytest.mark.asyncio
+async def test_exact_integer_tools():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # Exact where float multiplication would round
+            result = await session.call_tool("multiply_exact", {"numbers": [999999999999, 888888888888, 777777777777]})
+            assert int(result.structuredContent["result"], 0) == 999999999999 * 888888888888 * 777777777777
+            
+            # Large results come back as hex and still parse with int(text, 0)
+            result = await session.call_tool("factorial", {"n": 3000})
+            assert int(result.structuredContent["result"], 0) == math.factorial(3000)
+            
+            result = await session.call_tool("power_mod", {"base": 3, "exponent": 200, "modulus": 1000007})
+            assert int(result.structuredContent["result"], 0) == pow(3, 200, 1000007)
+            
+            result = await session.call_tool("lcm_many", {"numbers": [4, 6, 10, 15]})
+            assert result.structuredContent["result"] == "60"
+            
+            result = await session.call_tool("gcd_many", {"numbers": [12, 18, 30]})
+            assert result.structuredContent["result"] == "6"
+            
+            too_big = await session.call_tool("factorial", {"n": 10**9})
+            assert too_big.isError
+            too_big = await session.call_tool("power_mod", {"base": 3, "exponent": 1 << 9000, "modulus": 7})
+            assert too_big.isError and "bit" in too_big.content[0].text
+            print("✓ Exact integer tools return exact results")
+
+
+@pytest.mark.asyncio
+async def test_small_requests_not_blocked_by_large_ones():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # Baseline latency of a small call while the server is idle
+            start = time.perf_counter()
+            await session.call_tool("add", {"numbers": [1, 2]})
+            idle_latency = time.perf_counter() - start
+            
+            # factorial(200000) is above the process threshold and takes about a second
+            large = asyncio.create_task(session.call_tool("factorial", {"n": 200_000}))
+            await asyncio.sleep(0.1)
+            
+            start = time.perf_counter()
+            small = await session.call_tool("add", {"numbers": [15, 27]})
+            busy_latency = time.perf_counter() - start
+            
+            assert small.structuredContent["result"] == 42
+            assert not large.done(), "small request should finish while the large one is still running"
+            assert busy_latency < idle_latency + 0.5
+            
+            result = await large
+            assert int(result.structuredContent["result"], 0) == math.factorial(200_000)
+            print(f"✓ Small request latency: idle {idle_latency * 1e3:.1f} ms, busy {busy_latency * 1e3:.1f} ms")
+
+
+@pytest.mark.asyncio
+async def test_logging_keeps_stdout_clean():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env={"MATH_LOG_SAMPLING": "multiply=0"}
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # A large list used to be echoed to stdout and corrupt the JSON-RPC stream
+            numbers = list(range(200_000))
+            result = await session.call_tool("add", {"numbers": numbers})
+            assert result.structuredContent["result"] == sum(numbers)
+            await session.call_tool("multiply", {"numbers": [2, 3]})
+            
+            # The ring buffer is filled by a background thread
+            entries = []
+            for _ in range(20):
+                response = await session.read_resource("resource://logs/recent")
+                entries = json.loads(response.contents[0].text)
+                if entries:
+                    break
+                await asyncio.sleep(0.05)
+            
+            assert [entry["tool"] for entry in entries] == ["add"]
+            assert entries[0]["message"].endswith("numbers=[0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, ...]")
+            print(f"✓ Recent log entries: {entries}")
+
+
+def test_keep_alive_rejects_sub_second_values():
+    # uvicorn takes whole seconds; anything below 1 would silently disable keep-alive
+    for value in ("0.5", "0"):
+        result = subprocess.run(
+            [sys.executable, "math_server_dynamic.py", "--transport", "streamable-http", "--keep-alive", value],
+            capture_output=True, text=True, timeout=30,
+        )
+        assert result.returncode == 2 and "--keep-alive" in result.stderr
+    print("✓ --keep-alive rejects values below one second")
+
+
+@pytest.fixture
+def http_math_server():
+    """Starts one long-lived math server over streamable HTTP and yields its URL."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "math_server_dynamic.py", "--transport", "streamable-http", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        yield f"http://127.0.0.1:{port}/mcp"
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_streamable_http_shared_server(http_math_server):
+    # Two client sessions share the same server process
+    async with streamable_http_client(http_math_server) as (read1, write1, _):
+        async with ClientSession(read1, write1) as first:
+            await first.initialize()
+            async with streamable_http_client(http_math_server) as (read2, write2, _):
+                async with ClientSession(read2, write2) as second:
+                    await second.initialize()
+                    
+                    result = await first.call_tool("add", {"numbers": [15, 27]})
+                    assert result.structuredContent["result"] == 42
+                    result = await second.call_tool("multiply", {"numbers": [8, 12]})
+                    assert result.structuredContent["result"] == 96
+                    
+                    # Accumulator handles stay private to the session that opened them
+                    handle = (await first.call_tool("acc_open", {"op": "sum"})).structuredContent["result"]
+                    foreign = await second.call_tool("acc_push", {"handle": handle, "chunk": [1]})
+                    assert foreign.isError
+                    await first.call_tool("acc_push", {"handle": handle, "chunk": [1, 2]})
+                    total = await first.call_tool("acc_close", {"handle": handle})
+                    assert total.structuredContent["result"] == 3
+                    print("✓ Two HTTP sessions share one math server process")
+
+
+@pytest.fixture
+def uds_math_server(tmp_path):
+    """Starts one long-lived math server on a Unix domain socket and yields its path."""
+    socket_path = str(tmp_path / "math.sock")
+    process = subprocess.Popen(
+        [sys.executable, "math_server_dynamic.py", "--transport", "uds", "--socket", socket_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                with socket.socket(socket.AF_UNIX) as sock:
+                    sock.connect(socket_path)
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        yield socket_path
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_uds_concurrent_sessions(uds_math_server):
+    async def session_sum(offset):
+        async with uds_client(uds_math_server) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                handle = (await session.call_tool("acc_open", {"op": "sum"})).structuredContent["result"]
+                await session.call_tool("acc_push", {"handle": handle, "chunk": [offset, 1, 2]})
+                result = await session.call_tool("acc_close", {"handle": handle})
+                return result.structuredContent["result"]
+    
+    # Several sessions run against the same server process at once
+    totals = await asyncio.gather(*(session_sum(offset) for offset in range(8)))
+    assert totals == [offset + 3 for offset in range(8)]
+    
+    # Large payloads span many socket reads and must be reassembled into one message
+    values = list(range(200_000))
+    async with uds_client(uds_math_server) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.call_tool("add", {"numbers": values})
+            assert result.structuredContent["result"] == sum(values)
+    print("✓ Eight concurrent UDS sessions share one math server process")
+
+
+def test_uds_socket_is_not_taken_over(uds_math_server, tmp_path):
+    # A second server on the same path refuses to start instead of unlinking the live socket
+    second = subprocess.run(
+        [sys.executable, "math_server_dynamic.py", "--transport", "uds", "--socket", uds_math_server],
+        capture_output=True, text=True, timeout=30,
+    )
+    assert second.returncode != 0 and "already listening" in second.stderr
+    assert stat.S_IMODE(os.stat(uds_math_server).st_mode) == 0o600
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(uds_math_server)
+    
+    # Only stale sockets are removed; other files are left alone
+    import socket_paths
+    stale = str(tmp_path / "stale.sock")
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.bind(stale)
+    socket_paths.claim_socket_path(stale)
+    assert not os.path.exists(stale)
+    plain = tmp_path / "plain.sock"
+    plain.write_text("")
+    with pytest.raises(FileExistsError):
+        socket_paths.claim_socket_path(str(plain))
+    
+    # The default path lives in a per-user directory
+    from uds_transport import default_socket_path
+    directory = os.path.dirname(default_socket_path(FastMCP("uds-test")))
+    assert directory != tempfile.gettempdir() and directory == socket_paths.private_dir()
+    print("✓ UDS servers keep their socket private and never take over a live one")
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reuses_and_respawns():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    key = "python math_server_dynamic.py"
+    
+    with open(os.devnull, "w") as errlog:
+        async with SessionPool(min_size=1, max_size=2, health_check_interval=None, errlog=errlog) as pool:
+            # Sequential requests reuse one warm server process
+            for value in range(3):
+                async with pool.session(server_params) as session:
+                    result = await session.call_tool("add", {"numbers": [value, 1]})
+                    assert result.structuredContent["result"] == value + 1
+            assert pool.stats()[key]["spawned"] == 1
+            assert pool.stats()[key]["reused"] == 2
+            
+            # Concurrent requests never start more than max_size servers
+            async def borrow(value):
+                async with pool.session(server_params) as session:
+                    await asyncio.sleep(0.05)
+                    result = await session.call_tool("multiply", {"numbers": [value, 2]})
+                    return result.structuredContent["result"]
+            
+            assert await asyncio.gather(*(borrow(value) for value in range(6))) == [v * 2 for v in range(6)]
+            assert pool.stats()[key]["spawned"] == 2
+            
+            # Killed servers fail the health check and are replaced
+            subprocess.run(["pkill", "-P", str(os.getpid()), "-f", "math_server_dynamic.py"], check=True)
+            await asyncio.sleep(0.5)
+            await pool.check_health()
+            stats = pool.stats()[key]
+            assert stats["discarded"] == 2
+            assert stats["respawned"] == 1
+            assert stats["idle"] == 1
+            async with pool.session(server_params) as session:
+                result = await session.call_tool("add", {"numbers": [20, 22]})
+                assert result.structuredContent["result"] == 42
+    print("✓ Session pool reuses warm servers and respawns dead ones")
+
+
+@pytest.mark.asyncio
+async def test_batched_requests():
+    server_params = StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None)
+    
+    async with codec_stdio_client(server_params) as (read, write):
+        async with BatchClientSession(read, write) as session:
+            await session.initialize()
+            
+            # Responses are matched by id and returned in request order
+            uris = ["resource://greet", "resource://farewell"] * 250
+            results = await session.read_resources(uris, max_in_flight=64)
+            assert [("Hello" in r.contents[0].text) for r in results] == [uri.endswith("greet") for uri in uris]
+            
+            # Failures can be returned in place instead of aborting the batch
+            mixed = await session.read_resources(
+                ["resource://greet", "resource://invalid", "resource://farewell"], return_exceptions=True
+            )
+            assert "Hello" in mixed[0].contents[0].text
+            assert isinstance(mixed[1], Exception)
+            assert "Hello" not in mixed[2].contents[0].text
+            with pytest.raises(Exception):
+                await session.read_resources(["resource://greet", "resource://invalid"])
+            
+            # Tool batches keep order as well; unknown tools are reported as errors
+            tool_results = await session.call_tools([("missing_a", {}), ("missing_b", {})])
+            assert [r.isError for r in tool_results] == [True, True]
+            assert "missing_b" in tool_results[1].content[0].text
+    
+    # The framing is UTF-8 only
+    latin = StdioServerParameters(command="python", args=["greeting_mcp_server.py"], encoding="latin-1")
+    with pytest.raises(ValueError):
+        async with codec_stdio_client(latin):
+            pass
+    print("✓ Batched reads returned 500 results in order")
+
+
+@pytest.mark.asyncio
+async def test_gateway_namespaces():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["gateway_server.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # One handshake exposes all mounted servers under their namespaces
+            tool_names = {tool.name for tool in (await session.list_tools()).tools}
+            assert {"math.add", "math.acc_open", "hello.greet"} <= tool_names
+            uris = {str(resource.uri) for resource in (await session.list_resources()).resources}
+            assert {"greeting+resource://greet", "greeting+resource://farewell", "hello+resource://info"} <= uris
+            
+            greet = await session.read_resource("greeting+resource://greet")
+            assert greet.contents[0].text == "Hello! Welcome to the Greeting Server."
+            info = await session.read_resource("hello+resource://info")
+            assert info.contents[0].text == "This is a static resource from my MCP server."
+            
+            result = await session.call_tool("math.add", {"numbers": [15, 27]})
+            assert result.structuredContent["result"] == 42
+            result = await session.call_tool("hello.greet", {"name": "Basak"})
+            assert result.content[0].text == "Hello, Basak! Welcome to MCP."
+            
+            # Session-scoped tools still see the gateway session
+            handle = (await session.call_tool("math.acc_open", {"op": "prod"})).structuredContent["result"]
+            await session.call_tool("math.acc_push", {"handle": handle, "chunk": [6, 7]})
+            total = await session.call_tool("math.acc_close", {"handle": handle})
+            assert total.structuredContent["result"] == 42
+            
+            # Unknown namespaces are reported, not forwarded
+            assert (await session.call_tool("unknown.add", {"numbers": [1]})).isError
+            with pytest.raises(Exception):
+                await session.read_resource("unknown+resource://greet")
+    print("✓ Gateway serves greeting, math and hello-world behind one connection")
+
+
+@pytest.mark.asyncio
+async def test_orjson_codec_stdio():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    # The client forwards MCP_JSON_CODEC, so the server frames with orjson as well
+    async with codec_stdio_client(server_params, codec=OrjsonCodec()) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            values = [i * 0.5 for i in range(50_000)]
+            result = await session.call_tool("add", {"numbers": values})
+            assert result.structuredContent["result"] == sum(values)
+            
+            # Integers beyond 64 bits fall back to the pydantic parser on both sides
+            big = 2**80 + 1
+            result = await session.call_tool("multiply_exact", {"numbers": [big, 3]})
+            assert int(result.structuredContent["result"], 0) == big * 3
+            
+            logs = await session.read_resource("resource://logs/recent")
+            assert json.loads(logs.contents[0].text)
+    
+    assert get_codec("pydantic").name == "pydantic"
+    with pytest.raises(ValueError):
+        get_codec("msgpack")
+    print("✓ orjson codec round-trips small, large and big-integer messages")
+
+
+@pytest.mark.asyncio
+async def test_http_response_compression(http_math_server):
+    headers = {"Accept": "application/json, text/event-stream", "Accept-Encoding": "gzip"}
+    batches = [[float(i), 0.5] for i in range(20_000)]
+    
+    async with httpx.AsyncClient(headers=headers, timeout=30) as client:
+        init = await client.post(http_math_server, json={
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "test", "version": "1"}},
+        })
+        session_headers = {"mcp-session-id": init.headers["mcp-session-id"], "mcp-protocol-version": "2025-06-18"}
+        # SSE streams are compressed from the first byte; small plain responses are not
+        assert init.headers["content-type"].startswith("text/event-stream")
+        assert init.headers["content-encoding"] == "gzip"
+        initialized = await client.post(http_math_server, headers=session_headers,
+                                        json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+        assert "content-encoding" not in initialized.headers
+        
+        # The idle notification stream must not hold its headers back until the first event
+        started = time.monotonic()
+        async with client.stream("GET", http_math_server, headers={**session_headers, "Accept": "text/event-stream"}) as stream:
+            assert stream.status_code == 200 and stream.headers["content-encoding"] == "gzip"
+            assert time.monotonic() - started < 2
+        
+        async with client.stream("POST", http_math_server, headers=session_headers, json={
+            "jsonrpc": "2.0", "id": 2, "method": "tools/call",
+            "params": {"name": "add_batch", "arguments": {"batches": batches}},
+        }) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            body = b"".join([chunk async for chunk in response.aiter_bytes()])
+            wire_bytes = response.num_bytes_downloaded
+        assert wire_bytes * 3 < len(body)
+        payload = json.loads(body.decode().split("data: ", 1)[1])
+        assert payload["result"]["structuredContent"]["result"][:3] == [0.5, 1.5, 2.5]
+    
+    # The SDK client decompresses transparently
+    async with streamable_http_client(http_math_server) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.call_tool("add_batch", {"batches": batches})
+            assert result.structuredContent["result"][-1] == 19_999.5
+    
+    # Negotiation honours q-values and the server's preference order
+    assert negotiate("gzip, deflate", ("zstd", "gzip")) == "gzip"
+    assert negotiate("gzip;q=0.5, zstd", ("zstd", "gzip")) == "zstd"
+    assert negotiate("gzip;q=0, *;q=1", ("gzip",)) is None
+    assert negotiate("identity", ("gzip",)) is None
+    print(f"✓ Large HTTP response compressed from {len(body)} to {wire_bytes} bytes")
+
+
+@pytest.fixture
+def zygote(tmp_path):
+    """Starts a zygote that preloads the math and greeting servers; yields (socket path, log path)."""
+    socket_path = str(tmp_path / "zygote.sock")
+    log_path = tmp_path / "zygote.log"
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(
+            [sys.executable, "zygote.py", "serve", "--socket", socket_path,
+             "math_server_dynamic.py", "greeting_mcp_server.py"],
+            stdout=subprocess.DEVNULL,
+            stderr=log,
+        )
+    try:
+        deadline = time.monotonic() + 30
+        while not os.path.exists(socket_path):
+            assert process.poll() is None, log_path.read_text()
+            assert time.monotonic() < deadline, "zygote did not start"
+            time.sleep(0.1)
+        yield socket_path, log_path
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_zygote_forks_stdio_sessions(zygote, tmp_path):
+    socket_path, log_path = zygote
+    
+    def zygote_params(script, socket_path):
+        return StdioServerParameters(
+            command="python",
+            args=["zygote.py", "run", script],
+            env={"ZYGOTE_SOCKET": socket_path}
+        )
+    
+    async def session_sum(offset):
+        async with stdio_client(zygote_params("math_server_dynamic.py", socket_path)) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                handle = (await session.call_tool("acc_open", {"op": "sum"})).structuredContent["result"]
+                await session.call_tool("acc_push", {"handle": handle, "chunk": [offset, 1, 2]})
+                result = await session.call_tool("acc_close", {"handle": handle})
+                return result.structuredContent["result"]
+    
+    # Each session gets its own forked server process with its own state
+    totals = await asyncio.gather(*(session_sum(offset) for offset in range(3)))
+    assert totals == [offset + 3 for offset in range(3)]
+    
+    async with stdio_client(zygote_params("greeting_mcp_server.py", socket_path)) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.read_resource("resource://greet")
+            assert "Greeting Server" in result.contents[0].text
+    
+    log = log_path.read_text()
+    assert log.count("forked") == 4
+    assert "forked" in log and "greeting_mcp_server.py" in log
+    
+    # Without a running zygote the launcher falls back to a normal cold start
+    missing = str(tmp_path / "missing.sock")
+    async with stdio_client(zygote_params("math_server_dynamic.py", missing)) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.call_tool("add", {"numbers": [2, 3]})
+            assert result.structuredContent["result"] == 5
+    assert log_path.read_text().count("forked") == 4
+    print("✓ Zygote forks one server per stdio session and falls back to cold start")
+
+
+def test_zygote_socket_is_private(tmp_path, monkeypatch):
+    import socket_paths
+    import zygote as zygote_module
+    
+    # The default socket lives in a per-user directory, never in the shared temp dir
+    monkeypatch.delenv("ZYGOTE_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    path = zygote_module.default_socket_path()
+    assert path != os.path.join(tempfile.gettempdir(), "mcp-zygote.sock")
+    assert str(os.getuid()) in os.path.dirname(path)
+    
+    # XDG_RUNTIME_DIR is only used when it is private to this user
+    runtime = tmp_path / "runtime"
+    runtime.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+    assert zygote_module.default_socket_path() == str(runtime / "mcp-zygote.sock")
+    runtime.chmod(0o755)
+    assert zygote_module.default_socket_path() != str(runtime / "mcp-zygote.sock")
+    
+    # A socket file owned by this user is trusted, a regular file is not
+    assert not socket_paths.owned_socket(str(tmp_path / "missing.sock"))
+    (tmp_path / "plain").write_text("")
+    assert not socket_paths.owned_socket(str(tmp_path / "plain"))
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(tmp_path / "z.sock"))
+    listener.listen(1)
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(str(tmp_path / "z.sock"))
+    conn, _ = listener.accept()
+    assert socket_paths.owned_socket(str(tmp_path / "z.sock"))
+    assert zygote_module._peer_uid(client) == zygote_module._peer_uid(conn) == os.getuid()
+    for sock in (conn, client, listener):
+        sock.close()
+    
+    # Only the difference from the zygote's environment is sent
+    delta = zygote_module.env_delta({"HOME": "/h", "SECRET": "x", "PATH": "/a"}, {"HOME": "/h", "PATH": "/b", "NEW": "1"})
+    assert delta == {"set": {"PATH": "/b", "NEW": "1"}, "unset": ["SECRET"]}
+    print("✓ Zygote socket is per-user, peers are verified and only the env delta is sent")
+
+
+def test_stdio_server_defers_unused_imports():
+    # Importing a server must not load the mcp client side, httpx or jsonschema ...
+    probe = (
+        "import sys, greeting_mcp_server\n"
+        "loaded = lambda name: name in sys.modules and '__deferred_exec__' not in vars(sys.modules[name])\n"
+        "print([name for name in ('mcp', 'mcp.client.session', 'httpx', 'jsonschema') if loaded(name)])\n"
+        # ... while they still load normally on first use
+        "import mcp, httpx\n"
+        "print(mcp.ClientSession.__name__, httpx.codes.REQUEST_TIMEOUT)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines() == ["[]", "ClientSession 408"]
+    print("✓ Greeting server starts without the mcp client side, httpx or jsonschema")
+
+
+def test_process_pool_workers_skip_server_script(tmp_path):
+    # spawn workers must not re-run the script that created the pool (the server)
+    script = tmp_path / "server_like.py"
+    script.write_text(
+        "import asyncio, sys\n"
+        f"sys.path.insert(0, {os.getcwd()!r})\n"
+        "from execution import ToolExecutor\n"
+        "print('module run as', __name__, flush=True)\n"
+        "async def main():\n"
+        "    print(await ToolExecutor(max_workers=1).run('process', sorted, [2, 1]), flush=True)\n"
+        "if __name__ == '__main__':\n"
+        "    asyncio.run(main())\n"
+    )
+    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, check=True, timeout=60)
+    assert result.stdout.splitlines() == ["module run as __main__", "[1, 2]"]
+    print("✓ Process pool workers start without importing the server script")
+
+
+@pytest.mark.asyncio
+async def test_static_resources_match_function_resources(tmp_path):
+    async def snapshot(session):
+        await session.initialize()
+        listed = (await session.list_resources()).resources
+        reads = await asyncio.gather(*(
+            session.read_resource(uri) for uri in ["resource://greet", "resource://farewell"] * 20
+        ))
+        return listed, reads
+    
+    # The same server with static resources switched off is the reference
+    results = []
+    for env in ({"MCP_STATIC_RESOURCES": "0"}, None):
+        server_params = StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=env)
+        async with stdio_client(server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                results.append(await snapshot(session))
+    assert results[0] == results[1]
+    assert results[1][1][0].contents[0].text == "Hello! Welcome to the Greeting Server."
+    
+    # Over a Unix socket the fast path shares the connection with regular requests
+    socket_path = str(tmp_path / "greeting.sock")
+    process = subprocess.Popen(
+        [sys.executable, "greeting_mcp_server.py", "--transport", "uds", "--socket", socket_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 15
+        while not os.path.exists(socket_path):
+            assert time.monotonic() < deadline
+            time.sleep(0.1)
+        async with uds_client(socket_path) as (read, write):
+            async with ClientSession(read, write) as session:
+                assert await snapshot(session) == results[0]
+                with pytest.raises(Exception):
+                    await session.read_resource("resource://invalid")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    print("✓ Static resources return the same responses as function resources")
+
+
+def test_static_resource_response_bytes():
+    server = FastMCP("static-test")
+    static = static_resources(server)
+    
+    @static.resource("resource://motd")
+    def motd() -> str:
+        return "Merhaba dünya"
+    
+    respond = static.responder()
+    request = b'{"jsonrpc":"2.0","id":"a-1","method":"resources/read","params":{"uri":"resource://motd"}}'
+    # Requests before the session is initialized always reach the session
+    assert respond(request) is None
+    assert respond(b'{"jsonrpc":"2.0","method":"notifications/initialized"}') is None
+    
+    # The cached bytes equal what the session would write, with the request id spliced in
+    expected = get_codec("pydantic").encode(types.JSONRPCMessage(types.JSONRPCResponse(
+        jsonrpc="2.0",
+        id="a-1",
+        result={"contents": [{"uri": "resource://motd", "mimeType": "text/plain", "text": "Merhaba dünya"}]},
+    ))) + b"\n"
+    assert respond(request) == expected
+    assert respond(request.replace(b'"a-1"', b"42")).startswith(b'{"jsonrpc":"2.0","id":42,"result":')
+    
+    # Anything else is left to the session
+    assert respond(request.replace(b"motd", b"other")) is None
+    assert respond(request.replace(b'"a-1"', b"true")) is None
+    assert respond(b'{"jsonrpc":"2.0","id":1,"method":"tools/list"}') is None
+    assert respond(b'{"jsonrpc":"2.0","id":2,"method":"resources/read","params":{"uri":["x"]}}') is None
+    assert respond(b'{"jsonrpc":"2.0","id":3,"method":"resources/read","params":{"uri":{"a":1}}}') is None
+    print("✓ Static resource responses are spliced from pre-serialized bytes")
+
+
+@pytest.mark.asyncio
+async def test_deadlines_abort_executor_work():
+    server_params = StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None)
+    # Above the process threshold; the full product takes a couple of seconds
+    numbers = list(range(1, 150_000))
+    
+    async with stdio_client(server_params) as (read, write):
+        async with DeadlineClientSession(read, write) as session:
+            await session.initialize()
+            
+            async def stats_once_idle():
+                deadline = time.monotonic() + 1.0
+                while True:
+                    response = await session.read_resource("resource://executor/stats")
+                    stats = json.loads(response.contents[0].text)
+                    if stats["running"] == 0 or time.monotonic() > deadline:
+                        return stats
+                    await asyncio.sleep(0.02)
+            
+            # Calls that finish in time are counted as completed (this also starts the process pool)
+            result = await session.call_tool(
+                "multiply_exact", {"numbers": list(range(1, 6_000))}, read_timeout_seconds=timedelta(seconds=30)
+            )
+            assert int(result.structuredContent["result"], 0) == math.factorial(5_999)
+            stats = await stats_once_idle()
+            assert stats["completed"] == 1 and stats["aborted"] == 0
+            
+            # A deadline sent in _meta stops the computation on the server
+            result = await session.call_tool("multiply_exact", {"numbers": numbers}, meta={"timeoutMs": 200})
+            assert result.isError and "Süre sınırı" in result.content[0].text
+            stats = await stats_once_idle()
+            assert stats["deadline_exceeded"] == 1 and stats["running"] == 0
+            
+            # A client-side timeout sends notifications/cancelled
+            with pytest.raises(Exception):
+                await session.call_tool(
+                    "multiply_exact", {"numbers": numbers}, read_timeout_seconds=timedelta(seconds=0.2)
+                )
+            stats = await stats_once_idle()
+            assert stats["aborted"] == 2 and stats["running"] == 0
+            
+            # So does a caller that gives up on the task
+            task = asyncio.create_task(session.call_tool("multiply_exact", {"numbers": numbers}))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            stats = await stats_once_idle()
+            assert stats["aborted"] == 3 and stats["running"] == 0 and stats["completed"] == 1
+            
+            # Small inline calls are counted whether they arrive as a list or a raw buffer
+            await session.call_tool("add", {"numbers": [1, 2]})
+            await session.call_tool("multiply", {"numbers": [2, 3]})
+            buffer = base64.b64encode(struct.pack("<2d", 2, 3)).decode()
+            await session.call_tool("add", {"numbers_b64": buffer})
+            await session.call_tool("gcd_many", {"numbers": [12, 18]})
+            handle = (await session.call_tool("acc_open", {"op": "sum"})).structuredContent["result"]
+            await session.call_tool("acc_push", {"handle": handle, "chunk": [1, 2]})
+            await session.call_tool("evaluate", {"expression": "1 + 2"})
+            stats = await stats_once_idle()
+            assert stats["completed"] == 7
+            
+            # Large modular powers leave the event loop and honour the deadline
+            big = {"base": 3 ** 5000, "exponent": (1 << 8192) - 1, "modulus": (1 << 8191) - 1}
+            started = time.monotonic()
+            result = await session.call_tool("power_mod", big, meta={"timeoutMs": 100})
+            assert result.isError and "Süre sınırı" in result.content[0].text
+            assert time.monotonic() - started < 1
+            assert (await stats_once_idle())["deadline_exceeded"] == 2
+    print(f"✓ Deadlines and cancellation stopped executor work: {stats}")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
@@ -0,0 +1,87 @@
+import argparse
+
+from mcp.server.fastmcp import FastMCP
+
+from json_codec import CODECS, PydanticCodec, get_codec
+from static_resources import fast_path
+
+TRANSPORTS = ("stdio", "streamable-http", "uds")
+_LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--transport", choices=TRANSPORTS, default="stdio",
+                        help="stdio (varsayılan), paylaşılan uzun ömürlü sunucu için streamable-http "
+                             "veya aynı makinedeki istemciler için uds (Unix domain soketi)")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP dinleme adresi")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP dinleme portu")
+    parser.add_argument("--keep-alive", type=int, default=75,
+                        help="Boşta kalan HTTP bağlantılarının açık tutulacağı süre (tam saniye, en az 1)")
+    parser.add_argument("--compression-threshold", type=int, default=1024,
+                        help="HTTP yanıtlarının sıkıştırılacağı en küçük boyut (bayt)")
+    parser.add_argument("--no-compression", action="store_true",
+                        help="HTTP yanıt sıkıştırmasını (gzip/zstd) kapatır")
+    parser.add_argument("--codec", choices=CODECS, default=None,
+                        help="stdio ve uds çerçevelemesinde kullanılacak JSON codec (varsayılan: MCP_JSON_CODEC veya pydantic)")
+    parser.add_argument("--socket", default=None,
+                        help="uds transport için soket dosyası (varsayılan: $XDG_RUNTIME_DIR/<sunucu-adı>.sock "
+                             "veya geçici dizinde kullanıcıya özel mcp-<uid>/<sunucu-adı>.sock)")
+    args = parser.parse_args()
+    if args.keep_alive < 1:
+        # uvicorn süreyi tam saniye alır; 0 keep-alive'ı fiilen kapatır
+        parser.error("--keep-alive en az 1 saniye olmalıdır")
+    return args
+
+
+def run_server(mcp: FastMCP, description: str) -> None:
+    """
+    Sunucuyu komut satırında seçilen transport ile başlatır. stdio her istemci için
+    ayrı bir süreç demektir; streamable-http ile birçok istemci tek bir uzun ömürlü
+    süreci paylaşır ve bağlantılar keep-alive ile yeniden kullanılır. uds da tek
+    süreci paylaştırır, ancak HTTP katmanı olmadan stdio ile aynı satır çerçevelemesini kullanır.
+    """
+    args = parse_args(description)
+    codec = get_codec(args.codec)
+    if args.transport == "stdio":
+        # Statik kaynakların hızlı yolu kendi çerçevelememizde çalışır
+        if codec.name == PydanticCodec.name and fast_path(mcp) is None:
+            mcp.run(transport="stdio")
+            return
+        import anyio
+
+        from stdio_transport import serve_stdio
+
+        anyio.run(serve_stdio, mcp, codec)
+        return
+    if args.transport == "uds":
+        import anyio
+
+        from uds_transport import serve_uds
+
+        try:
+            anyio.run(serve_uds, mcp, args.socket, codec)
+        except (FileExistsError, PermissionError) as e:
+            # Başka bir sunucunun soketi devralınmaz
+            raise SystemExit(f"{mcp.name}: {e}")
+        return
+
+    import uvicorn
+
+    from http_compression import CompressionMiddleware
+
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    if args.host not in _LOCAL_HOSTS:
+        # FastMCP DNS rebinding korumasını yalnızca localhost için açar; dış adreste aynı davranış korunur
+        mcp.settings.transport_security = None
+    app = mcp.streamable_http_app()
+    if not args.no_compression:
+        app = CompressionMiddleware(app, minimum_size=args.compression_threshold)
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        timeout_keep_alive=args.keep_alive,
+        log_level=mcp.settings.log_level.lower(),
+    )
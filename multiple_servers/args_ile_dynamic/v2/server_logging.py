@@ -0,0 +1,104 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import reprlib
+import sys
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+# stdio transport'ta stdout JSON-RPC kanalıdır; kayıtlar asla oraya yazılmamalıdır.
+
+
+class RingBufferHandler(logging.Handler):
+    """Son kayıtları sabit boyutlu bir bellek halkasında tutar."""
+
+    def __init__(self, capacity: int):
+        super().__init__()
+        self.entries: deque = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entries.append({
+            "time": record.created,
+            "level": record.levelname,
+            "tool": getattr(record, "tool", None),
+            "message": record.getMessage(),
+        })
+
+
+def _parse_rates(spec: str) -> Dict[str, float]:
+    """'add=0.1,multiply=0.01' biçimindeki örnekleme oranlarını sözlüğe çevirir."""
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        tool, _, rate = item.partition("=")
+        rates[tool.strip()] = float(rate)
+    return rates
+
+
+class ToolLogger:
+    """
+    Araç çağrılarını kuyruk üzerinden arka plan iş parçacığına kaydeder; çağrı
+    yolu yalnızca kaydı kuyruğa koyar. Argümanlar reprlib ile kısaltılır, böylece
+    büyük listelerin tamamı hiçbir zaman metne çevrilmez. Araç başına örnekleme
+    oranı (0-1) ile yoğun araçların kayıt hacmi düşürülebilir.
+
+    Ortam değişkenleri: MATH_LOG_FILE (varsayılan stderr), MATH_LOG_LEVEL,
+    MATH_LOG_SAMPLING ("add=0.1,multiply=0.01"), MATH_LOG_RING_SIZE.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        log_file: Optional[str] = None,
+        sample_rates: Optional[Dict[str, float]] = None,
+        ring_size: int = 1000,
+        level: str = "INFO",
+    ):
+        self.sample_rates = sample_rates or {}
+        self.ring = RingBufferHandler(ring_size)
+
+        self._repr = reprlib.Repr()
+        self._repr.maxlist = 8
+        self._repr.maxdict = 8
+        self._repr.maxstring = 80
+        self._repr.maxother = 80
+
+        output = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler(sys.stderr)
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+        self._logger = logging.getLogger(name)
+        self._logger.setLevel(level)
+        self._logger.propagate = False
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(log_queue, output, self.ring, respect_handler_level=True)
+        self._listener.start()
+        # Kapanışta kuyrukta kalan kayıtlar da yazılsın
+        atexit.register(self._listener.stop)
+
+    @classmethod
+    def from_env(cls, name: str) -> "ToolLogger":
+        return cls(
+            name,
+            log_file=os.environ.get("MATH_LOG_FILE") or None,
+            sample_rates=_parse_rates(os.environ.get("MATH_LOG_SAMPLING", "")),
+            ring_size=int(os.environ.get("MATH_LOG_RING_SIZE", "1000")),
+            level=os.environ.get("MATH_LOG_LEVEL", "INFO"),
+        )
+
+    def call(self, tool: str, message: str, **arguments: Any) -> None:
+        """Bir araç çağrısını kaydeder; örnekleme dışında kalırsa hiçbir iş yapılmaz."""
+        rate = self.sample_rates.get(tool, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            return
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        if arguments:
+            message += " " + " ".join(f"{key}={self._repr.repr(value)}" for key, value in arguments.items())
+        self._logger.info("%s: %s", tool, message, extra={"tool": tool})
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        entries = list(self.ring.entries)
+        return entries[-limit:] if limit else entries
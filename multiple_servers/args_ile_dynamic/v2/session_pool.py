@@ -0,0 +1,313 @@
+import logging
+import sys
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Hashable, Optional, Set, TextIO
+
+import anyio
+import anyio.abc
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+logger = logging.getLogger(__name__)
+
+# Bu hatalar oturumun taşıdığı bağlantının koptuğunu gösterir; oturum havuza geri konmaz
+_TRANSPORT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
+
+def _params_key(server_params: StdioServerParameters) -> Hashable:
+    """StdioServerParameters hashlenebilir değildir; havuz anahtarı alanlarından üretilir."""
+    env = tuple(sorted(server_params.env.items())) if server_params.env else None
+    return (
+        server_params.command,
+        tuple(server_params.args),
+        env,
+        str(server_params.cwd) if server_params.cwd else None,
+        server_params.encoding,
+    )
+
+
+class _PooledSession:
+    """
+    Tek bir sunucu alt sürecini ve onun başlatılmış ClientSession'ını taşır.
+    stdio_client ve ClientSession görev grubu kullandığı için kendi görevinde
+    açılıp kapanmaları gerekir; run() bu görevdir.
+    """
+
+    def __init__(self, server_params: StdioServerParameters, errlog: TextIO):
+        self.server_params = server_params
+        self.errlog = errlog
+        self.session: Optional[ClientSession] = None
+        self.alive = False
+        self.last_used = time.monotonic()
+        self._stop = anyio.Event()
+
+    async def run(self, *, task_status: anyio.abc.TaskStatus = anyio.TASK_STATUS_IGNORED) -> None:
+        started = False
+        try:
+            async with stdio_client(self.server_params, errlog=self.errlog) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    self.alive = True
+                    started = True
+                    task_status.started()
+                    await self._stop.wait()
+        except Exception:
+            if not started:
+                raise
+            # Başlatıldıktan sonra ölen sunucu havuzun görev grubunu düşürmemeli
+            logger.warning("Pooled MCP server %s exited", self.server_params.args, exc_info=True)
+        finally:
+            self.alive = False
+
+    async def ping(self, timeout: float) -> bool:
+        if not self.alive or self.session is None:
+            return False
+        try:
+            with anyio.fail_after(timeout):
+                await self.session.send_ping()
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        self.alive = False
+        self._stop.set()
+
+
+@dataclass
+class _PoolStats:
+    spawned: int = 0
+    respawned: int = 0
+    reused: int = 0
+    discarded: int = 0
+    expired: int = 0
+
+
+class _ServerPool:
+    """Aynı StdioServerParameters ile başlatılan oturumların havuzu."""
+
+    def __init__(self, owner: "SessionPool", server_params: StdioServerParameters):
+        self.owner = owner
+        self.server_params = server_params
+        self.entries: Set[_PooledSession] = set()
+        self.idle: Deque[_PooledSession] = deque()
+        self.in_use = 0
+        # Ödünç verilen (ve sağlık kontrolündeki) oturum sayısını max_size ile sınırlar
+        self.slots = anyio.Semaphore(owner.max_size)
+        self.stats = _PoolStats()
+        self._replacements_due = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.idle) + self.in_use
+
+    async def spawn(self) -> _PooledSession:
+        entry = _PooledSession(self.server_params, self.owner.errlog)
+        await self.owner._task_group.start(entry.run)
+        self.entries.add(entry)
+        self.stats.spawned += 1
+        if self._replacements_due:
+            self._replacements_due -= 1
+            self.stats.respawned += 1
+        return entry
+
+    def discard(self, entry: _PooledSession) -> None:
+        """Ölü ya da bozuk oturumu kapatır; yerine açılacak ilk oturum respawn sayılır."""
+        entry.close()
+        self.entries.discard(entry)
+        self.stats.discarded += 1
+        self._replacements_due += 1
+
+    def _checkout(self) -> None:
+        self.in_use += 1
+
+    def _checkin(self) -> None:
+        self.in_use -= 1
+        self.slots.release()
+
+    async def acquire(self) -> _PooledSession:
+        await self.slots.acquire()
+        try:
+            while self.idle:
+                entry = self.idle.pop()
+                if entry.alive:
+                    self.stats.reused += 1
+                    break
+                self.discard(entry)
+            else:
+                entry = await self.spawn()
+        except BaseException:
+            self.slots.release()
+            raise
+        self._checkout()
+        return entry
+
+    def release(self, entry: _PooledSession, broken: bool) -> None:
+        self._checkin()
+        entry.last_used = time.monotonic()
+        if broken or not entry.alive:
+            self.discard(entry)
+        else:
+            # En son kullanılan oturum önce verilir; soğuk kalanlar kuyruğun başında birikir
+            self.idle.append(entry)
+
+    async def check_health(self) -> None:
+        """
+        Boşta oturumları sırayla ödünç alıp ping atar. Süresi dolanlar min_size'ın
+        üstündeyse kapatılır, yanıt vermeyenler atılır; ardından havuz doldurulur.
+        """
+        now = time.monotonic()
+        for entry in list(self.idle):
+            if entry not in self.idle:
+                continue
+            try:
+                self.slots.acquire_nowait()
+            except anyio.WouldBlock:
+                # Bütün yuvalar kullanımda; kontrol bir sonraki tura kalır
+                break
+            self.idle.remove(entry)
+            self._checkout()
+            idle_timeout = self.owner.idle_timeout
+            if idle_timeout and now - entry.last_used > idle_timeout and self.size > self.owner.min_size:
+                self._checkin()
+                entry.close()
+                self.entries.discard(entry)
+                self.stats.expired += 1
+                continue
+            healthy = await entry.ping(self.owner.health_check_timeout)
+            self._checkin()
+            if healthy:
+                self.idle.appendleft(entry)
+            else:
+                self.discard(entry)
+        await self.fill()
+
+    async def fill(self) -> None:
+        """Havuzu min_size kadar sıcak oturumla doldurur; ölenlerin yerine yenisi açılır."""
+        while self.size < self.owner.min_size:
+            self.idle.appendleft(await self.spawn())
+
+    def close(self) -> None:
+        for entry in self.entries:
+            entry.close()
+        self.entries.clear()
+        self.idle.clear()
+
+
+class SessionPool:
+    """
+    Sunucu süreçlerini çağrılar arasında yeniden kullanan istemci oturum havuzu.
+    Her StdioServerParameters için ayrı bir alt havuz tutulur; bir oturum ödünç
+    alınır, kullanılır ve geri bırakılır. Böylece her istek alt süreç başlatma,
+    yorumlayıcı importları ve initialize el sıkışmasının bedelini ödemez.
+
+        async with SessionPool(min_size=1, max_size=4) as pool:
+            async with pool.session(server_params) as session:
+                await session.call_tool("add", {"numbers": [1, 2]})
+
+    Arka planda boşta kalan oturumlara düzenli ping atılır; yanıt vermeyenler
+    kapatılır ve havuz min_size'a kadar yeniden doldurulur. Ödünç alınmış bir
+    oturumda bağlantı hatası oluşursa o oturum havuza geri konmaz.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 4,
+        health_check_interval: Optional[float] = 30.0,
+        health_check_timeout: float = 5.0,
+        idle_timeout: Optional[float] = 300.0,
+        errlog: Optional[TextIO] = None,
+    ):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Havuz boyutu 0 <= min_size <= max_size ve max_size >= 1 olmalıdır")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.idle_timeout = idle_timeout
+        self._errlog = errlog
+        self._pools: Dict[Hashable, _ServerPool] = {}
+        self._task_group: Optional[anyio.abc.TaskGroup] = None
+        self._health_scope = anyio.CancelScope()
+
+    @property
+    def errlog(self) -> TextIO:
+        return self._errlog or sys.stderr
+
+    async def __aenter__(self) -> "SessionPool":
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        if self.health_check_interval:
+            self._task_group.start_soon(self._health_loop)
+        return self
+
+    async def __aexit__(self, *exc_info) -> Optional[bool]:
+        # Oturum görevleri iptal edilmez, durdurulur: stdio_client alt süreci düzgün kapatabilsin
+        for pool in self._pools.values():
+            pool.close()
+        self._health_scope.cancel()
+        try:
+            return await self._task_group.__aexit__(*exc_info)
+        finally:
+            self._task_group = None
+
+    def _pool_for(self, server_params: StdioServerParameters) -> _ServerPool:
+        if self._task_group is None:
+            raise RuntimeError("SessionPool 'async with' ile açılmadan kullanılamaz")
+        key = _params_key(server_params)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _ServerPool(self, server_params)
+        return pool
+
+    async def warm(self, server_params: StdioServerParameters) -> None:
+        """Sunucu için min_size kadar oturumu önceden başlatır."""
+        await self._pool_for(server_params).fill()
+
+    @asynccontextmanager
+    async def session(self, server_params: StdioServerParameters):
+        """Havuzdan başlatılmış bir ClientSession ödünç verir."""
+        pool = self._pool_for(server_params)
+        entry = await pool.acquire()
+        broken = False
+        try:
+            yield entry.session
+        except _TRANSPORT_ERRORS:
+            broken = True
+            raise
+        except McpError as exc:
+            broken = exc.error.code == CONNECTION_CLOSED
+            raise
+        finally:
+            pool.release(entry, broken)
+
+    async def check_health(self) -> None:
+        """Tüm alt havuzlardaki boşta oturumları yoklar ve ölenlerin yerine yenisini açar."""
+        for pool in list(self._pools.values()):
+            await pool.check_health()
+
+    async def _health_loop(self) -> None:
+        with self._health_scope:
+            while True:
+                await anyio.sleep(self.health_check_interval)
+                try:
+                    await self.check_health()
+                except Exception:
+                    logger.exception("Session pool health check failed")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            " ".join([pool.server_params.command, *pool.server_params.args]): {
+                "idle": len(pool.idle),
+                "in_use": pool.in_use,
+                **vars(pool.stats),
+            }
+            for pool in self._pools.values()
+        }
@@ -0,0 +1,77 @@
+import os
+import socket
+import stat
+import tempfile
+
+# Unix domain soketleri için ortak yol kuralları (zygote ve uds transport).
+# Soket dosyaları paylaşılan geçici dizine değil, kullanıcıya özel bir dizine konur:
+# aksi halde başka bir kullanıcı yolu önceden oluşturabilir ya da dinleyebilir.
+# Bu modül yalnızca standart kütüphaneyi kullanır; "zygote.py run" yolu da onu import eder.
+
+
+def private_dir() -> str:
+    """Kullanıcıya özel soket dizini: XDG_RUNTIME_DIR veya geçici dizinde uid ile adlandırılmış 0700 dizin."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and is_private_dir(runtime):
+        return runtime
+    return os.path.join(tempfile.gettempdir(), f"mcp-{os.getuid()}")
+
+
+def is_private_dir(path: str) -> bool:
+    """Dizin (sembolik bağ değil) bu kullanıcıya ait ve grup/diğerlerine kapalı mı?"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def owned_socket(path: str) -> bool:
+    """Soket dosyası bu kullanıcıya ait gerçek bir soket mi?"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def ensure_private_dir() -> str:
+    """private_dir() dizinini gerekirse 0700 olarak oluşturur ve güvenli olduğunu doğrular."""
+    directory = private_dir()
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not is_private_dir(directory):
+        raise PermissionError(f"{directory} must be a directory owned by this user with mode 0700")
+    return directory
+
+
+def claim_socket_path(path: str) -> None:
+    """
+    path'e yeni bir soket bağlanmadan önce çağrılır. Dinleyen bir sunucu varsa
+    onun soketi devralınmaz; yalnızca kimsenin dinlemediği, bu kullanıcıya ait
+    eski soket dosyaları silinir. Soket olmayan dosyalara dokunulmaz.
+    """
+    if not os.path.lexists(path):
+        return
+    if not owned_socket(path):
+        raise FileExistsError(f"{path} exists and is not a socket owned by this user")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        # Önceki çalıştırmadan kalan soket dosyası
+        os.unlink(path)
+        return
+    except FileNotFoundError:
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(f"another server is already listening on {path}")
+
+
+def bind_private(listener: socket.socket, path: str) -> None:
+    """Soketi yalnızca sahibine açık (0600) olarak bağlar."""
+    previous_umask = os.umask(0o177)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(previous_umask)
@@ -0,0 +1,158 @@
+import base64
+import json
+import os
+import weakref
+from typing import Any, Callable, Dict, Optional, Union
+
+import mcp.types as types
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import BinaryResource, TextResource
+from pydantic import AnyUrl
+
+# FastMCP örneği -> statik kaynak kaydı
+_registry: "weakref.WeakKeyDictionary[FastMCP, StaticResources]" = weakref.WeakKeyDictionary()
+
+Responder = Callable[[bytes], Optional[bytes]]
+
+
+class StaticResources:
+    """
+    İçeriği hiç değişmeyen kaynaklar. Kaynak fonksiyonu kayıt sırasında bir kez
+    çağrılır; ReadResourceResult bir kez oluşturulur ve bir kez JSON'a yazılır.
+
+    Her transportta resources/read işleyicisi fonksiyon çağrısı ve model
+    oluşturmadan hazır sonucu döner. stdio ve uds çerçevelemesinde (ndjson_streams)
+    istek oturuma hiç girmez: satırdan yalnızca id okunur ve hazır baytlara eklenerek
+    yazılır. streamable-http yanıtı SDK'nın HTTP transportunda serileştirilir; orada
+    yalnızca işleyici kısa yolu geçerlidir.
+    """
+
+    def __init__(self, mcp: FastMCP):
+        self.mcp = mcp
+        # MCP_STATIC_RESOURCES=0 kaynakları sıradan fonksiyon kaynağı olarak kaydeder
+        # (karşılaştırma ve sorun giderme için)
+        self.enabled = os.environ.get("MCP_STATIC_RESOURCES", "1") != "0"
+        self._results: Dict[str, types.ServerResult] = {}
+        # uri -> yanıt satırının id'den sonraki kısmı: ,"result":{...}}\n
+        self._tails: Dict[str, bytes] = {}
+
+        handlers = mcp._mcp_server.request_handlers
+        read_resource = handlers[types.ReadResourceRequest]
+
+        async def handler(request: types.ReadResourceRequest) -> types.ServerResult:
+            result = self._results.get(str(request.params.uri))
+            if result is not None:
+                return result
+            return await read_resource(request)
+
+        handlers[types.ReadResourceRequest] = handler
+
+    def resource(
+        self,
+        uri: str,
+        *,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        @mcp.resource karşılığı; fonksiyon argümansız olmalı ve her çağrıda aynı
+        içeriği (str veya bytes) dönmelidir.
+        """
+
+        def decorator(fn: Callable[[], Union[str, bytes]]):
+            if not self.enabled:
+                return self.mcp.resource(uri, name=name, description=description, mime_type=mime_type, meta=meta)(fn)
+            self.add(uri, fn(), name=name or fn.__name__, description=description or fn.__doc__ or "",
+                     mime_type=mime_type, meta=meta)
+            return fn
+
+        return decorator
+
+    def add(
+        self,
+        uri: str,
+        content: Union[str, bytes],
+        *,
+        name: str,
+        description: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        # Yanıttaki uri, istemcinin gönderdiğinin pydantic ile normalize edilmiş halidir
+        uri = str(AnyUrl(uri))
+        if isinstance(content, bytes):
+            mime_type = mime_type or "application/octet-stream"
+            resource = BinaryResource(uri=uri, name=name, description=description, mime_type=mime_type,
+                                      meta=meta, data=content)
+            contents = types.BlobResourceContents(uri=uri, mimeType=mime_type, _meta=meta,
+                                                  blob=base64.b64encode(content).decode())
+        else:
+            mime_type = mime_type or "text/plain"
+            resource = TextResource(uri=uri, name=name, description=description, mime_type=mime_type,
+                                    meta=meta, text=content)
+            contents = types.TextResourceContents(uri=uri, mimeType=mime_type, _meta=meta, text=content)
+        self.mcp.add_resource(resource)
+
+        result = types.ServerResult(types.ReadResourceResult(contents=[contents]))
+        self._results[uri] = result
+        body = result.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+        self._tails[uri] = b',"result":' + body + b"}\n"
+
+    def responder(self) -> Responder:
+        """
+        Tek bir bağlantı için hızlı yol: statik bir kaynağı okuyan istek satırına
+        hazır yanıt satırını, diğer her şeye None döner. Oturum başlatılmadan
+        (notifications/initialized gelmeden) önceki istekler her zaman oturuma gider.
+        """
+        initialized = False
+
+        def respond(line: bytes) -> Optional[bytes]:
+            nonlocal initialized
+            if not initialized:
+                if b'"notifications/initialized"' in line:
+                    message = _loads(line)
+                    initialized = message is not None and message.get("method") == "notifications/initialized"
+                return None
+            if b'"resources/read"' not in line:
+                return None
+            message = _loads(line)
+            if message is None or message.get("method") != "resources/read" or message.get("jsonrpc") != "2.0":
+                return None
+            request_id, params = message.get("id"), message.get("params")
+            # RequestId yalnızca tamsayı veya metin olabilir; diğerleri doğrulama hatası için oturuma gider
+            if isinstance(request_id, bool) or not isinstance(request_id, (int, str)) or not isinstance(params, dict):
+                return None
+            uri = params.get("uri")
+            # Metin olmayan uri (liste, sözlük...) doğrulama hatası için oturuma gider
+            tail = self._tails.get(uri) if isinstance(uri, str) else None
+            if tail is None:
+                return None
+            return b'{"jsonrpc":"2.0","id":' + json.dumps(request_id, ensure_ascii=False).encode("utf-8") + tail
+
+        return respond
+
+
+def _loads(line: bytes) -> Optional[dict]:
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def static_resources(mcp: FastMCP) -> StaticResources:
+    """Sunucunun statik kaynak kaydını döner; ilk çağrıda oluşturur."""
+    static = _registry.get(mcp)
+    if static is None:
+        static = _registry[mcp] = StaticResources(mcp)
+    return static
+
+
+def fast_path(mcp: FastMCP) -> Optional[Responder]:
+    """Sunucuda statik kaynak varsa yeni bir bağlantı için hızlı yolu döner."""
+    static = _registry.get(mcp)
+    if static is None or not static._tails:
+        return None
+    return static.responder()
@@ -0,0 +1,120 @@
+import codecs
+import os
+import signal
+import subprocess
+import sys
+from contextlib import asynccontextmanager
+from typing import Optional, TextIO
+
+import anyio
+import anyio.abc
+from anyio.streams.stapled import StapledByteStream
+from mcp import StdioServerParameters
+from mcp.client.stdio import get_default_environment
+from mcp.server.fastmcp import FastMCP
+
+from json_codec import PydanticCodec, get_codec, ndjson_streams
+from static_resources import fast_path
+
+
+class _StdioByteStream(anyio.abc.ByteStream):
+    """Sürecin kendi stdin/stdout'unu bayt akışı olarak sunar (sunucu tarafı)."""
+
+    def __init__(self):
+        self._stdin = anyio.wrap_file(sys.stdin.buffer)
+        self._stdout = anyio.wrap_file(sys.stdout.buffer)
+
+    async def receive(self, max_bytes: int = 65536) -> bytes:
+        # read1 borudaki mevcut veriyi döner; read gibi max_bytes dolana kadar beklemez
+        data = await self._stdin.read1(max_bytes)
+        if not data:
+            raise anyio.EndOfStream
+        return data
+
+    async def send(self, item: bytes) -> None:
+        await self._stdout.write(item)
+        await self._stdout.flush()
+
+    async def send_eof(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+async def serve_stdio(mcp: FastMCP, codec: Optional[PydanticCodec] = None) -> None:
+    """
+    mcp.run(transport="stdio") ile aynıdır, ancak mesajlar seçilen codec ile
+    çerçevelenir ve statik kaynaklar hızlı yoldan yanıtlanır.
+    """
+    async with ndjson_streams(_StdioByteStream(), codec, fast_path(mcp)) as (read_stream, write_stream):
+        await mcp._mcp_server.run(read_stream, write_stream, mcp._mcp_server.create_initialization_options())
+
+
+# stdin kapatıldıktan sonra sunucunun kendiliğinden çıkması için beklenen süre (saniye)
+PROCESS_TERMINATION_TIMEOUT = 2.0
+
+
+@asynccontextmanager
+async def open_server_process(server: StdioServerParameters, errlog: TextIO = sys.stderr, env: Optional[dict] = None):
+    """
+    Sunucu sürecini başlatır ve kapanışta SDK ile aynı sırayı izler: stdin
+    kapatılır, süreç beklenir, çıkmazsa süreç grubu sonlandırılır. Yalnızca
+    anyio'nun açık API'si kullanılır; sunucunun başlattığı alt süreçler de
+    aynı gruptadır ve onlarla birlikte kapanır.
+    """
+    process = await anyio.open_process(
+        [server.command, *server.args],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=errlog,
+        env={**get_default_environment(), **(env or {}), **(server.env or {})},
+        cwd=server.cwd,
+        start_new_session=True,
+    )
+    async with process:
+        try:
+            yield process
+        finally:
+            try:
+                await process.stdin.aclose()
+            except Exception:
+                pass
+            try:
+                with anyio.fail_after(PROCESS_TERMINATION_TIMEOUT):
+                    await process.wait()
+            except TimeoutError:
+                await _terminate_group(process)
+
+
+async def _terminate_group(process: anyio.abc.Process) -> None:
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            return
+        with anyio.move_on_after(PROCESS_TERMINATION_TIMEOUT):
+            await process.wait()
+            return
+
+
+@asynccontextmanager
+async def stdio_client(
+    server: StdioServerParameters,
+    errlog: TextIO = sys.stderr,
+    codec: Optional[PydanticCodec] = None,
+):
+    """
+    SDK'daki stdio_client'ın karşılığı. Mesajlar seçilen codec ile çerçevelenir
+    (varsayılan MCP_JSON_CODEC veya pydantic); başlatılan sunucu da aynı codec'i
+    kullanır. Codec'ler aynı JSON'u ürettiği için iki tarafın farklı codec
+    kullanması da sorun olmaz. Aynı anda kuyruğa giren istekler tek yazımda
+    gönderilir (bkz. ndjson_streams), bu yüzden BatchClientSession ile birlikte
+    kullanılır. Çerçeveleme UTF-8'dir; başka bir server.encoding reddedilir.
+    """
+    if codecs.lookup(server.encoding).name != "utf-8":
+        raise ValueError(f"stdio framing is UTF-8 only; got encoding {server.encoding!r}")
+    codec = codec or get_codec()
+    async with open_server_process(server, errlog, env={"MCP_JSON_CODEC": codec.name}) as process:
+        async with ndjson_streams(StapledByteStream(process.stdin, process.stdout), codec) as streams:
+            yield streams
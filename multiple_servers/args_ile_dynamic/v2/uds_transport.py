@@ -0,0 +1,62 @@
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import anyio
+import anyio.abc
+from mcp.server.fastmcp import FastMCP
+
+from json_codec import PydanticCodec, ndjson_streams
+from socket_paths import claim_socket_path, ensure_private_dir, private_dir
+from static_resources import fast_path
+
+logger = logging.getLogger(__name__)
+
+
+def default_socket_path(mcp: FastMCP) -> str:
+    """Varsayılan soket yolu: kullanıcıya özel dizinde <sunucu-adı>.sock (bkz. socket_paths)."""
+    return os.path.join(private_dir(), f"{mcp.name}.sock")
+
+
+async def serve_uds(mcp: FastMCP, path: Optional[str] = None, codec: Optional[PydanticCodec] = None) -> None:
+    """
+    Sunucuyu bir Unix domain soketinde dinletir. Her bağlantı kendi MCP
+    oturumunu alır ve aynı süreçte eşzamanlı olarak çalışır. Yolda dinleyen
+    başka bir sunucu varsa başlamaz; yalnızca eski soket dosyaları silinir.
+    """
+    if path is None:
+        ensure_private_dir()
+        path = default_socket_path(mcp)
+    claim_socket_path(path)
+    listener = await anyio.create_unix_listener(path, mode=0o600)
+    logger.info("Listening on %s", path)
+
+    async def handle(stream: anyio.abc.ByteStream):
+        try:
+            async with stream, ndjson_streams(stream, codec, fast_path(mcp)) as (read_stream, write_stream):
+                await mcp._mcp_server.run(
+                    read_stream,
+                    write_stream,
+                    mcp._mcp_server.create_initialization_options(),
+                )
+        except Exception:
+            # Tek bir bağlantıdaki hata diğer oturumları düşürmemeli
+            logger.exception("UDS session failed")
+
+    try:
+        await listener.serve(handle)
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+@asynccontextmanager
+async def uds_client(path: str, codec: Optional[PydanticCodec] = None):
+    """
+    stdio_client karşılığı: Unix domain soketinde dinleyen bir sunucuya bağlanır
+    ve ClientSession için (read_stream, write_stream) döner.
+    """
+    stream = await anyio.connect_unix(path)
+    async with stream, ndjson_streams(stream, codec) as (read_stream, write_stream):
+        yield read_stream, write_stream
@@ -0,0 +1,326 @@
+import argparse
+import ast
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+
+from socket_paths import bind_private, claim_socket_path, ensure_private_dir, owned_socket, private_dir
+
+# Bu dosya iki rol üstlenir:
+#   python zygote.py serve math_server_dynamic.py greeting_mcp_server.py
+#       FastMCP yığınını ve sunucu betiklerinin importlarını bir kez yükler, sonra
+#       her stdio oturumu için kendini fork eder.
+#   python zygote.py run math_server_dynamic.py [argümanlar]
+#       StdioServerParameters'ta "command" yerine geçen hafif istemci: kendi
+#       stdin/stdout/stderr'ini zygote'a devreder ve fork edilen sunucunun
+#       çıkış kodunu döner. Zygote çalışmıyorsa betiği doğrudan (soğuk) başlatır.
+# "run" yolu bilerek yalnızca standart kütüphaneyi kullanır; ağır importlar "serve" içindedir.
+#
+# Güvenlik: istemci ortam değişkenlerini ve stdio tanımlayıcılarını devrettiği için soket
+# kullanıcıya özeldir (varsayılan olarak 0700 bir dizinde) ve iki taraf da karşı tarafın
+# aynı kullanıcı olduğunu SO_PEERCRED ile doğrular. İstemci tüm ortamı değil, yalnızca
+# zygote'un ortamından farkını gönderir.
+
+_STATUS = struct.Struct("!i")
+# Sunucu betiklerinden bağımsız olarak her zaman ısıtılan modüller
+DEFAULT_PRELOAD = ("mcp.server.fastmcp", "mcp.server.stdio", "anyio", "pydantic")
+
+
+def default_socket_path() -> str:
+    return os.environ.get("ZYGOTE_SOCKET") or os.path.join(private_dir(), "mcp-zygote.sock")
+
+
+def _peer_uid(sock: socket.socket):
+    """Bağlantının öteki ucundaki sürecin uid'i; SO_PEERCRED desteklenmiyorsa None."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    _, uid, _ = struct.unpack("3i", sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+    return uid
+
+
+def _send_message(sock: socket.socket, payload: dict) -> None:
+    data = json.dumps(payload).encode("utf-8")
+    sock.sendall(_STATUS.pack(len(data)) + data)
+
+
+def _recv_message(sock: socket.socket) -> dict:
+    (size,) = _STATUS.unpack(_recv_exactly(sock, _STATUS.size))
+    return json.loads(_recv_exactly(sock, size))
+
+
+def env_delta(base: dict, env: dict) -> dict:
+    """base ortamını env'e çeviren fark: eklenen/değişen değişkenler ve silinen adlar."""
+    return {
+        "set": {name: value for name, value in env.items() if base.get(name) != value},
+        "unset": [name for name in base if name not in env],
+    }
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("zygote closed the connection")
+        data += chunk
+    return data
+
+
+# ==================== İSTEMCİ (run) ====================
+
+def _cold_start(script: str, args: list) -> None:
+    # Zygote yoksa (ya da güvenilir değilse) normal soğuk başlatma; davranış "python script.py" ile aynıdır
+    os.execv(sys.executable, [sys.executable, script, *args])
+
+
+def run(script: str, args: list) -> None:
+    script = os.path.abspath(script)
+    socket_path = default_socket_path()
+    if not owned_socket(socket_path):
+        _cold_start(script, args)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        if _peer_uid(sock) != os.getuid():
+            # Soketi başka bir kullanıcının süreci dinliyor: ortam ve tanımlayıcılar ona verilmez
+            print(f"zygote: {socket_path} is not served by this user; starting cold", file=sys.stderr)
+            sock.close()
+            _cold_start(script, args)
+        zygote_env = _recv_message(sock)["env"]
+    except (OSError, ValueError):
+        sock.close()
+        _cold_start(script, args)
+
+    request = json.dumps({"script": script, "args": args, "cwd": os.getcwd(), "env": env_delta(zygote_env, dict(os.environ))})
+    socket.send_fds(sock, [request.encode("utf-8")], [0, 1, 2])
+    (pid,) = _STATUS.unpack(_recv_exactly(sock, _STATUS.size))
+
+    # İstemcinin gönderdiği sonlandırma sinyalleri asıl sunucuya iletilir
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(signum, lambda received, frame: os.kill(pid, received))
+    (code,) = _STATUS.unpack(_recv_exactly(sock, _STATUS.size))
+    sys.exit(code if code >= 0 else 128 - code)
+
+
+# ==================== ZYGOTE (serve) ====================
+
+def _script_imports(source: str):
+    """Betiğin modül düzeyindeki import ettiği modül adları."""
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module
+
+
+def preload(scripts: list, extra_modules: tuple = DEFAULT_PRELOAD) -> dict:
+    """
+    Modülleri import eder ve betikleri derler, ancak betik gövdelerini çalıştırmaz:
+    gövde iş parçacığı başlatabilir (ör. ToolLogger) ve fork'tan önce bunlar olmamalıdır.
+    """
+    import importlib
+
+    compiled = {}
+    for module in extra_modules:
+        importlib.import_module(module)
+    for script in scripts:
+        path = os.path.abspath(script)
+        with open(path, encoding="utf-8") as file:
+            source = file.read()
+        directory = os.path.dirname(path)
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+        for module in _script_imports(source):
+            importlib.import_module(module)
+        compiled[path] = compile(source, path, "exec")
+    return compiled
+
+
+def _run_child(request: dict, fds: list, compiled: dict) -> int:
+    """Fork edilen çocukta sunucu betiğini __main__ olarak çalıştırır ve çıkış kodunu döner."""
+    import atexit
+    import traceback
+    import types
+
+    for target, fd in zip((0, 1, 2), fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    # Zygote'un sys.stdin/stdout nesneleri eski dosya türüne göre (ör. aranabilir) ayarlı;
+    # yorumlayıcının açılışta yaptığı gibi yeni tanımlayıcılar için baştan oluşturulur
+    sys.stdin = sys.__stdin__ = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = sys.__stdout__ = open(1, "w", encoding="utf-8", closefd=False)
+    sys.stderr = sys.__stderr__ = open(2, "w", encoding="utf-8", errors="backslashreplace", closefd=False)
+    os.chdir(request["cwd"])
+    # Çocuk zygote'un ortamını miras alır; istemcinin ortamı gönderdiği farkla kurulur
+    for name in request["env"]["unset"]:
+        os.environ.pop(name, None)
+    os.environ.update(request["env"]["set"])
+
+    script = request["script"]
+    code = compiled.get(script)
+    if code is None:
+        with open(script, encoding="utf-8") as file:
+            code = compile(file.read(), script, "exec")
+    sys.argv = [script, *request["args"]]
+    sys.path[0] = os.path.dirname(script)
+    main = types.ModuleType("__main__")
+    main.__file__ = script
+    main.__builtins__ = __builtins__
+    sys.modules["__main__"] = main
+
+    status = 0
+    try:
+        exec(code, main.__dict__)
+    except SystemExit as exc:
+        status = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        atexit._run_exitfuncs()
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+    return status
+
+
+def serve(socket_path: str, scripts: list) -> None:
+    import logging
+    import selectors
+
+    # Kök logger'a dokunulmaz; fork edilen sunucular loglamayı soğuk başlatmadaki gibi kendileri kurar
+    log = logging.getLogger("zygote")
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s zygote: %(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    compiled = preload(scripts)
+
+    if not hasattr(socket, "SO_PEERCRED"):
+        raise SystemExit("zygote: SO_PEERCRED is not available; refusing to serve")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        if socket_path == os.path.join(private_dir(), "mcp-zygote.sock"):
+            ensure_private_dir()
+        claim_socket_path(socket_path)
+        bind_private(listener, socket_path)
+    except (FileExistsError, PermissionError) as e:
+        raise SystemExit(f"zygote: {e}")
+    listener.listen(64)
+
+    # SIGCHLD, select'i uyandıran bir boruya yazılır; çocuklar olay döngüsünde toplanır
+    wakeup_read, wakeup_write = os.pipe()
+    os.set_blocking(wakeup_read, False)
+    os.set_blocking(wakeup_write, False)
+    signal.set_wakeup_fd(wakeup_write)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    # SIGTERM ile kapanırken soket dosyası da silinsin
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    selector.register(wakeup_read, selectors.EVENT_READ)
+    sessions = {}
+    log.info("ready on %s with %d preloaded scripts", socket_path, len(compiled))
+
+    try:
+        while True:
+            for key, _ in selector.select():
+                if key.fileobj is listener:
+                    conn, _ = listener.accept()
+                    fds = []
+                    try:
+                        if _peer_uid(conn) != os.getuid():
+                            log.warning("rejected a connection from another user")
+                            conn.close()
+                            continue
+                        # Yavaş ya da bozuk bir istemci zygote'u bekletmesin
+                        conn.settimeout(5)
+                        _send_message(conn, {"env": dict(os.environ)})
+                        message, fds, _, _ = socket.recv_fds(conn, 1 << 20, 3)
+                        request = json.loads(message)
+                        if len(fds) != 3:
+                            raise ValueError("expected stdin, stdout and stderr")
+                        conn.settimeout(None)
+                    except (OSError, ValueError):
+                        for fd in fds:
+                            os.close(fd)
+                        conn.close()
+                        continue
+                    pid = os.fork()
+                    if pid == 0:
+                        # Çocuk: zygote'un dinleyici ve sinyal düzeneğini bırak
+                        status = 1
+                        try:
+                            signal.set_wakeup_fd(-1)
+                            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                            selector.close()
+                            listener.close()
+                            conn.close()
+                            for session in sessions.values():
+                                session.close()
+                            os.close(wakeup_read)
+                            os.close(wakeup_write)
+                            status = _run_child(request, fds, compiled)
+                        finally:
+                            os._exit(status)
+                    for fd in fds:
+                        os.close(fd)
+                    sessions[pid] = conn
+                    conn.sendall(_STATUS.pack(pid))
+                    log.info("forked %d for %s", pid, os.path.basename(request["script"]))
+                else:
+                    try:
+                        while os.read(wakeup_read, 512):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    _reap(sessions)
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _reap(sessions: dict) -> None:
+    while sessions:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        conn = sessions.pop(pid, None)
+        if conn is not None:
+            try:
+                conn.sendall(_STATUS.pack(os.waitstatus_to_exitcode(status)))
+            except OSError:
+                pass
+            conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="stdio MCP sunucuları için fork tabanlı hızlı başlatıcı")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="Zygote'u başlatır ve betikleri önceden yükler")
+    serve_parser.add_argument("scripts", nargs="*", help="Önceden yüklenecek sunucu betikleri")
+    serve_parser.add_argument("--socket", default=None, help="Dinlenecek Unix soketi (varsayılan: ZYGOTE_SOCKET)")
+    run_parser = commands.add_parser("run", help="Bir sunucu oturumunu zygote üzerinden başlatır")
+    run_parser.add_argument("script")
+    run_parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket or default_socket_path(), args.scripts)
+    else:
+        run(args.script, args.args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import asyncio
+import os
+import statistics
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from capability_cache import CapabilityCache, refresh_listings, server_identity
+
+DISCOVERIES = 200
+
+
+async def measure(session: ClientSession, identity: str, initialize, cache):
+    samples = []
+    for _ in range(DISCOVERIES):
+        start = time.perf_counter()
+        await refresh_listings(session, identity, initialize, cache)
+        samples.append((time.perf_counter() - start) * 1e3)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+async def main():
+    server_params = StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None)
+    identity = server_identity(server_params)
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(server_params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                initialize = await session.initialize()
+                cache = CapabilityCache()
+                await refresh_listings(session, identity, initialize, cache)
+                listed = await measure(session, identity, initialize, None)
+                cached = await measure(session, identity, initialize, cache)
+
+    print(f"\n{'discovery':>12} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    print("-" * 34)
+    print(f"{'list_*':>12} {listed[0]:>10.3f} {listed[1]:>10.3f}")
+    print(f"{'cached':>12} {cached[0]:>10.3f} {cached[1]:>10.3f}")
+    print(f"\ncache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
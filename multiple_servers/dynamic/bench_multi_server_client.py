@@ -0,0 +1,68 @@
+import asyncio
+import os
+import statistics
+import time
+
+from mcp import StdioServerParameters
+
+from multi_server_client import MultiServerClient
+from resource_cache import ResourceCache
+
+# Bir gösterge paneli sayfası her iki sunucuya da istek atar
+PAGE = [
+    "resource://greet",
+    "resource://farewell",
+    "resource://addition/15/27",
+    "resource://multiplication/8/12",
+    "resource://cache/stats",
+]
+RENDERS = 300
+
+
+async def render_sequential(client: MultiServerClient) -> None:
+    for uri in PAGE:
+        await client.read_resource(uri)
+
+
+async def render_concurrent(client: MultiServerClient) -> None:
+    await asyncio.gather(*(client.read_resource(uri) for uri in PAGE))
+
+
+async def measure(render, client: MultiServerClient):
+    samples = []
+    for _ in range(RENDERS):
+        start = time.perf_counter()
+        await render(client)
+        samples.append((time.perf_counter() - start) * 1e3)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+async def main():
+    servers = {
+        "greeting": StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None),
+        "math": StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None),
+    }
+    with open(os.devnull, "w") as errlog:
+        async with MultiServerClient(servers, errlog=errlog) as client:
+            await measure(render_concurrent, client)
+            sequential = await measure(render_sequential, client)
+            concurrent = await measure(render_concurrent, client)
+        # greet and farewell are immutable, so a resource cache serves them locally
+        cache = ResourceCache()
+        async with MultiServerClient(servers, errlog=errlog, resource_cache=cache) as client:
+            await measure(render_concurrent, client)
+            cached_sequential = await measure(render_sequential, client)
+            cached_concurrent = await measure(render_concurrent, client)
+
+    print(f"\n{'render':>12} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    print("-" * 34)
+    print(f"{'sequential':>12} {sequential[0]:>10.2f} {sequential[1]:>10.2f}")
+    print(f"{'concurrent':>12} {concurrent[0]:>10.2f} {concurrent[1]:>10.2f}")
+    print(f"{'seq+cache':>12} {cached_sequential[0]:>10.2f} {cached_sequential[1]:>10.2f}")
+    print(f"{'conc+cache':>12} {cached_concurrent[0]:>10.2f} {cached_concurrent[1]:>10.2f}")
+    print(f"\nresource cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
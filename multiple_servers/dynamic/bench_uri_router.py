@@ -0,0 +1,59 @@
+import time
+
+from mcp.server.fastmcp.resources import ResourceTemplate
+
+from uri_router import UriRouter
+
+# Number of registered templates to compare
+SIZES = [10, 1_000, 10_000]
+LOOKUPS = 20_000
+# The linear scan gets slow with many templates, so it runs fewer lookups
+LINEAR_WORK = 50_000
+
+
+def operation(a: float, b: float) -> str:
+    return f"{a}, {b}"
+
+
+def build_templates(count: int):
+    return [
+        ResourceTemplate.from_function(operation, uri_template=f"resource://operation{i}/{{a}}/{{b}}", name=f"operation{i}")
+        for i in range(count)
+    ]
+
+
+def linear_match(templates, uri: str):
+    """The lookup FastMCP's ResourceManager does: try each template's regex in turn."""
+    for template in templates:
+        if params := template.matches(uri):
+            return template, params
+    return None
+
+
+def time_lookups(match, uris) -> float:
+    """Average microseconds per lookup."""
+    start = time.perf_counter()
+    for uri in uris:
+        assert match(uri) is not None
+    return (time.perf_counter() - start) / len(uris) * 1e6
+
+
+def main():
+    print(f"\n{'templates':>10} {'linear (µs)':>12} {'trie (µs)':>10} {'speedup':>9}")
+    print("-" * 44)
+    for count in SIZES:
+        templates = build_templates(count)
+        router = UriRouter()
+        for template in templates:
+            router.add(template.uri_template, template)
+
+        # Spread lookups evenly over all templates, so the linear scan pays its average cost
+        uris = [f"resource://operation{(i * 7919) % count}/15/27" for i in range(LOOKUPS)]
+        linear_uris = uris[:max(20, LINEAR_WORK // count)]
+        linear = time_lookups(lambda uri: linear_match(templates, uri), linear_uris)
+        trie = time_lookups(router.match, uris)
+        print(f"{count:>10} {linear:>12.2f} {trie:>10.2f} {linear / trie:>8.1f}x", flush=True)
+
+
+if __name__ == "__main__":
+    main()
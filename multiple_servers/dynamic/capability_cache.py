@@ -0,0 +1,229 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import anyio.lowlevel
+import mcp.types as types
+from mcp import ClientSession, StdioServerParameters
+
+logger = logging.getLogger(__name__)
+
+# Listing name (as in the list_* result field) -> model of one item
+LISTINGS = {
+    "tools": types.Tool,
+    "resources": types.Resource,
+    "resourceTemplates": types.ResourceTemplate,
+}
+# Listings invalidated by each list_changed notification
+_CHANGED = {
+    types.ToolListChangedNotification: ("tools",),
+    types.ResourceListChangedNotification: ("resources", "resourceTemplates"),
+}
+
+
+async def _list_all(list_page, field: str) -> List[Any]:
+    """Follow nextCursor until every page of a list_* result has been read."""
+    items, cursor = [], None
+    while True:
+        page = await list_page(cursor=cursor)
+        items.extend(getattr(page, field))
+        cursor = page.nextCursor
+        if not cursor:
+            return items
+
+
+def _list_page(session: ClientSession, listing: str):
+    return {
+        "tools": session.list_tools,
+        "resources": session.list_resources,
+        "resourceTemplates": session.list_resource_templates,
+    }[listing]
+
+
+def advertised_listings(initialize: types.InitializeResult) -> Tuple[str, ...]:
+    """The listings a server supports according to its initialize capabilities."""
+    capabilities = initialize.capabilities
+    listings = ()
+    if capabilities.resources is not None:
+        listings += ("resources", "resourceTemplates")
+    if capabilities.tools is not None:
+        listings += ("tools",)
+    return listings
+
+
+def server_identity(server_params: StdioServerParameters) -> str:
+    """
+    Cache identity of a stdio server: its command line, working directory and
+    environment, plus the size and mtime of every argument that is a file, so
+    editing a server script gives it a new identity. Modules the script imports
+    are not fingerprinted; clear the cache after changing those.
+    """
+    cwd = str(server_params.cwd or os.getcwd())
+    files = []
+    for arg in server_params.args:
+        path = os.path.join(cwd, arg)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            files.append([arg, stat.st_size, stat.st_mtime_ns])
+    identity = [server_params.command, server_params.args, cwd, sorted((server_params.env or {}).items()), files]
+    return hashlib.sha256(json.dumps(identity).encode()).hexdigest()[:32]
+
+
+def _server_version(initialize: types.InitializeResult) -> List[str]:
+    return [initialize.serverInfo.name, initialize.serverInfo.version, str(initialize.protocolVersion)]
+
+
+class CapabilityCache:
+    """
+    Remembers each server's initialize result and its tool, resource and
+    template listings, so a new session to a known server skips the list_*
+    round trips. Entries are keyed by a server identity (see server_identity)
+    and only used while the server still reports the same name, version and
+    protocol version. list_changed notifications drop the affected listings.
+
+    With a path the cache is also kept in a JSON file and reused across
+    processes; without one it lives in memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        # identity -> {"server": [name, version, protocol], "initialize": InitializeResult, <listing>: [items]}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        if path is not None and os.path.exists(path):
+            try:
+                self._load()
+            except (OSError, ValueError, KeyError) as exc:
+                # A damaged cache file only costs a rediscovery
+                logger.warning("Ignoring unreadable capability cache %s: %s", path, exc)
+                self._entries.clear()
+
+    def initialize_result(self, identity: str) -> Optional[types.InitializeResult]:
+        """The last initialize result seen for the server, without connecting to it."""
+        entry = self._entries.get(identity)
+        return entry["initialize"] if entry is not None else None
+
+    def get(self, identity: str, initialize: types.InitializeResult, listing: str) -> Optional[List[Any]]:
+        entry = self._entries.get(identity)
+        if entry is None or entry["server"] != _server_version(initialize) or listing not in entry:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[listing]
+
+    def put(self, identity: str, initialize: types.InitializeResult, listings: Dict[str, List[Any]]) -> None:
+        entry = self._entries.get(identity)
+        if entry is None or entry["server"] != _server_version(initialize):
+            # A new server version starts from an empty entry
+            entry = self._entries[identity] = {"server": _server_version(initialize)}
+        entry["initialize"] = initialize
+        entry.update(listings)
+        self._save()
+
+    def invalidate(self, identity: str, listings: Iterable[str] = tuple(LISTINGS)) -> None:
+        entry = self._entries.get(identity)
+        if entry is None:
+            return
+        for listing in listings:
+            if entry.pop(listing, None) is not None:
+                self.invalidations += 1
+        self._save()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._save()
+
+    def message_handler(self, identity: str, on_change: Optional[Callable[[Tuple[str, ...]], None]] = None):
+        """
+        ClientSession message_handler that invalidates listings on list_changed
+        notifications and reports the changed listings to on_change. It must not
+        send requests itself: it runs inside the session's receive loop, which
+        would then never see the response.
+        """
+
+        async def handle(message) -> None:
+            if isinstance(message, types.ServerNotification):
+                changed = _CHANGED.get(type(message.root))
+                if changed:
+                    self.invalidate(identity, changed)
+                    if on_change is not None:
+                        on_change(changed)
+            await anyio.lowlevel.checkpoint()
+
+        return handle
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "servers": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as file:
+            stored = json.load(file)
+        for identity, entry in stored.items():
+            loaded = {"server": entry["server"], "initialize": types.InitializeResult.model_validate(entry["initialize"])}
+            for listing, model in LISTINGS.items():
+                if listing in entry:
+                    loaded[listing] = [model.model_validate(item) for item in entry[listing]]
+            self._entries[identity] = loaded
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        dump = lambda model: model.model_dump(mode="json", by_alias=True, exclude_none=True)
+        stored = {}
+        for identity, entry in self._entries.items():
+            stored[identity] = {"server": entry["server"], "initialize": dump(entry["initialize"])}
+            for listing in LISTINGS:
+                if listing in entry:
+                    stored[identity][listing] = [dump(item) for item in entry[listing]]
+        # Write to a temporary file and rename, so a reader never sees half a file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        os.replace(temporary, self.path)
+
+
+async def discover(
+    session: ClientSession,
+    identity: str,
+    cache: Optional[CapabilityCache] = None,
+    listings: Optional[Iterable[str]] = None,
+) -> Tuple[types.InitializeResult, Dict[str, List[Any]]]:
+    """
+    Initialize the session and return its listings, from the cache when the
+    server is known and otherwise by listing every page (and caching the result).
+    """
+    initialize = await session.initialize()
+    return initialize, await refresh_listings(session, identity, initialize, cache, listings)
+
+
+async def refresh_listings(
+    session: ClientSession,
+    identity: str,
+    initialize: types.InitializeResult,
+    cache: Optional[CapabilityCache] = None,
+    listings: Optional[Iterable[str]] = None,
+) -> Dict[str, List[Any]]:
+    """Return the given listings (default: all advertised) of an initialized session."""
+    result, fetched = {}, {}
+    for listing in listings or advertised_listings(initialize):
+        items = cache.get(identity, initialize, listing) if cache is not None else None
+        if items is None:
+            items = fetched[listing] = await _list_all(_list_page(session, listing), listing)
+        result[listing] = items
+    # A server without listings is still recorded, so its initialize result is cached
+    if cache is not None and (fetched or not result):
+        cache.put(identity, initialize, fetched)
+    return result
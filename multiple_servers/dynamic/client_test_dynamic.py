@@ -3,6 +3,8 @@ import asyncio
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from multi_server_client import MultiServerClient
+
 
 async def test_greeting_server():
     """Test Greeting Server and its resources"""
@@ -116,6 +118,11 @@ async def test_math_server():
             print(f"  Step 2: 15 × 3 = {step2.contents[0].text}")
             
             print("✓ Complex calculation completed successfully!")
+            
+            # 8. Result cache statistics
+            print("\n--- Result cache statistics ---")
+            stats = await session.read_resource("resource://cache/stats")
+            print(f"Cache: {stats.contents[0].text}")
 
 
 async def test_math_server_edge_cases():
@@ -152,6 +159,27 @@ async def test_math_server_edge_cases():
             print(f"-7.5 × 2 = {mixed2.contents[0].text}")
 
 
+async def test_multi_server_fan_out():
+    print("\n" + "="*60)
+    print("TESTING MULTI-SERVER FAN-OUT")
+    print("="*60)
+    
+    servers = {
+        "greeting": StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None),
+        "math": StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None),
+    }
+    
+    async with MultiServerClient(servers) as client:
+        print("\n✓ Client is connected to both servers through one MultiServerClient")
+        
+        # One dashboard render: independent requests to both servers run concurrently
+        print("\n--- Rendering dashboard (concurrent requests) ---")
+        uris = ["resource://greet", "resource://addition/15/27", "resource://multiplication/8/12"]
+        responses = await asyncio.gather(*(client.read_resource(uri) for uri in uris))
+        for uri, response in zip(uris, responses):
+            print(f"{uri} -> [{client.route_resource(uri)}] {response.contents[0].text}")
+
+
 async def main():
     print("\n" + "█"*60)
     print("█" + " "*10 + "MCP SERVERS TEST SUITE (DYNAMIC RESOURCES)" + " "*10 + "█")
@@ -161,6 +189,7 @@ async def main():
     await test_greeting_server()
     await test_math_server()
     await test_math_server_edge_cases()
+    await test_multi_server_fan_out()
     
     print("\n" + "="*60)
     print("ALL TESTS COMPLETED SUCCESSFULLY ✓")
@@ -1,20 +1,30 @@
+import hashlib
 
 from mcp.server.fastmcp import FastMCP
 
 # FastMCP server instance oluştur
 mcp = FastMCP("greeting-server")
 
+GREETING = "Hello! Welcome to the Greeting Server."
+FAREWELL = "Goodbye! Thank you for using the Greeting Server."
 
-@mcp.resource("resource://greet")
+
+def immutable(text: str) -> dict:
+    # Sabit metin süreç boyunca değişmez: istemci süresiz önbelleğe alabilir,
+    # sürüm (içeriğin özeti) resources/list ile karşılaştırılarak doğrulanır
+    return {"cache": {"immutable": True, "version": hashlib.sha256(text.encode()).hexdigest()[:16]}}
+
+
+@mcp.resource("resource://greet", meta=immutable(GREETING))
 def greet() -> str:
     
-    return "Hello! Welcome to the Greeting Server."
+    return GREETING
 
 
-@mcp.resource("resource://farewell")
+@mcp.resource("resource://farewell", meta=immutable(FAREWELL))
 def farewell() -> str:
     
-    return "Goodbye! Thank you for using the Greeting Server."
+    return FAREWELL
 
 
 if __name__ == "__main__":
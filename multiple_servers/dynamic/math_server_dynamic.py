@@ -1,7 +1,61 @@
+import json
+import math
+import os
+
 from mcp.server.fastmcp import FastMCP
 
+from result_cache import LRUCache
+from uri_router import install_router
+
 # FastMCP server instance oluştur
 mcp = FastMCP("math-server")
+# Resolve resource templates through a segment trie instead of trying each regex
+install_router(mcp)
+
+# Result cache shared by the math resources; sized and aged through the environment
+_cache = LRUCache(
+    max_entries=int(os.environ.get("MATH_CACHE_MAX_ENTRIES", "4096")),
+    ttl=float(os.environ.get("MATH_CACHE_TTL", "0")) or None,
+)
+
+
+def _cache_entry(op: str, a: float, b: float) -> dict:
+    """
+    Look up the cache entry for a commutative operation.
+    Both argument orders share one entry keyed on the canonical (sorted) operands.
+    float.hex() keeps -0.0 and 0.0 apart, which matters for multiplication.
+    """
+    key = (op,) + tuple(sorted((a.hex(), b.hex())))
+    return _cache.get_or_create(
+        key, lambda: {"result": a + b if op == "add" else a * b, "texts": {}, "json": None}
+    )
+
+
+def _cached_result(op: str, a: float, b: float, symbol: str, label: str) -> str:
+    """
+    Formatted result; the entry keeps one rendered text per operand order that was requested.
+    """
+    entry = _cache_entry(op, a, b)
+    ordered = (a.hex(), b.hex())
+    text = entry["texts"].get(ordered)
+    if text is None:
+        text = entry["texts"][ordered] = f"{label}: {a} {symbol} {b} = {entry['result']}"
+    return text
+
+
+def _cached_json(op: str, a: float, b: float, operation: str) -> str:
+    """
+    Machine-readable result, rendered once per cache entry.
+    Infinity and NaN are not valid JSON, so a non-finite result becomes
+    "result": null with an "error" explaining why.
+    """
+    entry = _cache_entry(op, a, b)
+    if entry["json"] is None:
+        payload = {"operation": operation, "operands": 2, "result": entry["result"], "dtype": "float64"}
+        if not math.isfinite(entry["result"]):
+            payload.update(result=None, error=f"Result is not a finite number: {entry['result']}")
+        entry["json"] = json.dumps(payload, allow_nan=False)
+    return entry["json"]
 
 
 @mcp.resource("resource://addition/{a}/{b}")
@@ -10,8 +64,7 @@ def addition(a: float, b: float) -> str:
     Dynamic addition resource
     Example: resource://addition/10/20
     """
-    result = a + b
-    return f"Addition result: {a} + {b} = {result}"
+    return _cached_result("add", a, b, "+", "Addition result")
 
 
 @mcp.resource("resource://multiplication/{a}/{b}")
@@ -20,8 +73,33 @@ def multiplication(a: float, b: float) -> str:
     Dynamic multiplication resource
     Example: resource://multiplication/5/8
     """
-    result = a * b
-    return f"Multiplication result: {a} × {b} = {result}"
+    return _cached_result("multiply", a, b, "×", "Multiplication result")
+
+
+@mcp.resource("resource://addition/json/{a}/{b}", mime_type="application/json")
+def addition_json(a: float, b: float) -> str:
+    """
+    Addition result as JSON
+    Example: resource://addition/json/10/20 -> {"operation": "addition", "operands": 2, "result": 30.0, ...}
+    """
+    return _cached_json("add", a, b, "addition")
+
+
+@mcp.resource("resource://multiplication/json/{a}/{b}", mime_type="application/json")
+def multiplication_json(a: float, b: float) -> str:
+    """
+    Multiplication result as JSON
+    Example: resource://multiplication/json/5/8 -> {"operation": "multiplication", "operands": 2, "result": 40.0, ...}
+    """
+    return _cached_json("multiply", a, b, "multiplication")
+
+
+@mcp.resource("resource://cache/stats", mime_type="application/json")
+def cache_stats() -> str:
+    """
+    Result cache counters (hits, misses, evictions, expirations, hit rate)
+    """
+    return json.dumps(_cache.stats())
 
 
 if __name__ == "__main__":
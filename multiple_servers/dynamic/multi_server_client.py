@@ -0,0 +1,259 @@
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Set, TextIO
+
+import anyio
+import anyio.abc
+import mcp.types as types
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from capability_cache import CapabilityCache, discover, refresh_listings, server_identity
+from resource_cache import ResourceCache, cache_hint
+from uri_router import UriRouter
+
+logger = logging.getLogger(__name__)
+
+
+class _ServerConnection:
+    """
+    Owns one stdio server and its initialized session. stdio_client and
+    ClientSession hold task groups, so they are entered and exited inside
+    run(), which stays alive until close() is called.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        server_params: StdioServerParameters,
+        errlog: TextIO,
+        cache: Optional[CapabilityCache] = None,
+        resource_cache: Optional[ResourceCache] = None,
+    ):
+        self.name = name
+        self.server_params = server_params
+        self.errlog = errlog
+        self.cache = cache
+        self.resource_cache = resource_cache
+        self.identity = server_identity(server_params)
+        self.session: Optional[ClientSession] = None
+        self.initialize = None
+        self.listings: Dict[str, List[Any]] = {}
+        # Listings a list_changed notification has made stale; refreshed before the next call
+        self.stale: Set[str] = set()
+        self._relisting = anyio.Lock()
+        self._relisted = 0
+        self._stop = anyio.Event()
+
+    @property
+    def resources(self) -> List[Any]:
+        return self.listings.get("resources", [])
+
+    @property
+    def templates(self) -> List[Any]:
+        return self.listings.get("resourceTemplates", [])
+
+    @property
+    def tools(self) -> List[Any]:
+        return self.listings.get("tools", [])
+
+    async def run(self, *, task_status: anyio.abc.TaskStatus = anyio.TASK_STATUS_IGNORED) -> None:
+        # The handler only records what changed; listing from inside it would block the receive loop
+        cache = self.cache or CapabilityCache()
+        on_list_changed = cache.message_handler(self.identity, self.stale.update)
+
+        async def message_handler(message) -> None:
+            if self.resource_cache is not None and isinstance(message, types.ServerNotification):
+                if isinstance(message.root, types.ResourceUpdatedNotification):
+                    self.resource_cache.invalidate(str(message.root.params.uri), self.identity)
+            await on_list_changed(message)
+
+        async with stdio_client(self.server_params, errlog=self.errlog) as (read, write):
+            async with ClientSession(read, write, message_handler=message_handler) as session:
+                self.initialize, self.listings = await discover(session, self.identity, self.cache)
+                self.session = session
+                task_status.started()
+                await self._stop.wait()
+
+    async def refresh(self) -> None:
+        """Re-list whatever list_changed notifications have made stale."""
+        stale, self.stale = set(self.stale), set()
+        self.listings.update(await refresh_listings(self.session, self.identity, self.initialize, self.cache, stale))
+
+    async def relist_resources(self) -> None:
+        """
+        List resources again, bypassing the capability cache, to learn their
+        current versions. Callers that wait while another one lists reuse its result.
+        """
+        relisted = self._relisted
+        async with self._relisting:
+            if self._relisted != relisted:
+                return
+            listings = await refresh_listings(self.session, self.identity, self.initialize, None, ["resources"])
+            self.listings.update(listings)
+            if self.cache is not None:
+                self.cache.put(self.identity, self.initialize, listings)
+            self._relisted += 1
+
+    def close(self) -> None:
+        self._stop.set()
+
+
+class MultiServerClient:
+    """
+    Holds one session per configured server and routes every read_resource and
+    call_tool to the server that advertised it. The routing index is built once
+    from list_resources, list_resource_templates and list_tools after connecting:
+    static URIs and tool names are dict lookups, templates go through a UriRouter.
+    When two servers advertise the same URI or tool, the one configured first wins.
+
+    With a CapabilityCache, listings of servers seen before are taken from the
+    cache instead of being listed again. Servers that send a list_changed
+    notification are re-listed, and the index rebuilt, before the next call.
+
+    With a ResourceCache, resources the server marks as cacheable are read once
+    and then served locally; the version the server lists for each resource
+    decides whether a cached result is still current. When an entry expires the
+    server's resources are listed once more, and the entry is kept if its
+    version is unchanged.
+
+    All calls share a semaphore, so independent requests can be fanned out with
+    asyncio.gather without exceeding max_concurrency in-flight requests:
+
+        async with MultiServerClient({"greeting": greeting, "math": math}) as client:
+            greet, total = await asyncio.gather(
+                client.read_resource("resource://greet"),
+                client.read_resource("resource://addition/15/27"),
+            )
+    """
+
+    def __init__(
+        self,
+        servers: Dict[str, StdioServerParameters],
+        max_concurrency: int = 16,
+        errlog: Optional[TextIO] = None,
+        capability_cache: Optional[CapabilityCache] = None,
+        resource_cache: Optional[ResourceCache] = None,
+    ):
+        self.servers = servers
+        self.capability_cache = capability_cache
+        self.resource_cache = resource_cache
+        self.max_concurrency = max_concurrency
+        self._errlog = errlog
+        self._connections: Dict[str, _ServerConnection] = {}
+        self._resources: Dict[str, str] = {}
+        # uri -> version the owning server lists for it
+        self._versions: Dict[str, str] = {}
+        self._templates = UriRouter()
+        self._template_owners: Dict[str, str] = {}
+        self._tools: Dict[str, str] = {}
+        self._limit = anyio.Semaphore(max_concurrency)
+        self._refreshing = anyio.Lock()
+        self._task_group: Optional[anyio.abc.TaskGroup] = None
+
+    async def __aenter__(self) -> "MultiServerClient":
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._connections = {
+            name: _ServerConnection(
+                name, params, self._errlog or sys.stderr, self.capability_cache, self.resource_cache
+            )
+            for name, params in self.servers.items()
+        }
+        try:
+            # Servers start and initialize concurrently
+            async with anyio.create_task_group() as starting:
+                for connection in self._connections.values():
+                    starting.start_soon(self._task_group.start, connection.run)
+        except BaseException:
+            await self.__aexit__(*sys.exc_info())
+            raise
+        self._reindex()
+        return self
+
+    async def __aexit__(self, *exc_info) -> Optional[bool]:
+        for connection in self._connections.values():
+            connection.close()
+        try:
+            return await self._task_group.__aexit__(*exc_info)
+        finally:
+            self._task_group = None
+
+    def _reindex(self) -> None:
+        self._resources.clear()
+        self._versions.clear()
+        self._templates = UriRouter()
+        self._template_owners.clear()
+        self._tools.clear()
+        for connection in self._connections.values():
+            self._index(connection)
+
+    async def _refresh_stale(self) -> None:
+        if not any(connection.stale for connection in self._connections.values()):
+            return
+        async with self._refreshing:
+            stale = [connection for connection in self._connections.values() if connection.stale]
+            for connection in stale:
+                await connection.refresh()
+            if stale:
+                self._reindex()
+
+    def _index(self, connection: _ServerConnection) -> None:
+        for resource in connection.resources:
+            if self._resources.setdefault(str(resource.uri), connection.name) == connection.name:
+                version = cache_hint(resource.meta).get("version")
+                if version is not None:
+                    self._versions[str(resource.uri)] = version
+        for template in connection.templates:
+            if self._template_owners.setdefault(template.uriTemplate, connection.name) == connection.name:
+                self._templates.add(template.uriTemplate, connection.name)
+        for tool in connection.tools:
+            if self._tools.setdefault(tool.name, connection.name) != connection.name:
+                logger.warning("Tool %r is advertised by several servers; using %r", tool.name, self._tools[tool.name])
+
+    def route_resource(self, uri: str) -> str:
+        """Return the name of the server that serves the URI."""
+        uri = str(uri)
+        name = self._resources.get(uri)
+        if name is None:
+            matched = self._templates.match(uri)
+            if matched is None:
+                raise ValueError(f"Unknown resource: {uri}")
+            name = matched[0]
+        return name
+
+    def route_tool(self, tool: str) -> str:
+        """Return the name of the server that provides the tool."""
+        name = self._tools.get(tool)
+        if name is None:
+            raise ValueError(f"Unknown tool: {tool}")
+        return name
+
+    def session(self, server: str) -> ClientSession:
+        return self._connections[server].session
+
+    async def read_resource(self, uri: str):
+        await self._refresh_stale()
+        connection = self._connections[self.route_resource(uri)]
+
+        async def fetch():
+            async with self._limit:
+                return await connection.session.read_resource(uri)
+
+        async def revalidate():
+            async with self._limit:
+                await connection.relist_resources()
+            self._reindex()
+            return self._versions.get(str(uri))
+
+        if self.resource_cache is None:
+            return await fetch()
+        return await self.resource_cache.read(
+            uri, fetch, self._versions.get(str(uri)), revalidate, namespace=connection.identity
+        )
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None):
+        await self._refresh_stale()
+        session = self.session(self.route_tool(name))
+        async with self._limit:
+            return await session.call_tool(name, arguments)
@@ -1,8 +1,17 @@
 import asyncio
+import json
 import pytest
+import mcp.types as types
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from capability_cache import CapabilityCache, discover, refresh_listings
+from resource_cache import ResourceCache
+from multi_server_client import MultiServerClient
+
 
 # ==================== GREETING SERVER TESTS ====================
 
@@ -327,5 +336,280 @@ async def test_all_resources_available():
             print("✓ Both addition and multiplication resources available")
 
 
+@pytest.mark.asyncio
+async def test_result_cache_stats():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env={"MATH_CACHE_MAX_ENTRIES": "2"}
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            # 15/27 and 27/15 share one entry but keep their own operand order
+            first = await session.read_resource("resource://addition/15/27")
+            swapped = await session.read_resource("resource://addition/27/15")
+            assert first.contents[0].text == "Addition result: 15.0 + 27.0 = 42.0"
+            assert swapped.contents[0].text == "Addition result: 27.0 + 15.0 = 42.0"
+            
+            # Two more entries push the addition entry out of the 2-entry cache
+            await session.read_resource("resource://multiplication/8/12")
+            await session.read_resource("resource://multiplication/7/9")
+            
+            response = await session.read_resource("resource://cache/stats")
+            stats = json.loads(response.contents[0].text)
+            assert stats["hits"] == 1
+            assert stats["misses"] == 3
+            assert stats["evictions"] == 1
+            assert stats["entries"] == 2
+            print(f"✓ Result cache stats: {stats}")
+
+
+@pytest.mark.asyncio
+async def test_routed_resource_lookup():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            add_result = await session.read_resource("resource://addition/5/3")
+            mult_result = await session.read_resource("resource://multiplication/5/3")
+            assert "8" in add_result.contents[0].text
+            assert "15" in mult_result.contents[0].text
+            
+            # Extra or empty segments do not match any template
+            for uri in ["resource://addition/1/2/3", "resource://addition//2", "resource://subtraction/1/2"]:
+                with pytest.raises(Exception):
+                    await session.read_resource(uri)
+            print("✓ Router resolves templates and rejects non-matching URIs")
+
+
+@pytest.mark.asyncio
+async def test_json_resources():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            response = await session.read_resource("resource://addition/json/15/27")
+            assert response.contents[0].mimeType == "application/json"
+            payload = json.loads(response.contents[0].text)
+            assert payload == {"operation": "addition", "operands": 2, "result": 42.0, "dtype": "float64"}
+            
+            response = await session.read_resource("resource://multiplication/json/-3/-4")
+            assert json.loads(response.contents[0].text)["result"] == 12.0
+            
+            # Non-finite results stay strict JSON
+            for uri in ("resource://multiplication/json/1e308/10", "resource://addition/json/nan/1"):
+                response = await session.read_resource(uri)
+                strict = json.loads(response.contents[0].text, parse_constant=pytest.fail)
+                assert strict["result"] is None and "not a finite number" in strict["error"]
+            
+            # The text form is still served from the original URI
+            text = await session.read_resource("resource://addition/15/27")
+            assert text.contents[0].text == "Addition result: 15.0 + 27.0 = 42.0"
+            print(f"✓ JSON resource test passed: {payload}")
+
+
+@pytest.mark.asyncio
+async def test_multi_server_client_routing():
+    servers = {
+        "greeting": StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None),
+        "math": StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None),
+    }
+    
+    async with MultiServerClient(servers, max_concurrency=4) as client:
+        # Static URIs and templates are routed from the advertised index
+        assert client.route_resource("resource://greet") == "greeting"
+        assert client.route_resource("resource://addition/15/27") == "math"
+        assert client.route_resource("resource://multiplication/json/8/12") == "math"
+        with pytest.raises(ValueError):
+            client.route_resource("resource://invalid")
+        
+        # Independent requests to both servers run concurrently
+        greet, farewell, addition, multiplication = await asyncio.gather(
+            client.read_resource("resource://greet"),
+            client.read_resource("resource://farewell"),
+            client.read_resource("resource://addition/15/27"),
+            client.read_resource("resource://multiplication/8/12"),
+        )
+        assert greet.contents[0].text == "Hello! Welcome to the Greeting Server."
+        assert farewell.contents[0].text == "Goodbye! Thank you for using the Greeting Server."
+        assert addition.contents[0].text == "Addition result: 15.0 + 27.0 = 42.0"
+        assert multiplication.contents[0].text == "Multiplication result: 8.0 × 12.0 = 96.0"
+        
+        # More requests than the concurrency limit still all complete
+        results = await asyncio.gather(*(client.read_resource(f"resource://addition/{i}/1") for i in range(20)))
+        assert [r.contents[0].text for r in results] == [
+            f"Addition result: {float(i)} + 1.0 = {float(i + 1)}" for i in range(20)
+        ]
+    print("✓ Multi-server client routed and fanned out requests")
+
+
+@pytest.mark.asyncio
+async def test_capability_cache_skips_discovery(tmp_path):
+    servers = {
+        "greeting": StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None),
+        "math": StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None),
+    }
+    path = str(tmp_path / "capabilities.json")
+    
+    # The first client lists everything and fills the cache
+    cache = CapabilityCache(path)
+    async with MultiServerClient(servers, capability_cache=cache) as client:
+        first = await client.read_resource("resource://addition/15/27")
+    assert cache.stats()["hits"] == 0 and cache.stats()["servers"] == 2
+    
+    # A later client, even in another process, routes from the stored listings
+    cache = CapabilityCache(path)
+    async with MultiServerClient(servers, capability_cache=cache) as client:
+        assert client.route_resource("resource://greet") == "greeting"
+        assert client.route_resource("resource://multiplication/json/8/12") == "math"
+        second = await client.read_resource("resource://addition/15/27")
+    assert second.contents[0].text == first.contents[0].text
+    stats = cache.stats()
+    assert stats["misses"] == 0 and stats["hits"] > 0
+    print(f"✓ Capability cache reused discovery: {stats}")
+
+
+@pytest.mark.asyncio
+async def test_capability_cache_list_changed():
+    server = FastMCP("plugin-server")
+    
+    @server.tool()
+    async def load_plugin(ctx: Context) -> str:
+        server.add_tool(lambda: "pong", name="ping")
+        await ctx.session.send_tool_list_changed()
+        return "loaded"
+    
+    cache, stale = CapabilityCache(), set()
+    handler = cache.message_handler("plugin-server", stale.update)
+    async with create_connected_server_and_client_session(server, message_handler=handler) as session:
+        initialize, listings = await discover(session, "plugin-server", cache)
+        assert [tool.name for tool in listings["tools"]] == ["load_plugin"]
+        
+        # The notification drops the cached tools; only that listing is fetched again
+        await session.call_tool("load_plugin", {})
+        assert stale == {"tools"}
+        assert cache.stats()["invalidations"] == 1
+        refreshed = await refresh_listings(session, "plugin-server", initialize, cache, stale)
+        assert [tool.name for tool in refreshed["tools"]] == ["load_plugin", "ping"]
+        assert [tool.name for tool in cache.get("plugin-server", initialize, "tools")] == ["load_plugin", "ping"]
+    print("✓ list_changed invalidated cached tools")
+
+
+@pytest.mark.asyncio
+async def test_resource_cache(tmp_path):
+    servers = {
+        "greeting": StdioServerParameters(command="python", args=["greeting_mcp_server.py"], env=None),
+        "math": StdioServerParameters(command="python", args=["math_server_dynamic.py"], env=None),
+    }
+    path = str(tmp_path / "resources")
+    
+    # greet is marked immutable by the server; addition is only cached through an override
+    cache = ResourceCache(path=path, ttl_overrides={"resource://addition/15/27": 60})
+    async with MultiServerClient(servers, resource_cache=cache) as client:
+        for _ in range(3):
+            greet = await client.read_resource("resource://greet")
+            addition = await client.read_resource("resource://addition/15/27")
+            await client.read_resource("resource://multiplication/8/12")
+    assert greet.contents[0].text == "Hello! Welcome to the Greeting Server."
+    assert addition.contents[0].text == "Addition result: 15.0 + 27.0 = 42.0"
+    stats = cache.stats()
+    assert stats["hits"] == 4 and stats["misses"] == 5 and stats["entries"] == 2
+    
+    # A new process starts from the disk tier, checked against the listed version
+    cache = ResourceCache(path=path)
+    async with MultiServerClient(servers, resource_cache=cache) as client:
+        greet = await client.read_resource("resource://greet")
+    assert greet.contents[0].text == "Hello! Welcome to the Greeting Server."
+    assert cache.stats()["disk_hits"] == 1 and cache.stats()["misses"] == 0
+    print(f"✓ Resource cache served repeated reads: {stats}")
+
+
+@pytest.mark.asyncio
+async def test_resource_cache_revalidation(tmp_path):
+    versions = {"resource://page": "v1"}
+    reads = []
+    listings = []
+    
+    async def fetch():
+        reads.append(versions["resource://page"])
+        await asyncio.sleep(0.01)
+        return types.ReadResourceResult(contents=[types.TextResourceContents(
+            uri="resource://page",
+            text=f"page {versions['resource://page']}",
+            _meta={"cache": {"maxAge": 60, "version": versions["resource://page"]}},
+        )])
+    
+    async def revalidate():
+        listings.append(versions["resource://page"])
+        return versions["resource://page"]
+    
+    cache = ResourceCache(max_entries=1)
+    await cache.read("resource://page", fetch, "v1", revalidate)
+    await cache.read("resource://page", fetch, "v1", revalidate)
+    assert reads == ["v1"] and listings == []
+    
+    # An expired entry whose listed version is unchanged is kept without a read
+    cache._entries[("", "resource://page")]["expires_at"] = 0
+    result = await cache.read("resource://page", fetch, "v1", revalidate)
+    assert result.contents[0].text == "page v1" and reads == ["v1"] and listings == ["v1"]
+    assert cache.stats()["revalidations"] == 1 and cache.stats()["hits"] == 1
+    
+    # The fresh listing wins over an out-of-date version snapshot
+    versions["resource://page"] = "v2"
+    cache._entries[("", "resource://page")]["expires_at"] = 0
+    result = await cache.read("resource://page", fetch, "v1", revalidate)
+    assert result.contents[0].text == "page v2" and reads == ["v1", "v2"]
+    assert cache.stats()["revalidations"] == 1
+    
+    # Without revalidate an expired entry is read again
+    cache._entries[("", "resource://page")]["expires_at"] = 0
+    await cache.read("resource://page", fetch, "v2")
+    assert reads == ["v1", "v2", "v2"]
+    
+    # A new listed version replaces the entry even while it is fresh
+    versions["resource://page"] = "v3"
+    result = await cache.read("resource://page", fetch, "v3", revalidate)
+    assert result.contents[0].text == "page v3" and reads == ["v1", "v2", "v2", "v3"]
+    assert listings == ["v1", "v2"]
+    
+    # Concurrent misses share one read
+    cache = ResourceCache()
+    await asyncio.gather(*(cache.read("resource://page", fetch, "v3") for _ in range(5)))
+    assert reads == ["v1", "v2", "v2", "v3", "v3"] and cache.stats()["hits"] == 4
+    
+    # The same URI from two servers gets two entries, on disk as well
+    cache = ResourceCache(path=str(tmp_path))
+    await cache.read("resource://page", fetch, namespace="server-a")
+    versions["resource://page"] = "v4"
+    result = await cache.read("resource://page", fetch, namespace="server-b")
+    assert result.contents[0].text == "page v4" and len(list(tmp_path.iterdir())) == 2
+    cache = ResourceCache(path=str(tmp_path))
+    result = await cache.read("resource://page", fetch, namespace="server-a")
+    assert result.contents[0].text == "page v3" and cache.stats()["disk_hits"] == 1
+    
+    # Resources without a hint, or overridden to 0, are never cached
+    reads.clear()
+    cache = ResourceCache(ttl_overrides={"resource://page": 0})
+    await cache.read("resource://page", fetch)
+    await cache.read("resource://page", fetch)
+    assert reads == ["v4", "v4"]
+    print("✓ Resource cache revalidated against listed versions")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
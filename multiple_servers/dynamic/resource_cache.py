@@ -0,0 +1,239 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import anyio
+import mcp.types as types
+
+logger = logging.getLogger(__name__)
+
+
+def cache_hint(meta: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    The caching hint a server attached to a resource, from the "cache" key of
+    its _meta (in resources/list and in read results):
+
+        {"cache": {"immutable": true, "version": "3f2a..."}}
+        {"cache": {"maxAge": 60, "version": "3f2a..."}}
+
+    immutable: the content never changes for this version; maxAge: seconds the
+    content may be reused; version: changes whenever the content does. Servers
+    that change a version send resources/list_changed so clients see it.
+    """
+    return (meta or {}).get("cache") or {}
+
+
+def _result_hint(result: types.ReadResourceResult) -> Dict[str, Any]:
+    for contents in result.contents:
+        hint = cache_hint(contents.meta)
+        if hint:
+            return hint
+    return cache_hint(result.meta)
+
+
+class ResourceCache:
+    """
+    Client-side cache of read_resource results for resources a server marks as
+    cacheable (see cache_hint). A bounded in-memory LRU sits in front of an
+    optional directory with one JSON file per URI, so later processes start warm.
+    Entries are keyed by namespace and URI; the namespace identifies the server
+    (see server_identity), so two servers never share an entry for one URI.
+
+    An entry is reused while it is fresh. When the caller knows the server's
+    current version of the resource (from resources/list) an entry with a
+    different version is never used. An expired entry is kept when revalidate()
+    reports that the server still lists the same version; otherwise, or without
+    revalidate, it is read again. Concurrent misses for one key share one read.
+
+    ttl_overrides sets the lifetime of specific URIs regardless of the server's
+    hint: seconds, None to keep the entry until its version changes, or 0 to
+    never cache it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        ttl_overrides: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.path = path
+        self.ttl_overrides = dict(ttl_overrides or {})
+        # (namespace, uri) -> {"version": str | None, "expires_at": wall time | None, "lifetime": seconds, "result": result}
+        # Wall-clock times, since disk entries outlive the process
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # One lock per key with a read in progress; dropped once nobody holds it
+        self._flights: "weakref.WeakValueDictionary[Tuple[str, str], anyio.Lock]" = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.expirations = 0
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def _lifetime(self, uri: str, hint: Dict[str, Any]) -> Optional[float]:
+        """Seconds a result stays fresh, math.inf for no limit, None when it must not be cached."""
+        if uri in self.ttl_overrides:
+            ttl = self.ttl_overrides[uri]
+            if ttl is None:
+                return math.inf
+            return ttl if ttl > 0 else None
+        if hint.get("immutable"):
+            return math.inf
+        max_age = hint.get("maxAge")
+        return float(max_age) if max_age else None
+
+    async def read(
+        self,
+        uri: str,
+        fetch: Callable[[], Awaitable[types.ReadResourceResult]],
+        version: Optional[str] = None,
+        revalidate: Optional[Callable[[], Awaitable[Optional[str]]]] = None,
+        namespace: str = "",
+    ) -> types.ReadResourceResult:
+        """
+        Return the cached result for uri, or await fetch() and cache what it
+        returns. version is the server's current version of the resource, if
+        known; revalidate() returns the version the server lists now, and is
+        only awaited for an expired entry.
+        """
+        key = (namespace, str(uri))
+        entry = self._lookup(key)
+        if entry is not None and self._matches(entry, version) and self._fresh(entry):
+            self.hits += 1
+            return entry["result"]
+
+        lock = self._flights.get(key)
+        if lock is None:
+            lock = self._flights[key] = anyio.Lock()
+        async with lock:
+            # A concurrent read of the same key may have stored it meanwhile
+            entry = self._lookup(key)
+            if entry is not None and self._matches(entry, version):
+                if self._fresh(entry):
+                    self.hits += 1
+                    return entry["result"]
+                self.expirations += 1
+                if revalidate is not None and entry["version"] is not None and await revalidate() == entry["version"]:
+                    self.revalidations += 1
+                    self._store(key, entry["result"], entry["version"], entry["lifetime"])
+                    return entry["result"]
+            if entry is not None:
+                self.invalidate(key[1], namespace)
+
+            self.misses += 1
+            result = await fetch()
+            hint = _result_hint(result)
+            lifetime = self._lifetime(key[1], hint)
+            if lifetime is not None:
+                self._store(key, result, hint.get("version", version), lifetime)
+            return result
+
+    def invalidate(self, uri: str, namespace: str = "") -> None:
+        key = (namespace, str(uri))
+        self._entries.pop(key, None)
+        if self.path is not None:
+            try:
+                os.remove(self._file(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.path is not None:
+            for name in os.listdir(self.path):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.path, name))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    @staticmethod
+    def _matches(entry: Dict[str, Any], version: Optional[str]) -> bool:
+        return version is None or entry["version"] == version
+
+    @staticmethod
+    def _fresh(entry: Dict[str, Any]) -> bool:
+        return entry["expires_at"] is None or entry["expires_at"] > time.time()
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.path is None:
+            return None
+        try:
+            with open(self._file(key), encoding="utf-8") as file:
+                stored = json.load(file)
+            if [stored["namespace"], stored["uri"]] != list(key):
+                return None
+            entry = {
+                "version": stored["version"],
+                "expires_at": stored["expires_at"],
+                "lifetime": math.inf if stored["lifetime"] is None else stored["lifetime"],
+                "result": types.ReadResourceResult.model_validate(stored["result"]),
+            }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as exc:
+            # A damaged file only costs a read
+            logger.warning("Ignoring unreadable cache entry for %s: %s", key[1], exc)
+            return None
+        self.disk_hits += 1
+        self._remember(key, entry)
+        return entry
+
+    def _store(self, key: Tuple[str, str], result: types.ReadResourceResult, version: Optional[str], lifetime: float) -> None:
+        expires_at = None if lifetime == math.inf else time.time() + lifetime
+        entry = {"version": version, "expires_at": expires_at, "lifetime": lifetime, "result": result}
+        self._remember(key, entry)
+        if self.path is None:
+            return
+        stored = {
+            "namespace": key[0],
+            "uri": key[1],
+            "version": version,
+            "expires_at": expires_at,
+            "lifetime": None if lifetime == math.inf else lifetime,
+            "result": result.model_dump(mode="json", by_alias=True, exclude_none=True),
+        }
+        # Write to a temporary file and rename, so a reader never sees half a file
+        fd, temporary = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        os.replace(temporary, self._file(key))
+
+    def _remember(self, key: Tuple[str, str], entry: Dict[str, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            # Evicted entries stay in the disk tier
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _file(self, key: Tuple[str, str]) -> str:
+        digest = hashlib.sha256("\0".join(key).encode()).hexdigest()[:32]
+        return os.path.join(self.path, digest + ".json")
@@ -0,0 +1,140 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import ResourceManager
+
+_PARAM_SEGMENT = re.compile(r"\{(\w+)\}")
+
+
+class _Node:
+    __slots__ = ("literals", "param", "leaf")
+
+    def __init__(self):
+        self.literals: Dict[str, "_Node"] = {}
+        self.param: Optional["_Node"] = None
+        # (registration order, parameter names, target) for a template ending here
+        self.leaf: Optional[Tuple[int, Tuple[str, ...], Any]] = None
+
+
+class UriRouter:
+    """
+    Matches URIs against URI templates with a trie keyed on the literal path
+    segments. A "{name}" segment is a parameter edge that captures one non-empty
+    segment, exactly like FastMCP's "[^/]+" pattern; the captured values are
+    paired with the parameter names stored at the leaf.
+
+    Templates that mix literals and parameters inside one segment (e.g. "{a}-{b}")
+    cannot be expressed as trie edges and are matched by regex as a fallback.
+    When several templates match, the one registered first wins, as in FastMCP.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._fallback: List[Tuple[int, "re.Pattern[str]", Any]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, uri_template: str, target: Any) -> None:
+        order = self._count
+        self._count += 1
+        node = self._root
+        names = []
+        for segment in uri_template.split("/"):
+            if "{" not in segment:
+                node = node.literals.setdefault(segment, _Node())
+                continue
+            param = _PARAM_SEGMENT.fullmatch(segment)
+            if param is None:
+                pattern = re.escape(uri_template).replace(r"\{", "{").replace(r"\}", "}")
+                pattern = _PARAM_SEGMENT.sub(r"(?P<\1>[^/]+)", pattern)
+                self._fallback.append((order, re.compile(pattern), target))
+                return
+            names.append(param.group(1))
+            if node.param is None:
+                node.param = _Node()
+            node = node.param
+        # Re-registering a template keeps the original position, like a dict update
+        if node.leaf is not None:
+            order = node.leaf[0]
+        node.leaf = (order, tuple(names), target)
+
+    def match(self, uri: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Return (target, params) for the first-registered matching template, or None."""
+        segments = uri.split("/")
+        captured: List[str] = []
+        best: Optional[Tuple[int, Any, Dict[str, str]]] = None
+
+        def walk(node: _Node, depth: int) -> None:
+            nonlocal best
+            if depth == len(segments):
+                leaf = node.leaf
+                if leaf is not None and (best is None or leaf[0] < best[0]):
+                    best = (leaf[0], leaf[2], dict(zip(leaf[1], captured)))
+                return
+            segment = segments[depth]
+            child = node.literals.get(segment)
+            if child is not None:
+                walk(child, depth + 1)
+            if node.param is not None and segment:
+                captured.append(segment)
+                walk(node.param, depth + 1)
+                captured.pop()
+
+        walk(self._root, 0)
+
+        for order, pattern, target in self._fallback:
+            if best is not None and order > best[0]:
+                break
+            found = pattern.fullmatch(uri)
+            if found:
+                best = (order, target, found.groupdict())
+                break
+
+        if best is None:
+            return None
+        return best[1], best[2]
+
+
+class RoutedResourceManager(ResourceManager):
+    """ResourceManager that resolves templates through a UriRouter instead of a linear scan."""
+
+    def __init__(self, warn_on_duplicate_resources: bool = True):
+        super().__init__(warn_on_duplicate_resources=warn_on_duplicate_resources)
+        self.router = UriRouter()
+
+    def add_template(self, fn, uri_template: str, **kwargs):
+        template = super().add_template(fn, uri_template, **kwargs)
+        self.router.add(template.uri_template, template)
+        return template
+
+    async def get_resource(self, uri, context=None):
+        uri_str = str(uri)
+        if resource := self._resources.get(uri_str):
+            return resource
+
+        matched = self.router.match(uri_str)
+        if matched is None:
+            raise ValueError(f"Unknown resource: {uri}")
+        template, params = matched
+        try:
+            return await template.create_resource(uri_str, params, context=context)
+        except Exception as e:
+            raise ValueError(f"Error creating resource from template: {e}")
+
+
+def install_router(mcp: FastMCP) -> RoutedResourceManager:
+    """
+    Swap the server's resource manager for a RoutedResourceManager.
+    Call this right after creating the server; anything already registered is carried over.
+    """
+    old = mcp._resource_manager
+    manager = RoutedResourceManager(warn_on_duplicate_resources=old.warn_on_duplicate_resources)
+    manager._resources.update(old._resources)
+    for template in old.list_templates():
+        manager._templates[template.uri_template] = template
+        manager.router.add(template.uri_template, template)
+    mcp._resource_manager = manager
+    return manager
@@ -1,3 +1,6 @@
+import json
+import math
+
 from mcp.server.fastmcp import FastMCP
 
 # FastMCP server instance oluştur
@@ -24,6 +27,35 @@ def multiplication(a: float, b: float) -> str:
     return f"Multiplication result: {a} × {b} = {result}"
 
 
+def _as_json(operation: str, result: float) -> str:
+    """
+    Machine-readable result. Infinity and NaN are not valid JSON, so a
+    non-finite result becomes "result": null with an "error" explaining why.
+    """
+    payload = {"operation": operation, "operands": 2, "result": result, "dtype": "float64"}
+    if not math.isfinite(result):
+        payload.update(result=None, error=f"Result is not a finite number: {result}")
+    return json.dumps(payload, allow_nan=False)
+
+
+@mcp.resource("resource://addition/json/{a}/{b}", mime_type="application/json")
+def addition_json(a: float, b: float) -> str:
+    """
+    Addition result as JSON
+    Example: resource://addition/json/10/20 -> {"operation": "addition", "operands": 2, "result": 30.0, ...}
+    """
+    return _as_json("addition", a + b)
+
+
+@mcp.resource("resource://multiplication/json/{a}/{b}", mime_type="application/json")
+def multiplication_json(a: float, b: float) -> str:
+    """
+    Multiplication result as JSON
+    Example: resource://multiplication/json/5/8 -> {"operation": "multiplication", "operands": 2, "result": 40.0, ...}
+    """
+    return _as_json("multiplication", a * b)
+
+
 if __name__ == "__main__":
     # stdio transport ile server'ı başlat
     mcp.run(transport="stdio")
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import pytest
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
@@ -327,5 +328,28 @@ async def test_all_resources_available():
             print("✓ Both addition and multiplication resources available")
 
 
+@pytest.mark.asyncio
+async def test_json_resources():
+    server_params = StdioServerParameters(
+        command="python",
+        args=["math_server_dynamic.py"],
+        env=None
+    )
+    
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            response = await session.read_resource("resource://addition/json/15/27")
+            assert response.contents[0].mimeType == "application/json"
+            payload = json.loads(response.contents[0].text)
+            assert payload == {"operation": "addition", "operands": 2, "result": 42.0, "dtype": "float64"}
+            
+            # Non-finite results stay strict JSON
+            response = await session.read_resource("resource://multiplication/json/1e308/10")
+            strict = json.loads(response.contents[0].text, parse_constant=pytest.fail)
+            assert strict["result"] is None and "not a finite number" in strict["error"]
+            print(f"✓ JSON resource test passed: {payload}")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
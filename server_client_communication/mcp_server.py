@@ -1,12 +1,18 @@
+import hashlib
+
 from mcp.server.fastmcp import FastMCP
 
 # FastMCP server instance oluştur
 mcp = FastMCP("hello-world-server")
 
+INFO = "This is a static resource from my MCP server."
+# Sabit kaynak: istemciler süresiz önbelleğe alabilir, sürüm içeriğin özetidir
+INFO_CACHE = {"cache": {"immutable": True, "version": hashlib.sha256(INFO.encode()).hexdigest()[:16]}}
+
 
-@mcp.resource("resource://info")
+@mcp.resource("resource://info", meta=INFO_CACHE)
 def get_info() -> str:
-    return "This is a static resource from my MCP server."
+    return INFO
 
 
 @mcp.tool()